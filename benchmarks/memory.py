@@ -0,0 +1,79 @@
+import asyncio
+import json
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+from uuid import UUID
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.utils import build_state, build_template
+from mantis.config.models import StoreArchiveConfig, StoreDurability
+from mantis.services.scheduler.archive.segments import Segments
+from mantis.services.scheduler.backends import records as r
+
+SIZES = (1000, 10000, 50000)
+
+
+def measure(size: int, function: Callable[[], Any]) -> tuple[float, Any]:
+    """Measure memory allocated and retained by the function in bytes per task."""
+    tracemalloc.start()
+
+    try:
+        result = function()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return current / size, result
+
+
+async def main() -> None:
+    """Benchmark memory used by a task in the state and in the archive."""
+    table = Table(
+        "Tasks", "In state (B/task)", "In archive (B/task)", title="Memory per task"
+    )
+
+    with TemporaryDirectory() as directory:
+        template_id, template = await build_template(Path(directory))
+
+        for size in SIZES:
+            state = build_state(template_id, template, size)
+            data = json.dumps(state)
+
+            before, _ = measure(size, lambda data=data: json.loads(data))
+
+            config = StoreArchiveConfig()
+            path = Path(directory) / f"archive-{size}"
+
+            segments = Segments(
+                config=config, durability=StoreDurability.BATCHED, path=path
+            )
+            segments.open()
+            segments.add(r.split(state))
+            segments.flush()
+            segments.close()
+
+            def load(
+                config: StoreArchiveConfig = config, path: Path = path
+            ) -> Segments:
+                segments = Segments(
+                    config=config, durability=StoreDurability.BATCHED, path=path
+                )
+                segments.open()
+                segments.get(UUID(int=0))
+                return segments
+
+            after, segments = measure(size, load)
+            segments.close()
+
+            table.add_row(str(size), f"{before:.0f}", f"{after:.0f}")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
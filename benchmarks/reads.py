@@ -0,0 +1,86 @@
+import asyncio
+import random
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import override
+from uuid import UUID
+
+from pyscheduler.models.data import storage as s
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.utils import (
+    build_scheduler,
+    build_state,
+    build_store_config,
+    build_template,
+)
+from mantis.services.scheduler.backends import records as r
+from mantis.services.scheduler.backends.factory import BackendFactory
+from mantis.services.scheduler.store import Store
+
+SIZES = (100, 1000, 10000, 50000)
+
+REPEATS = 20
+
+SEED = 0
+
+
+class RereadingStore(Store):
+    """Store that reads the state from the file on every access."""
+
+    @override
+    async def get(self) -> s.State:
+        state = self._backend.load()
+        return self._state if state is None else state
+
+
+async def measure(store: Store, ids: list[UUID]) -> float:
+    """Measure mean latency of getting a task in milliseconds."""
+    scheduler = build_scheduler(store)
+
+    # Seeded, so that every store is measured on the same sample of tasks
+    generator = random.Random(SEED)  # noqa: S311
+
+    start = time.perf_counter()
+    for task_id in generator.choices(ids, k=REPEATS):
+        await scheduler.tasks.get(task_id)
+    end = time.perf_counter()
+
+    return (end - start) / REPEATS * 1000
+
+
+async def main() -> None:
+    """Benchmark latency of getting a task against the size of the state."""
+    table = Table("Tasks", "Before (ms)", "After (ms)", title="tasks.get latency")
+
+    with TemporaryDirectory() as directory:
+        template_id, template = await build_template(Path(directory))
+
+        for size in SIZES:
+            path = Path(directory) / f"state-{size}.json"
+            state = build_state(template_id, template, size)
+            ids = [UUID(task_id) for task_id in r.split(state)]
+
+            config = build_store_config(path)
+
+            backend = BackendFactory().create(config)
+            backend.open()
+            backend.save(state)
+            backend.sync()
+            backend.close()
+
+            async with RereadingStore(config) as store:
+                before = await measure(store, ids)
+
+            async with Store(config) as store:
+                after = await measure(store, ids)
+
+            table.add_row(str(size), f"{before:.3f}", f"{after:.3f}")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+import asyncio
+import itertools
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from pyscheduler.models.data import storage as s
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.utils import build_state, build_template
+from mantis.config.models import (
+    StoreSerializerCompression,
+    StoreSerializerConfig,
+    StoreSerializerFormat,
+)
+from mantis.services.scheduler.backends.serializer import Serializer
+
+SIZE = 50000
+
+REPEATS = 3
+
+
+def measure(serializer: Serializer, state: s.State) -> tuple[float, float, int]:
+    """Measure mean encode and decode time in milliseconds and size in bytes."""
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        data = serializer.serialize(state)
+    end = time.perf_counter()
+
+    encode = (end - start) / REPEATS * 1000
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        serializer.deserialize(data)
+    end = time.perf_counter()
+
+    decode = (end - start) / REPEATS * 1000
+
+    return encode, decode, len(data)
+
+
+async def main() -> None:
+    """Benchmark serialization formats on a large state."""
+    table = Table(
+        "Format",
+        "Compression",
+        "Encode (ms)",
+        "Decode (ms)",
+        "Size (MiB)",
+        title=f"Serialization of {SIZE} tasks",
+    )
+
+    with TemporaryDirectory() as directory:
+        template_id, template = await build_template(Path(directory))
+
+    state = build_state(template_id, template, SIZE)
+
+    for encoding, compression in itertools.product(
+        StoreSerializerFormat, StoreSerializerCompression
+    ):
+        config = StoreSerializerConfig(compression=compression, format=encoding)
+        encode, decode, size = measure(Serializer(config=config), state)
+
+        table.add_row(
+            encoding,
+            compression,
+            f"{encode:.1f}",
+            f"{decode:.1f}",
+            f"{size / 1024 / 1024:.2f}",
+        )
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,224 @@
+import asyncio
+import json
+import time
+from collections.abc import Sequence
+from collections.abc import Set as AbstractSet
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import override
+from uuid import UUID, uuid4
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.utils import build_scheduler, build_store_config, build_template
+from mantis.config.models import Config
+from mantis.services.beaver import models as bm
+from mantis.services.beaver.service import BeaverService
+from mantis.services.scheduler.backends import records as r
+from mantis.services.scheduler.models import transfer as t
+from mantis.services.scheduler.operations.operations.stream.models import Parameters
+from mantis.services.scheduler.store import Store
+from mantis.services.synchronizer.synchronizers.stream import StreamSynchronizer
+
+SIZES = (1000, 5000, 10000)
+
+# Number of instances of each event
+INSTANCES = 100
+
+
+class ScanningStreamSynchronizer(StreamSynchronizer):
+    """Synchronizer that scans all tasks and instances to reconcile them."""
+
+    @override
+    def _filter_schedules(
+        self, schedules: Sequence[bm.Schedule], start: datetime, end: datetime
+    ) -> Sequence[bm.Schedule]:
+        out: list[bm.Schedule] = []
+
+        for schedule in schedules:
+            instances: list[bm.EventInstance] = []
+
+            for instance in schedule.instances:
+                istart = (
+                    instance.start.replace(tzinfo=schedule.event.timezone)
+                    .astimezone(UTC)
+                    .replace(tzinfo=None)
+                )
+
+                if istart >= start and istart < end:
+                    instances = [*instances, instance]
+
+            if len(instances) > 0:
+                out = [*out, bm.Schedule(event=schedule.event, instances=instances)]
+
+        return out
+
+    @override
+    def _find_extra_tasks(
+        self,
+        schedules: Sequence[bm.Schedule],
+        tasks: Sequence[tuple[t.GenericTask, Parameters]],
+    ) -> AbstractSet[UUID]:
+        schedulemap = {schedule.event.id: schedule for schedule in schedules}
+        cancel = set[UUID]()
+
+        for task, params in tasks:
+            schedule = schedulemap.get(params.id)
+            if schedule is None:
+                cancel = cancel | {task.task.id}
+                continue
+
+            instance = next(
+                (
+                    instance
+                    for instance in schedule.instances
+                    if instance.start == params.start
+                ),
+                None,
+            )
+
+            if instance is None:
+                cancel = cancel | {task.task.id}
+                continue
+
+        return cancel
+
+    @override
+    def _find_new_tasks(
+        self,
+        schedules: Sequence[bm.Schedule],
+        tasks: Sequence[tuple[t.GenericTask, Parameters]],
+    ) -> Sequence[tuple[bm.Event, bm.EventInstance]]:
+        add: list[tuple[bm.Event, bm.EventInstance]] = []
+
+        for schedule in schedules:
+            filtered = [
+                (task, params)
+                for task, params in tasks
+                if params.id == schedule.event.id
+            ]
+
+            for instance in schedule.instances:
+                exists = any(params.start == instance.start for _, params in filtered)
+
+                if not exists:
+                    add = [*add, (schedule.event, instance)]
+
+        return add
+
+
+def build_schedules(size: int, start: datetime) -> Sequence[bm.Schedule]:
+    """Build schedules with the given number of instances in total."""
+    return [
+        bm.Schedule(
+            event=bm.Event(
+                id=uuid4(),
+                type=bm.EventType.replay,
+                show_id=uuid4(),
+                timezone="UTC",
+            ),
+            instances=[
+                bm.EventInstance(
+                    start=start + timedelta(minutes=index),
+                    end=start + timedelta(minutes=index + 1),
+                )
+                for index in range(INSTANCES)
+            ],
+        )
+        for _ in range(size // INSTANCES)
+    ]
+
+
+def build_tasks(
+    template_id: str, template: r.Record, schedules: Sequence[bm.Schedule]
+) -> Sequence[tuple[t.GenericTask, Parameters]]:
+    """Build tasks for every other instance and as many extra ones."""
+    text = json.dumps({"task": template["task"]["task"], "status": template["status"]})
+    tasks: list[tuple[t.GenericTask, Parameters]] = []
+
+    for schedule in schedules:
+        for index, instance in enumerate(schedule.instances):
+            start = instance.start
+
+            # Every other task doesn't match any instance and should be cancelled
+            if index % 2 == 1:
+                start = start + timedelta(seconds=1)
+
+            params = Parameters(id=schedule.event.id, start=start)
+            task = t.GenericTask.model_validate_json(
+                text.replace(template_id, str(uuid4()))
+            )
+
+            tasks.append((task, params))
+
+    return tasks
+
+
+async def measure(
+    synchronizer: StreamSynchronizer,
+    schedules: Sequence[bm.Schedule],
+    tasks: Sequence[tuple[t.GenericTask, Parameters]],
+    start: datetime,
+) -> tuple[float, int, int]:
+    """Measure time of a reconciliation in milliseconds and count its changes."""
+    begin = time.perf_counter()
+
+    filtered = synchronizer._filter_schedules(  # noqa: SLF001
+        schedules, start, start + timedelta(days=1)
+    )
+    cancel = synchronizer._find_extra_tasks(filtered, tasks)  # noqa: SLF001
+    add = synchronizer._find_new_tasks(filtered, tasks)  # noqa: SLF001
+
+    end = time.perf_counter()
+
+    return (end - begin) * 1000, len(cancel), len(add)
+
+
+async def main() -> None:
+    """Benchmark reconciliation of tasks with schedules against their number."""
+    table = Table(
+        "Instances x tasks",
+        "Before (ms)",
+        "After (ms)",
+        title="Reconciliation latency",
+    )
+
+    config = Config()
+    start = datetime(2000, 1, 1, 0, 0, 0, 0)
+
+    with TemporaryDirectory() as directory:
+        template_id, template = await build_template(Path(directory))
+
+        async with Store(build_store_config(Path(directory) / "state.json")) as store:
+            scheduler = build_scheduler(store)
+            beaver = BeaverService(config=config.beaver)
+
+            for size in SIZES:
+                schedules = build_schedules(size, start)
+                tasks = build_tasks(template_id, template, schedules)
+
+                results: list[tuple[float, int, int]] = []
+
+                for cls in (ScanningStreamSynchronizer, StreamSynchronizer):
+                    synchronizer = cls(
+                        config=config.synchronizer.synchronizers.stream,
+                        beaver=beaver,
+                        scheduler=scheduler,
+                    )
+
+                    results.append(await measure(synchronizer, schedules, tasks, start))
+
+                (before, *counts), (after, *expected) = results
+                if counts != expected:
+                    message = f"Mismatched results: {counts} != {expected}."
+                    raise RuntimeError(message)
+
+                table.add_row(f"{size} x {size}", f"{before:.1f}", f"{after:.1f}")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+import asyncio
+import json
+from pathlib import Path
+from uuid import uuid4
+
+from pyscheduler.models.data import storage as s
+
+from mantis.config.models import Config, StoreArchiveConfig, StoreConfig
+from mantis.services.beaver.service import BeaverService
+from mantis.services.gecko.service import GeckoService
+from mantis.services.numbat.service import NumbatService
+from mantis.services.octopus.service import OctopusService
+from mantis.services.scheduler.backends import records as r
+from mantis.services.scheduler.models import enums as e
+from mantis.services.scheduler.models import transfer as t
+from mantis.services.scheduler.service import SchedulerService
+from mantis.services.scheduler.store import Store
+
+
+def build_store_config(path: Path) -> StoreConfig:
+    """Build a store configuration that keeps all tasks in the state."""
+    return StoreConfig(
+        archive=StoreArchiveConfig(enabled=False, path=path.parent / "archive"),
+        path=path,
+    )
+
+
+def build_scheduler(store: Store) -> SchedulerService:
+    """Build a scheduler on top of the store."""
+    config = Config()
+
+    return SchedulerService(
+        config=config,
+        beaver=BeaverService(config=config.beaver),
+        gecko=GeckoService(config=config.gecko),
+        numbat=NumbatService(config=config.numbat),
+        octopus=OctopusService(config=config.octopus),
+        store=store,
+    )
+
+
+async def build_template(directory: Path) -> tuple[str, r.Record]:
+    """Run a test task to completion and return its stored record."""
+    config = build_store_config(directory / "template.json")
+
+    async with Store(config) as store:
+        scheduler = build_scheduler(store)
+
+        async with scheduler.run():
+            schedule_request = t.ScheduleRequest(
+                operation=t.Specification(type="test", parameters={}),
+                condition=t.Specification(type="now", parameters={}),
+                dependencies={},
+            )
+
+            task = await scheduler.schedule(schedule_request)
+            task_id = task.task.id
+
+            while True:
+                generic = await scheduler.tasks.get(task_id)
+                if generic is not None and generic.status == e.Status.COMPLETED:
+                    break
+
+                await asyncio.sleep(0.01)
+
+        state = await store.get()
+
+    return str(task_id), r.split(state)[str(task_id)]
+
+
+def build_state(template_id: str, template: r.Record, size: int) -> s.State:
+    """Build a state with copies of the template record."""
+    text = json.dumps(template)
+
+    records = {}
+    for _ in range(size):
+        task_id = str(uuid4())
+        records[task_id] = json.loads(text.replace(template_id, task_id))
+
+    return r.merge(records)
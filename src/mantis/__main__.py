@@ -1,27 +1,60 @@
+from datetime import timedelta
+from pathlib import Path
+from typing import Annotated
+
 import typer
+from pydantic import TypeAdapter, ValidationError
+from rich.table import Table
 
 from mantis.api.app import AppBuilder
 from mantis.cli import CliBuilder
 from mantis.config.builder import ConfigBuilder
 from mantis.config.errors import ConfigError
+from mantis.config.models import Config
 from mantis.console import FallbackConsoleBuilder
 from mantis.server import Server
+from mantis.services.scheduler.maintenance import StoreMaintenance
 
 cli = CliBuilder().build()
 
+store = CliBuilder().build()
 
-@cli.command()
-def main() -> None:
-    """Run main entry point."""
+cli.add_typer(
+    store, name="store", help="Maintain the store while the service is stopped."
+)
+
+
+def build_config() -> Config:
+    """Build config or exit if it fails."""
     console = FallbackConsoleBuilder().build()
 
     try:
-        config = ConfigBuilder().build()
+        return ConfigBuilder().build()
     except ConfigError as ex:
         console.print("Failed to build config!")
         console.print_exception()
         raise typer.Exit(1) from ex
 
+
+def parse_duration(value: str) -> timedelta:
+    """Parse duration in ISO 8601 format or in seconds."""
+    try:
+        return TypeAdapter(timedelta).validate_python(value)
+    except ValidationError as ex:
+        message = f"Invalid duration: {value}."
+        raise typer.BadParameter(message) from ex
+
+
+@cli.callback(invoke_without_command=True)
+def main(context: typer.Context) -> None:
+    """Run main entry point."""
+    if context.invoked_subcommand is not None:
+        return
+
+    console = FallbackConsoleBuilder().build()
+
+    config = build_config()
+
     try:
         app = AppBuilder(config).build()
     except Exception as ex:
@@ -38,5 +71,114 @@ def main() -> None:
         raise typer.Exit(3) from ex
 
 
+@store.command()
+def stats(
+    limit: Annotated[int, typer.Option(help="Number of largest tasks to show.")] = 10,
+) -> None:
+    """Show statistics of the stored state."""
+    console = FallbackConsoleBuilder().build()
+    maintenance = StoreMaintenance(build_config())
+
+    try:
+        result = maintenance.stats(limit)
+    except Exception as ex:
+        console.print("Failed to compute statistics!")
+        console.print_exception()
+        raise typer.Exit(2) from ex
+
+    statuses = Table("Status", "Tasks", title="Tasks by status")
+    for status, count in sorted(result.statuses.items()):
+        statuses.add_row(status, str(count))
+
+    operations = Table("Operation", "Tasks", title="Tasks by operation")
+    for operation, count in sorted(result.operations.items()):
+        operations.add_row(operation, str(count))
+
+    largest = Table("Task", "Status", "Archived", "Size (B)", title="Largest tasks")
+    for task in result.largest:
+        largest.add_row(str(task.id), task.status, str(task.archived), str(task.size))
+
+    console.print(statuses, operations, largest)
+    console.print(f"State size: {result.state} B")
+    console.print(f"Archive size: {result.archive} B")
+
+
+@store.command()
+def compact() -> None:
+    """Archive finished tasks and reclaim unused space."""
+    console = FallbackConsoleBuilder().build()
+    maintenance = StoreMaintenance(build_config())
+
+    try:
+        result = maintenance.compact()
+    except Exception as ex:
+        console.print("Failed to compact store!")
+        console.print_exception()
+        raise typer.Exit(2) from ex
+
+    console.print(f"Archived {result.archived} tasks.")
+    console.print(f"Reclaimed {result.reclaimed} B.")
+
+
+@store.command()
+def purge(
+    older_than: Annotated[
+        timedelta,
+        typer.Option(
+            parser=parse_duration,
+            help="Remove tasks finished longer ago than this (e.g. P30D).",
+        ),
+    ],
+) -> None:
+    """Remove finished tasks older than the given duration."""
+    console = FallbackConsoleBuilder().build()
+    maintenance = StoreMaintenance(build_config())
+
+    try:
+        removed = maintenance.purge(older_than)
+    except Exception as ex:
+        console.print("Failed to purge tasks!")
+        console.print_exception()
+        raise typer.Exit(2) from ex
+
+    console.print(f"Removed {len(removed)} tasks.")
+
+
+@store.command("export")
+def export_snapshot(
+    path: Annotated[Path, typer.Argument(help="Path to the output file.")],
+) -> None:
+    """Export all stored tasks as newline-delimited JSON."""
+    console = FallbackConsoleBuilder().build()
+    maintenance = StoreMaintenance(build_config())
+
+    try:
+        count = maintenance.export_snapshot(path)
+    except Exception as ex:
+        console.print("Failed to export tasks!")
+        console.print_exception()
+        raise typer.Exit(2) from ex
+
+    console.print(f"Exported {count} tasks.")
+
+
+@store.command("import")
+def import_snapshot(
+    path: Annotated[Path, typer.Argument(help="Path to the input file.")],
+) -> None:
+    """Replace all stored tasks with ones from newline-delimited JSON."""
+    console = FallbackConsoleBuilder().build()
+    maintenance = StoreMaintenance(build_config())
+
+    try:
+        count = maintenance.import_snapshot(path)
+    except Exception as ex:
+        console.print("Failed to import tasks!")
+        console.print_exception()
+        raise typer.Exit(2) from ex
+
+    console.print(f"Imported {count} tasks.")
+
+
 if __name__ == "__main__":
     cli()
@@ -56,13 +56,16 @@ class AppBuilder:
     def _build_openapi_config(self) -> OpenAPIConfig:
         return OpenAPIConfigBuilder().build()
 
-    def _build_plugins(self) -> Sequence[PluginProtocol]:
+    def _build_channels(self) -> ChannelsPlugin:
+        return ChannelsPlugin(backend=MemoryChannelsBackend(), channels=["events"])
+
+    def _build_plugins(self, channels: ChannelsPlugin) -> Sequence[PluginProtocol]:
         return [
-            ChannelsPlugin(backend=MemoryChannelsBackend(), channels=["events"]),
+            channels,
             PydanticPlugin(),
         ]
 
-    def _build_initial_state(self) -> State:
+    def _build_initial_state(self, channels: ChannelsPlugin) -> State:
         beaver = BeaverService(config=self._config.beaver)
         gecko = GeckoService(config=self._config.gecko)
         numbat = NumbatService(config=self._config.numbat)
@@ -79,7 +82,10 @@ class AppBuilder:
         )
         cleaner = CleanerService(config=self._config.cleaner, scheduler=scheduler)
         synchronizer = SynchronizerService(
-            config=self._config.synchronizer, beaver=beaver, scheduler=scheduler
+            config=self._config.synchronizer,
+            beaver=beaver,
+            scheduler=scheduler,
+            channels=channels,
         )
 
         return State(
@@ -94,11 +100,13 @@ class AppBuilder:
 
     def build(self) -> Litestar:
         """Build the app."""
+        channels = self._build_channels()
+
         return Litestar(
             route_handlers=[router],
             debug=self._config.debug,
             lifespan=self._build_lifespan(),
             openapi_config=self._build_openapi_config(),
-            plugins=self._build_plugins(),
-            state=self._build_initial_state(),
+            plugins=self._build_plugins(channels),
+            state=self._build_initial_state(channels),
         )
@@ -0,0 +1,74 @@
+from collections.abc import Mapping
+
+from litestar import Controller as BaseController
+from litestar import handlers
+from litestar.datastructures import ResponseHeader
+from litestar.di import Provide
+from litestar.status_codes import HTTP_204_NO_CONTENT
+
+from mantis.api.exceptions import ServiceUnavailableException
+from mantis.api.routes.ready import errors as e
+from mantis.api.routes.ready import models as m
+from mantis.api.routes.ready.service import Service
+from mantis.state import State
+
+
+class DependenciesBuilder:
+    """Builder for the dependencies of the controller."""
+
+    async def _build_service(self, state: State) -> Service:
+        return Service(synchronizer=state.synchronizer)
+
+    def build(self) -> Mapping[str, Provide]:
+        """Build the dependencies."""
+        return {
+            "service": Provide(self._build_service),
+        }
+
+
+class Controller(BaseController):
+    """Controller for the ready endpoint."""
+
+    dependencies = DependenciesBuilder().build()
+
+    @handlers.get(
+        summary="Ready",
+        status_code=HTTP_204_NO_CONTENT,
+        response_headers=[
+            ResponseHeader(
+                name="Cache-Control",
+                value="no-store",
+                required=True,
+            ),
+        ],
+        raises=[ServiceUnavailableException],
+    )
+    async def ready(self, service: Service) -> None:
+        """Check if the service is ready."""
+        request = m.ReadyRequest()
+
+        try:
+            await service.ready(request)
+        except e.NotReadyError as ex:
+            raise ServiceUnavailableException from ex
+
+    @handlers.head(
+        summary="Ready headers",
+        status_code=HTTP_204_NO_CONTENT,
+        response_headers=[
+            ResponseHeader(
+                name="Cache-Control",
+                value="no-store",
+                required=True,
+            ),
+        ],
+        raises=[ServiceUnavailableException],
+    )
+    async def headready(self, service: Service) -> None:
+        """Check if the service is ready using headers."""
+        request = m.HeadReadyRequest()
+
+        try:
+            await service.headready(request)
+        except e.NotReadyError as ex:
+            raise ServiceUnavailableException from ex
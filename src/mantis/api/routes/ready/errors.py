@@ -0,0 +1,9 @@
+class ServiceError(Exception):
+    """Base class for service errors."""
+
+
+class NotReadyError(ServiceError):
+    """Raised when the service is not ready yet."""
+
+    def __init__(self) -> None:
+        super().__init__("Service is not ready yet.")
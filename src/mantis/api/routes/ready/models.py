@@ -0,0 +1,21 @@
+from mantis.models.base import datamodel
+
+
+@datamodel
+class ReadyRequest:
+    """Request to check readiness."""
+
+
+@datamodel
+class ReadyResponse:
+    """Response for checking readiness."""
+
+
+@datamodel
+class HeadReadyRequest:
+    """Request to check readiness headers."""
+
+
+@datamodel
+class HeadReadyResponse:
+    """Response for checking readiness headers."""
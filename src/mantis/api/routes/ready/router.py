@@ -0,0 +1,11 @@
+from litestar import Router
+
+from mantis.api.routes.ready.controller import Controller
+
+router = Router(
+    path="/ready",
+    tags=["Ready"],
+    route_handlers=[
+        Controller,
+    ],
+)
@@ -0,0 +1,26 @@
+from mantis.api.routes.ready import errors as e
+from mantis.api.routes.ready import models as m
+from mantis.services.synchronizer.service import SynchronizerService
+
+
+class Service:
+    """Service for the ready endpoint."""
+
+    def __init__(self, synchronizer: SynchronizerService) -> None:
+        self._synchronizer = synchronizer
+
+    def _check(self) -> None:
+        if not self._synchronizer.ready:
+            raise e.NotReadyError
+
+    async def ready(self, request: m.ReadyRequest) -> m.ReadyResponse:
+        """Check readiness."""
+        self._check()
+
+        return m.ReadyResponse()
+
+    async def headready(self, request: m.HeadReadyRequest) -> m.HeadReadyResponse:
+        """Check readiness headers."""
+        self._check()
+
+        return m.HeadReadyResponse()
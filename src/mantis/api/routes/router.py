@@ -1,7 +1,10 @@
 from litestar import Router
 
 from mantis.api.routes.ping.router import router as ping
+from mantis.api.routes.ready.router import router as ready
 from mantis.api.routes.sse.router import router as sse
+from mantis.api.routes.store.router import router as store
+from mantis.api.routes.synchronizer.router import router as synchronizer
 from mantis.api.routes.tasks.router import router as tasks
 from mantis.api.routes.test.router import router as test
 
@@ -9,7 +12,10 @@ router = Router(
     path="/",
     route_handlers=[
         ping,
+        ready,
         sse,
+        store,
+        synchronizer,
         tasks,
         test,
     ],
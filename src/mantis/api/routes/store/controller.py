@@ -0,0 +1,44 @@
+from collections.abc import Mapping
+
+from litestar import Controller as BaseController
+from litestar import handlers
+from litestar.di import Provide
+from litestar.response import Response
+
+from mantis.api.routes.store import models as m
+from mantis.api.routes.store.service import Service
+from mantis.models.base import Serializable
+from mantis.state import State
+
+
+class DependenciesBuilder:
+    """Builder for the dependencies of the controller."""
+
+    async def _build_service(self, state: State) -> Service:
+        return Service(store=state.store)
+
+    def build(self) -> Mapping[str, Provide]:
+        """Build the dependencies."""
+        return {
+            "service": Provide(self._build_service),
+        }
+
+
+class Controller(BaseController):
+    """Controller for the store endpoint."""
+
+    dependencies = DependenciesBuilder().build()
+
+    @handlers.get(
+        "/metrics",
+        summary="Get metrics",
+    )
+    async def metrics(
+        self, service: Service
+    ) -> Response[Serializable[m.MetricsResponseMetrics]]:
+        """Get metrics of state commits."""
+        request = m.MetricsRequest()
+
+        response = await service.metrics(request)
+
+        return Response(Serializable(response.metrics))
@@ -0,0 +1,83 @@
+from datetime import timedelta
+from typing import Self
+
+from mantis.models.base import SerializableModel, datamodel
+from mantis.services.scheduler import metrics as sm
+
+
+class LatencyMetrics(SerializableModel):
+    """Metrics of the latency of state commits."""
+
+    last: timedelta
+    """Latency of the last commit."""
+
+    mean: timedelta
+    """Mean latency of all commits."""
+
+    max: timedelta
+    """Maximum latency of all commits."""
+
+    @classmethod
+    def map(cls, metrics: sm.LatencyMetrics) -> Self:
+        """Map to internal representation."""
+        return cls(last=metrics.last, mean=metrics.mean, max=metrics.max)
+
+
+class BatchMetrics(SerializableModel):
+    """Metrics of the number of changes in state commits."""
+
+    last: int
+    """Number of changes in the last commit."""
+
+    mean: float
+    """Mean number of changes in all commits."""
+
+    max: int
+    """Maximum number of changes in all commits."""
+
+    @classmethod
+    def map(cls, metrics: sm.BatchMetrics) -> Self:
+        """Map to internal representation."""
+        return cls(last=metrics.last, mean=metrics.mean, max=metrics.max)
+
+
+class CommitMetrics(SerializableModel):
+    """Metrics of state commits."""
+
+    commits: int
+    """Number of commits."""
+
+    changes: int
+    """Number of changes in all commits."""
+
+    latency: LatencyMetrics
+    """Metrics of the latency of commits."""
+
+    batch: BatchMetrics
+    """Metrics of the number of changes in commits."""
+
+    @classmethod
+    def map(cls, metrics: sm.CommitMetrics) -> Self:
+        """Map to internal representation."""
+        return cls(
+            commits=metrics.commits,
+            changes=metrics.changes,
+            latency=LatencyMetrics.map(metrics.latency),
+            batch=BatchMetrics.map(metrics.batch),
+        )
+
+
+type MetricsResponseMetrics = CommitMetrics
+
+
+@datamodel
+class MetricsRequest:
+    """Request to get metrics."""
+
+
+@datamodel
+class MetricsResponse:
+    """Response for getting metrics."""
+
+    metrics: MetricsResponseMetrics
+    """Metrics of state commits."""
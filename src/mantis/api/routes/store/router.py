@@ -0,0 +1,11 @@
+from litestar import Router
+
+from mantis.api.routes.store.controller import Controller
+
+router = Router(
+    path="/store",
+    tags=["Store"],
+    route_handlers=[
+        Controller,
+    ],
+)
@@ -0,0 +1,13 @@
+from mantis.api.routes.store import models as m
+from mantis.services.scheduler.store import Store
+
+
+class Service:
+    """Service for the store endpoint."""
+
+    def __init__(self, store: Store) -> None:
+        self._store = store
+
+    async def metrics(self, request: m.MetricsRequest) -> m.MetricsResponse:
+        """Get metrics."""
+        return m.MetricsResponse(metrics=m.CommitMetrics.map(self._store.metrics))
@@ -0,0 +1,104 @@
+from collections.abc import Mapping
+from typing import Annotated
+
+from litestar import Controller as BaseController
+from litestar import handlers
+from litestar.di import Provide
+from litestar.params import Body, Parameter
+from litestar.response import Response
+from litestar.status_codes import HTTP_200_OK
+
+from mantis.api.routes.synchronizer import models as m
+from mantis.api.routes.synchronizer.service import Service
+from mantis.models.base import Serializable
+from mantis.state import State
+
+
+class DependenciesBuilder:
+    """Builder for the dependencies of the controller."""
+
+    async def _build_service(self, state: State) -> Service:
+        return Service(synchronizer=state.synchronizer)
+
+    def build(self) -> Mapping[str, Provide]:
+        """Build the dependencies."""
+        return {
+            "service": Provide(self._build_service),
+        }
+
+
+class Controller(BaseController):
+    """Controller for the synchronizer endpoint."""
+
+    dependencies = DependenciesBuilder().build()
+
+    @handlers.get(
+        "/metrics",
+        summary="Get metrics",
+    )
+    async def metrics(
+        self, service: Service
+    ) -> Response[Serializable[m.MetricsResponseMetrics]]:
+        """Get metrics of synchronizations."""
+        request = m.MetricsRequest()
+
+        response = await service.metrics(request)
+
+        return Response(Serializable(response.metrics))
+
+    @handlers.get(
+        "/history",
+        summary="Get history",
+    )
+    async def history(
+        self, service: Service
+    ) -> Response[Serializable[m.HistoryResponseReports]]:
+        """Get reports of recent synchronizations."""
+        request = m.HistoryRequest()
+
+        response = await service.history(request)
+
+        return Response(Serializable(response.reports))
+
+    @handlers.get(
+        "/plan",
+        summary="Get plan",
+    )
+    async def plan(
+        self,
+        service: Service,
+        window: Annotated[
+            Serializable[m.PlanRequestWindow] | None,
+            Parameter(
+                description="Time window to plan for.",
+            ),
+        ] = None,
+    ) -> Response[Serializable[m.PlanResponsePlans]]:
+        """Get changes that a synchronization would make without making them."""
+        request = m.PlanRequest(window=window.root if window else None)
+
+        response = await service.plan(request)
+
+        return Response(Serializable(response.plans))
+
+    @handlers.post(
+        "/events",
+        summary="Synchronize events",
+        status_code=HTTP_200_OK,
+    )
+    async def synchronize(
+        self,
+        service: Service,
+        data: Annotated[
+            Serializable[m.SynchronizeRequestData],
+            Body(
+                description="Data to synchronize tasks of events.",
+            ),
+        ],
+    ) -> Response[Serializable[m.SynchronizeResponseReport]]:
+        """Synchronize tasks of events immediately."""
+        request = m.SynchronizeRequest(data=data.root)
+
+        response = await service.synchronize(request)
+
+        return Response(Serializable(response.report))
@@ -0,0 +1,155 @@
+from collections.abc import Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from datetime import timedelta
+from typing import Self
+from uuid import UUID
+
+from mantis.models.base import SerializableModel, datamodel
+from mantis.models.events.synchronization import SynchronizationReport
+from mantis.services.scheduler.models import transfer as st
+from mantis.services.synchronizer import metrics as sm
+from mantis.services.synchronizer import plans as sp
+
+
+class SynchronizationMetrics(SerializableModel):
+    """Metrics of synchronizations of a synchronizer."""
+
+    synchronizations: int
+    """Number of synchronizations."""
+
+    events: int
+    """Number of events checked in the last synchronization."""
+
+    skipped: int
+    """Number of unchanged events skipped in the last synchronization."""
+
+    @classmethod
+    def map(cls, metrics: sm.SynchronizationMetrics) -> Self:
+        """Map to internal representation."""
+        return cls(
+            synchronizations=metrics.synchronizations,
+            events=metrics.events,
+            skipped=metrics.skipped,
+        )
+
+
+class ScheduleRequest(SerializableModel):
+    """Request to schedule a task."""
+
+    operation: st.Specification
+    """Operation specification."""
+
+    condition: st.Specification
+    """Condition specification."""
+
+    dependencies: dict[str, UUID]
+    """Dependencies of the task."""
+
+    @classmethod
+    def map(cls, request: st.ScheduleRequest) -> Self:
+        """Map to internal representation."""
+        return cls(
+            operation=request.operation,
+            condition=request.condition,
+            dependencies=request.dependencies,
+        )
+
+
+class SynchronizationPlan(SerializableModel):
+    """Changes that a synchronization would make."""
+
+    add: Sequence[ScheduleRequest]
+    """Requests to schedule missing tasks."""
+
+    invalid: AbstractSet[UUID]
+    """Identifiers of invalid tasks to cancel."""
+
+    extra: AbstractSet[UUID]
+    """Identifiers of extra tasks to cancel."""
+
+    @classmethod
+    def map(cls, plan: sp.SynchronizationPlan) -> Self:
+        """Map to internal representation."""
+        return cls(
+            add=[ScheduleRequest.map(request) for request in plan.add],
+            invalid=plan.invalid,
+            extra=plan.extra,
+        )
+
+
+class SynchronizeRequestModel(SerializableModel):
+    """Request to synchronize tasks of events."""
+
+    ids: AbstractSet[UUID]
+    """Identifiers of events to synchronize tasks of."""
+
+
+type MetricsResponseMetrics = Mapping[str, SynchronizationMetrics]
+
+type HistoryResponseReports = Sequence[SynchronizationReport]
+
+type PlanRequestWindow = timedelta
+
+type PlanResponsePlans = Mapping[str, SynchronizationPlan]
+
+type SynchronizeRequestData = SynchronizeRequestModel
+
+type SynchronizeResponseReport = SynchronizationReport
+
+
+@datamodel
+class MetricsRequest:
+    """Request to get metrics."""
+
+
+@datamodel
+class MetricsResponse:
+    """Response for getting metrics."""
+
+    metrics: MetricsResponseMetrics
+    """Metrics of synchronizations by synchronizer."""
+
+
+@datamodel
+class HistoryRequest:
+    """Request to get history."""
+
+
+@datamodel
+class HistoryResponse:
+    """Response for getting history."""
+
+    reports: HistoryResponseReports
+    """Reports of recent synchronizations, from the oldest one."""
+
+
+@datamodel
+class PlanRequest:
+    """Request to get a plan."""
+
+    window: PlanRequestWindow | None
+    """Time window to plan for, or None to use the widest one."""
+
+
+@datamodel
+class PlanResponse:
+    """Response for getting a plan."""
+
+    plans: PlanResponsePlans
+    """Changes that a synchronization would make by synchronizer."""
+
+
+@datamodel
+class SynchronizeRequest:
+    """Request to synchronize."""
+
+    data: SynchronizeRequestData
+    """Data to synchronize tasks of events."""
+
+
+@datamodel
+class SynchronizeResponse:
+    """Response for synchronizing."""
+
+    report: SynchronizeResponseReport
+    """Report of the synchronization."""
@@ -0,0 +1,11 @@
+from litestar import Router
+
+from mantis.api.routes.synchronizer.controller import Controller
+
+router = Router(
+    path="/synchronizer",
+    tags=["Synchronizer"],
+    route_handlers=[
+        Controller,
+    ],
+)
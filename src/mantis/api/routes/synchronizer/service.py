@@ -0,0 +1,38 @@
+from mantis.api.routes.synchronizer import models as m
+from mantis.services.synchronizer.service import SynchronizerService
+
+
+class Service:
+    """Service for the synchronizer endpoint."""
+
+    def __init__(self, synchronizer: SynchronizerService) -> None:
+        self._synchronizer = synchronizer
+
+    async def metrics(self, request: m.MetricsRequest) -> m.MetricsResponse:
+        """Get metrics."""
+        return m.MetricsResponse(
+            metrics={
+                name: m.SynchronizationMetrics.map(metrics)
+                for name, metrics in self._synchronizer.metrics.items()
+            }
+        )
+
+    async def history(self, request: m.HistoryRequest) -> m.HistoryResponse:
+        """Get history."""
+        return m.HistoryResponse(reports=self._synchronizer.history)
+
+    async def plan(self, request: m.PlanRequest) -> m.PlanResponse:
+        """Get a plan."""
+        plans = await self._synchronizer.plan(request.window)
+
+        return m.PlanResponse(
+            plans={
+                name: m.SynchronizationPlan.map(plan) for name, plan in plans.items()
+            }
+        )
+
+    async def synchronize(self, request: m.SynchronizeRequest) -> m.SynchronizeResponse:
+        """Synchronize."""
+        report = await self._synchronizer.synchronize_events(request.data.ids)
+
+        return m.SynchronizeResponse(report=report)
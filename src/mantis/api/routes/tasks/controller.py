@@ -8,7 +8,11 @@ from litestar.params import Body, Parameter
 from litestar.response import Response
 from litestar.status_codes import HTTP_200_OK
 
-from mantis.api.exceptions import BadRequestException, NotFoundException
+from mantis.api.exceptions import (
+    BadRequestException,
+    ConflictException,
+    NotFoundException,
+)
 from mantis.api.routes.tasks import errors as e
 from mantis.api.routes.tasks import models as m
 from mantis.api.routes.tasks.service import Service
@@ -275,7 +279,7 @@ class Controller(BaseController):
         "/{id:str}",
         summary="Cancel task",
         status_code=HTTP_200_OK,
-        raises=[NotFoundException],
+        raises=[NotFoundException, ConflictException],
     )
     async def cancel(
         self,
@@ -294,6 +298,8 @@ class Controller(BaseController):
             response = await service.cancel(request)
         except e.TaskNotFoundError as ex:
             raise NotFoundException from ex
+        except e.TaskNotCancellableError as ex:
+            raise ConflictException from ex
 
         return Response(Serializable(response.task))
 
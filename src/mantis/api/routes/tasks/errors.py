@@ -14,3 +14,10 @@ class TaskNotFoundError(ServiceError):
 
     def __init__(self, task_id: UUID) -> None:
         super().__init__(f"Task not found: {task_id}.")
+
+
+class TaskNotCancellableError(ServiceError):
+    """Raised when task can't be cancelled anymore."""
+
+    def __init__(self, task_id: UUID) -> None:
+        super().__init__(f"Task can't be cancelled: {task_id}.")
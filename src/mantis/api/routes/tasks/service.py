@@ -34,6 +34,18 @@ class Service:
         with self._handle_errors():
             tasks = await self._scheduler.tasks.list()
 
+        archived = await self._scheduler.archive.list()
+
+        tasks = sm.TaskIndex(
+            queued=tasks.queued,
+            waiting=tasks.waiting,
+            sleeping=tasks.sleeping,
+            running=tasks.running,
+            cancelled=tasks.cancelled | archived.cancelled,
+            failed=tasks.failed | archived.failed,
+            completed=tasks.completed | archived.completed,
+        )
+
         return m.ListResponse(tasks=m.TaskIndex.map(tasks))
 
     async def get(self, request: m.GetRequest) -> m.GetResponse:
@@ -41,6 +53,9 @@ class Service:
         with self._handle_errors():
             task = await self._scheduler.tasks.get(request.id)
 
+        if task is None:
+            task = await self._scheduler.archive.get(request.id)
+
         if task is None:
             raise e.TaskNotFoundError(request.id)
 
@@ -95,6 +110,9 @@ class Service:
         with self._handle_errors():
             task = await self._scheduler.tasks.cancelled.get(request.id)
 
+        if task is None:
+            task = await self._scheduler.archive.get_cancelled(request.id)
+
         if task is None:
             raise e.TaskNotFoundError(request.id)
 
@@ -105,6 +123,9 @@ class Service:
         with self._handle_errors():
             task = await self._scheduler.tasks.failed.get(request.id)
 
+        if task is None:
+            task = await self._scheduler.archive.get_failed(request.id)
+
         if task is None:
             raise e.TaskNotFoundError(request.id)
 
@@ -117,6 +138,9 @@ class Service:
         with self._handle_errors():
             task = await self._scheduler.tasks.completed.get(request.id)
 
+        if task is None:
+            task = await self._scheduler.archive.get_completed(request.id)
+
         if task is None:
             raise e.TaskNotFoundError(request.id)
 
@@ -134,7 +158,16 @@ class Service:
         cancel_request = sm.CancelRequest(id=request.id)
 
         with self._handle_errors():
-            task = await self._scheduler.cancel(cancel_request)
+            try:
+                task = await self._scheduler.cancel(cancel_request)
+            except (se.TaskStatusError, se.UnexpectedTaskStatusError) as ex:
+                raise e.TaskNotCancellableError(request.id) from ex
+            except se.TaskNotFoundError:
+                # Archived tasks are finished, so they can't be cancelled either
+                if await self._scheduler.archive.get(request.id) is None:
+                    raise
+
+                raise e.TaskNotCancellableError(request.id) from None
 
         return m.CancelResponse(task=m.CancelledTask.map(task))
 
@@ -1,9 +1,11 @@
 from collections.abc import Sequence
 from datetime import datetime, timedelta
+from enum import StrEnum
 from pathlib import Path
 from socket import gethostbyname
+from typing import Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from mantis.config.base import BaseConfig
 from mantis.utils.time import NaiveDatetime
@@ -37,12 +39,25 @@ class BeaverHTTPConfig(BaseModel):
         return url
 
 
+class BeaverPaginationConfig(BaseModel):
+    """Configuration for pagination of lists from the beaver service."""
+
+    size: int | None = Field(default=None, ge=1)
+    """Number of items to request per page."""
+
+    concurrency: int = Field(default=4, ge=1)
+    """Maximum number of pages fetched concurrently."""
+
+
 class BeaverConfig(BaseModel):
     """Configuration for the beaver service."""
 
     http: BeaverHTTPConfig = BeaverHTTPConfig()
     """Configuration for the HTTP API."""
 
+    pagination: BeaverPaginationConfig = BeaverPaginationConfig()
+    """Configuration for pagination of lists."""
+
 
 class CleanerConfig(BaseModel):
     """Configuration for the cleaner."""
@@ -203,6 +218,13 @@ class OperationsConfig(BaseModel):
     """Configuration for the stream operation."""
 
 
+class SchedulerConfig(BaseModel):
+    """Configuration for the scheduler."""
+
+    concurrency: int = Field(default=16, ge=1)
+    """Maximum number of tasks scheduled or cancelled concurrently in bulk."""
+
+
 class ServerConfig(BaseModel):
     """Configuration for the server."""
 
@@ -216,16 +238,148 @@ class ServerConfig(BaseModel):
     """Trusted IP addresses."""
 
 
+class StoreArchiveConfig(BaseModel):
+    """Configuration for the archive of finished tasks."""
+
+    compression: int = Field(default=6, ge=0, le=9)
+    """Level of compression of archived tasks."""
+
+    delay: timedelta = Field(default=timedelta(days=1), ge=timedelta())
+    """Time after finishing for which tasks are kept in the hot state."""
+
+    enabled: bool = True
+    """Whether to move finished tasks out of the hot state."""
+
+    interval: timedelta = Field(default=timedelta(minutes=1), gt=timedelta())
+    """Minimum time between looking for finished tasks to move to the archive."""
+
+    path: Path | None = None
+    """Path to the directory with archive segments, next to the store file if unset."""
+
+    segment: int = Field(default=16 * 1024 * 1024, ge=1)
+    """Size of a segment in bytes after which a new one is started."""
+
+
+class StoreBackend(StrEnum):
+    """Store backend options."""
+
+    FILE = "file"
+    JOURNAL = "journal"
+    SQLITE = "sqlite"
+
+
+class StoreDurability(StrEnum):
+    """Store durability options."""
+
+    ALWAYS = "always"
+    BATCHED = "batched"
+    ON_SHUTDOWN = "on-shutdown"
+
+
+class StoreDurabilityConfig(BaseModel):
+    """Configuration for the durability of the store."""
+
+    level: StoreDurability = StoreDurability.BATCHED
+    """When persisted changes are synced to disk."""
+
+    interval: timedelta = Field(default=timedelta(seconds=1), gt=timedelta())
+    """Maximum time after which persisted changes are synced to disk in batches."""
+
+
+class StoreJournalConfig(BaseModel):
+    """Configuration for the journal of the store."""
+
+    size: int = Field(default=16 * 1024 * 1024, ge=1)
+    """Size of the journal in bytes after which it is compacted into a snapshot."""
+
+    records: int = Field(default=10000, ge=1)
+    """Number of records in the journal after which it is compacted into a snapshot."""
+
+
+class StoreSerializerCompression(StrEnum):
+    """Store serializer compression options."""
+
+    NONE = "none"
+    GZIP = "gzip"
+    LZMA = "lzma"
+
+
+class StoreSerializerFormat(StrEnum):
+    """Store serializer format options."""
+
+    JSON = "json"
+    MSGPACK = "msgpack"
+
+
+class StoreSerializerConfig(BaseModel):
+    """Configuration for the serializer of the store."""
+
+    compression: StoreSerializerCompression = StoreSerializerCompression.NONE
+    """Compression of the serialized state."""
+
+    format: StoreSerializerFormat = StoreSerializerFormat.JSON
+    """Format of the serialized state."""
+
+
+class StoreSQLiteConfig(BaseModel):
+    """Configuration for the SQLite database of the store."""
+
+    path: Path = Path("data/state.db")
+    """Path to the database file."""
+
+
 class StoreConfig(BaseModel):
     """Configuration for the store."""
 
+    archive: StoreArchiveConfig = StoreArchiveConfig()
+    """Configuration for the archive of finished tasks."""
+
+    backend: StoreBackend = StoreBackend.FILE
+    """Backend to persist the state with."""
+
+    durability: StoreDurabilityConfig = StoreDurabilityConfig()
+    """Configuration for the durability."""
+
+    journal: StoreJournalConfig = StoreJournalConfig()
+    """Configuration for the journal."""
+
     path: Path = Path("data/state.json")
     """Path to the store file."""
 
+    serializer: StoreSerializerConfig = StoreSerializerConfig()
+    """Configuration for the serializer."""
+
+    sqlite: StoreSQLiteConfig = StoreSQLiteConfig()
+    """Configuration for the SQLite database."""
+
+    window: timedelta = Field(default=timedelta(milliseconds=10), ge=timedelta())
+    """Time window in which changes to the state are persisted together."""
+
+    @property
+    def archive_path(self) -> Path:
+        """Path to the directory with archive segments."""
+        return self.archive.path or self.path.parent / "archive"
+
+
+class StreamSynchronizerEventsConfig(BaseModel):
+    """Configuration for lookups of events in the stream synchronizer."""
+
+    chunk: int = Field(default=100, ge=1)
+    """Maximum number of events looked up in a single request."""
+
+    concurrency: int = Field(default=4, ge=1)
+    """Maximum number of chunks of events looked up concurrently."""
+
+    ttl: timedelta = timedelta(minutes=10)
+    """Time after which cached events are looked up again."""
+
 
 class StreamSynchronizerConfig(BaseModel):
     """Configuration for the stream synchronizer."""
 
+    events: StreamSynchronizerEventsConfig = StreamSynchronizerEventsConfig()
+    """Configuration for lookups of events."""
+
     window: timedelta = timedelta(days=1)
     """Duration of the time window."""
 
@@ -237,9 +391,75 @@ class SynchronizersConfig(BaseModel):
     """Configuration for the stream synchronizer."""
 
 
+class SynchronizerChangesConfig(BaseModel):
+    """Configuration for synchronization of changes."""
+
+    enabled: bool = False
+    """Whether to subscribe to changes of events and synchronize them right away."""
+
+    interval: timedelta = timedelta(minutes=10)
+    """Minimum interval for the widest window while changes are received."""
+
+    delay: timedelta = timedelta(seconds=1)
+    """Time to wait for more changes before synchronizing them together."""
+
+    retry: timedelta = timedelta(seconds=5)
+    """Time to wait before subscribing to changes again after a failure."""
+
+
+class SynchronizerCadenceConfig(BaseModel):
+    """Configuration for adaptive intervals between synchronizations."""
+
+    ceiling: timedelta = Field(default=timedelta(hours=1), gt=timedelta())
+    """Maximum interval between synchronizations."""
+
+    enabled: bool = False
+    """Whether to adapt intervals between synchronizations to their outcomes."""
+
+    floor: timedelta = Field(default=timedelta(seconds=15), gt=timedelta())
+    """Minimum interval between synchronizations."""
+
+    imminence: timedelta = timedelta(hours=1)
+    """Time before the start of an instance from which intervals are shortest."""
+
+    slow: timedelta = timedelta(seconds=30)
+    """Duration of a synchronization from which it is backed off like a failed one."""
+
+    @model_validator(mode="after")
+    def validate_bounds(self) -> Self:
+        """Check that the floor is not above the ceiling."""
+        if self.floor > self.ceiling:
+            message = "Floor must not be greater than ceiling."
+            raise ValueError(message)
+
+        return self
+
+
+class SynchronizerHorizonConfig(BaseModel):
+    """Configuration for a synchronization horizon."""
+
+    window: timedelta = Field(gt=timedelta())
+    """Duration of the time window to synchronize."""
+
+    interval: timedelta = Field(gt=timedelta())
+    """Interval between synchronizations of the time window."""
+
+
 class SynchronizerConfig(BaseModel):
     """Configuration for the synchronizer."""
 
+    cadence: SynchronizerCadenceConfig = SynchronizerCadenceConfig()
+    """Configuration for adaptive intervals between synchronizations."""
+
+    changes: SynchronizerChangesConfig = SynchronizerChangesConfig()
+    """Configuration for synchronization of changes."""
+
+    history: int = Field(default=100, ge=1)
+    """Number of reports of recent synchronizations kept in memory."""
+
+    horizons: Sequence[SynchronizerHorizonConfig] | None = None
+    """Horizons to synchronize, each with its own window and interval."""
+
     reference: NaiveDatetime = datetime(2000, 1, 1, 0, 0, 0, 0)
     """Reference datetime in UTC for synchronization."""
 
@@ -274,6 +494,9 @@ class Config(BaseConfig):
     operations: OperationsConfig = OperationsConfig()
     """Configuration for the operations."""
 
+    scheduler: SchedulerConfig = SchedulerConfig()
+    """Configuration for the scheduler."""
+
     server: ServerConfig = ServerConfig()
     """Configuration for the server."""
 
@@ -4,4 +4,5 @@ from enum import StrEnum
 class EventType(StrEnum):
     """Event types."""
 
+    SYNCHRONIZATION = "synchronization"
     TEST = "test"
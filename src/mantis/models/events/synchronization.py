@@ -0,0 +1,90 @@
+from collections.abc import Mapping
+from datetime import timedelta
+from enum import StrEnum
+from typing import Literal
+
+from pydantic import Field
+
+from mantis.models.base import SerializableModel
+from mantis.models.events.enums import EventType
+from mantis.models.events.fields import CreatedAtField, DataField, TypeField
+from mantis.utils.time import NaiveDatetime, naiveutcnow
+
+
+class SynchronizationKind(StrEnum):
+    """Kinds of synchronizations."""
+
+    FULL = "full"
+    EVENTS = "events"
+
+
+class SynchronizationTimings(SerializableModel):
+    """Durations of stages of a synchronization."""
+
+    schedules: timedelta
+    """Time spent fetching schedules from beaver."""
+
+    tasks: timedelta
+    """Time spent fetching unfinished tasks."""
+
+    filtering: timedelta
+    """Time spent filtering tasks, including lookups of their events."""
+
+    diffing: timedelta
+    """Time spent finding tasks to cancel and to add."""
+
+    applying: timedelta
+    """Time spent cancelling and adding tasks."""
+
+
+class SynchronizationCounts(SerializableModel):
+    """Numbers of tasks changed by a synchronization."""
+
+    added: int
+    """Number of tasks added."""
+
+    cancelled: int
+    """Number of extra tasks cancelled."""
+
+    invalid: int
+    """Number of invalid tasks cancelled."""
+
+
+class SynchronizationResult(SerializableModel):
+    """Result of a synchronization by a synchronizer."""
+
+    timings: SynchronizationTimings
+    """Durations of stages of the synchronization."""
+
+    counts: SynchronizationCounts
+    """Numbers of tasks changed by the synchronization."""
+
+
+class SynchronizationReport(SerializableModel):
+    """Report of a synchronization by all synchronizers."""
+
+    kind: SynchronizationKind
+    """Kind of the synchronization."""
+
+    started: NaiveDatetime
+    """Datetime in UTC at which the synchronization started."""
+
+    duration: timedelta
+    """Duration of the synchronization."""
+
+    window: timedelta | None
+    """Time window that was synchronized, if not the default one."""
+
+    results: Mapping[str, SynchronizationResult]
+    """Results by synchronizer, empty if the synchronization failed."""
+
+    error: str | None
+    """Error that made the synchronization fail, if any."""
+
+
+class SynchronizationEvent(SerializableModel):
+    """Event that is emitted after each synchronization."""
+
+    type: TypeField[Literal[EventType.SYNCHRONIZATION]] = EventType.SYNCHRONIZATION
+    created_at: CreatedAtField = Field(default_factory=naiveutcnow)
+    data: DataField[SynchronizationReport]
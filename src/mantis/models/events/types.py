@@ -2,9 +2,9 @@ from typing import Annotated
 
 from pydantic import Field
 
-from mantis.models.events import test
+from mantis.models.events import synchronization, test
 
 type Event = Annotated[
-    test.TestEvent,
+    synchronization.SynchronizationEvent | test.TestEvent,
     Field(discriminator="type"),
 ]
@@ -1,7 +1,17 @@
 from gracy.exceptions import BadResponse as ResponseError
 from gracy.exceptions import GracyException as ServiceError
 
+
+class InvalidChangeError(Exception):
+    """Raised when a notification about a change is not valid."""
+
+    def __init__(self, data: str) -> None:
+        super().__init__(f"Invalid change: {data}.")
+        self.data = data
+
+
 __all__ = [
+    "InvalidChangeError",
     "ResponseError",
     "ServiceError",
 ]
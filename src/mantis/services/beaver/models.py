@@ -1,10 +1,12 @@
-from collections.abc import Sequence
+from collections.abc import AsyncGenerator, Sequence
+from collections.abc import Set as AbstractSet
 from enum import StrEnum
+from functools import cached_property
 from typing import TypedDict
 from uuid import UUID
 
 from mantis.models.base import SerializableModel, datamodel
-from mantis.utils.time import NaiveDatetime, Timezone
+from mantis.utils.time import NaiveDatetime, Timezone, naiveutcifyall
 
 
 class EventType(StrEnum):
@@ -15,6 +17,14 @@ class EventType(StrEnum):
     prerecorded = "prerecorded"
 
 
+class ChangeType(StrEnum):
+    """Types of notifications about changes of events."""
+
+    EVENT_CREATED = "event-created"
+    EVENT_UPDATED = "event-updated"
+    EVENT_DELETED = "event-deleted"
+
+
 StringFilter = TypedDict(
     "StringFilter",
     {
@@ -69,6 +79,20 @@ class Schedule(SerializableModel):
     instances: Sequence[EventInstance]
     """Event instances."""
 
+    @cached_property
+    def starts(self) -> Sequence[NaiveDatetime]:
+        """Start datetimes of the event instances in UTC."""
+        return naiveutcifyall(
+            (instance.start for instance in self.instances), self.event.timezone
+        )
+
+    @cached_property
+    def ends(self) -> Sequence[NaiveDatetime]:
+        """End datetimes of the event instances in UTC."""
+        return naiveutcifyall(
+            (instance.end for instance in self.instances), self.event.timezone
+        )
+
 
 class ScheduleList(SerializableModel):
     """List of event schedules."""
@@ -80,6 +104,33 @@ class ScheduleList(SerializableModel):
     """Schedules that matched the request."""
 
 
+class ChangedEvent(SerializableModel):
+    """Event that was changed."""
+
+    id: UUID
+    """Identifier of the event."""
+
+
+class ChangeData(SerializableModel):
+    """Data of a notification about a change of an event."""
+
+    event: ChangedEvent
+    """Event that was changed."""
+
+
+class Change(SerializableModel):
+    """Notification about a change of an event."""
+
+    type: ChangeType
+    """Type of the change."""
+
+    created_at: NaiveDatetime
+    """Datetime in UTC at which the change happened."""
+
+    data: ChangeData
+    """Data of the change."""
+
+
 class EventWhereInput(TypedDict, total=False):
     """Event arguments for searching."""
 
@@ -114,6 +165,10 @@ type ScheduleListRequestWhere = EventWhereInput | None
 
 type ScheduleListResponseResults = ScheduleList
 
+type SSESubscribeRequestTypes = AbstractSet[ChangeType] | None
+
+type SSESubscribeResponseChanges = AsyncGenerator[Change]
+
 
 @datamodel
 class EventsListRequest:
@@ -179,3 +234,19 @@ class ScheduleListResponse:
 
     results: ScheduleListResponseResults
     """List of schedules."""
+
+
+@datamodel
+class SSESubscribeRequest:
+    """Request to subscribe to notifications about changes."""
+
+    types: SSESubscribeRequestTypes
+    """Types of changes to subscribe to."""
+
+
+@datamodel
+class SSESubscribeResponse:
+    """Response for subscribing to notifications about changes."""
+
+    changes: SSESubscribeResponseChanges
+    """Stream of notifications about changes."""
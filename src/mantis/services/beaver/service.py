@@ -1,10 +1,15 @@
+from collections.abc import AsyncGenerator
 from typing import Any
 
 from gracy import BaseEndpoint, GracefulRetry, Gracy, GracyConfig, GracyNamespace
+from httpx import Response
+from pydantic import TypeAdapter, ValidationError
 
 from mantis.config.models import BeaverConfig
 from mantis.models.base import Jsonable, Serializable
+from mantis.services.beaver import errors as e
 from mantis.services.beaver import models as m
+from mantis.utils.pagination import Paginator
 
 
 class Endpoint(BaseEndpoint):
@@ -12,6 +17,7 @@ class Endpoint(BaseEndpoint):
 
     EVENTS = "/events"
     SCHEDULE = "/schedule"
+    SSE = "/sse"
 
 
 class BaseService(Gracy[Endpoint]):
@@ -24,6 +30,14 @@ class BaseService(Gracy[Endpoint]):
         )
         super().__init__(*args, **kwargs)
         self._config = config
+        self._paginator = Paginator(
+            size=config.pagination.size, concurrency=config.pagination.concurrency
+        )
+
+    @property
+    def paginator(self) -> Paginator:
+        """Paginator for lists."""
+        return self._paginator
 
 
 class EventsNamespace(GracyNamespace[Endpoint]):
@@ -86,8 +100,57 @@ class ScheduleNamespace(GracyNamespace[Endpoint]):
         )
 
 
+class SSENamespace(GracyNamespace[Endpoint]):
+    """Namespace for beaver sse endpoint."""
+
+    async def _read_changes(self, response: Response) -> AsyncGenerator[m.Change]:
+        adapter = TypeAdapter(m.Change)
+        data: list[str] = []
+
+        try:
+            async for line in response.aiter_lines():
+                if line.startswith("data:"):
+                    data.append(line.removeprefix("data:").removeprefix(" "))
+                    continue
+
+                # Messages are separated by empty lines
+                if line or not data:
+                    continue
+
+                message, data = "\n".join(data), []
+
+                # Only changes are subscribed to, so dropping a message
+                # would silently miss a change
+                try:
+                    change = adapter.validate_json(message)
+                except ValidationError as ex:
+                    raise e.InvalidChangeError(message) from ex
+
+                yield change
+        finally:
+            await response.aclose()
+
+    async def subscribe(self, request: m.SSESubscribeRequest) -> m.SSESubscribeResponse:
+        """Subscribe to notifications about changes."""
+        params = {}
+        if request.types is not None:
+            params["types"] = Jsonable(request.types).model_dump_json(round_trip=True)
+
+        response = await self._client.send(
+            self._client.build_request("GET", Endpoint.SSE, params=params),
+            stream=True,
+        )
+
+        if response.is_error:
+            await response.aclose()
+            response.raise_for_status()
+
+        return m.SSESubscribeResponse(changes=self._read_changes(response))
+
+
 class BeaverService(BaseService):
     """Service for beaver service."""
 
     events: EventsNamespace
     schedule: ScheduleNamespace
+    sse: SSENamespace
@@ -42,9 +42,16 @@ class CleanerService:
 
     async def _run(self) -> None:
         try:
+            # Tasks that finished while the service was down are cleaned right away
             while True:
+                try:
+                    await self._clean()
+                except asyncio.CancelledError:
+                    raise
+                except Exception:  # noqa: S110
+                    pass
+
                 await self._wait()
-                await self._clean()
         except asyncio.CancelledError:
             pass
 
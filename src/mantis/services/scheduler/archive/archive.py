@@ -0,0 +1,155 @@
+import asyncio
+from collections.abc import Set as AbstractSet
+from uuid import UUID
+
+from pydantic import TypeAdapter
+from pyscheduler.models import types
+from pyscheduler.protocols import cleaning as c
+
+from mantis.models.base import datamodel
+from mantis.services.scheduler.archive.segments import Segments
+from mantis.services.scheduler.backends import records as r
+from mantis.services.scheduler.cleaning.strategies.timed import TimedCleaningStrategy
+from mantis.services.scheduler.models import transfer as t
+
+# Number of records read from the segments at once when cleaning
+CHUNK = 1000
+
+
+@datamodel
+class ArchiveIndex:
+    """Index of archived tasks by status."""
+
+    cancelled: AbstractSet[UUID]
+    """Identifiers of archived cancelled tasks."""
+
+    failed: AbstractSet[UUID]
+    """Identifiers of archived failed tasks."""
+
+    completed: AbstractSet[UUID]
+    """Identifiers of archived completed tasks."""
+
+
+class Archive:
+    """Read access to finished tasks that were moved out of the hot state.
+
+    Args:
+        segments: Segments with records of archived tasks.
+
+    """
+
+    def __init__(self, segments: Segments) -> None:
+        self._segments = segments
+        self._generic = TypeAdapter(t.GenericTask)
+        self._cancelled = TypeAdapter(t.CancelledTask)
+        self._failed = TypeAdapter(t.FailedTask)
+        self._completed = TypeAdapter(t.CompletedTask)
+
+    async def _get(self, task_id: UUID, bucket: str | None = None) -> r.Record | None:
+        record = await asyncio.to_thread(self._segments.get, task_id)
+
+        if record is None:
+            return None
+
+        if bucket is not None and record["bucket"] != bucket:
+            return None
+
+        return record
+
+    def _map_finished(self, record: r.Record) -> t.FinishedTask:
+        match record["bucket"]:
+            case "cancelled":
+                return self._cancelled.validate_python(record["task"])
+            case "failed":
+                return self._failed.validate_python(record["task"])
+            case _:
+                return self._completed.validate_python(record["task"])
+
+    async def list(self) -> ArchiveIndex:
+        """List archived tasks."""
+        buckets = await asyncio.to_thread(self._segments.list)
+
+        index: dict[str, set[UUID]] = {
+            "cancelled": set(),
+            "failed": set(),
+            "completed": set(),
+        }
+
+        for task_id, bucket in buckets.items():
+            index[bucket].add(task_id)
+
+        return ArchiveIndex(
+            cancelled=index["cancelled"],
+            failed=index["failed"],
+            completed=index["completed"],
+        )
+
+    async def get(self, task_id: UUID) -> t.GenericTask | None:
+        """Get an archived task."""
+        record = await self._get(task_id)
+
+        if record is None:
+            return None
+
+        return self._generic.validate_python(
+            {"task": record["task"]["task"], "status": record["status"]}
+        )
+
+    async def get_cancelled(self, task_id: UUID) -> t.CancelledTask | None:
+        """Get an archived cancelled task."""
+        record = await self._get(task_id, "cancelled")
+
+        if record is None:
+            return None
+
+        return self._cancelled.validate_python(record["task"])
+
+    async def get_failed(self, task_id: UUID) -> t.FailedTask | None:
+        """Get an archived failed task."""
+        record = await self._get(task_id, "failed")
+
+        if record is None:
+            return None
+
+        return self._failed.validate_python(record["task"])
+
+    async def get_completed(self, task_id: UUID) -> t.CompletedTask | None:
+        """Get an archived completed task."""
+        record = await self._get(task_id, "completed")
+
+        if record is None:
+            return None
+
+        return self._completed.validate_python(record["task"])
+
+    async def clean(
+        self, strategy: c.CleaningStrategy, parameters: dict[str, types.JSON]
+    ) -> AbstractSet[UUID]:
+        """Remove archived tasks selected by the cleaning strategy."""
+        removed: set[UUID] = set()
+
+        if isinstance(strategy, TimedCleaningStrategy):
+            times = await asyncio.to_thread(self._segments.list_finished)
+
+            # Only tasks without a known finishing time have to be read
+            ids = [task_id for task_id, time in times.items() if time is None]
+
+            for task_id, time in times.items():
+                if time is not None and await strategy.evaluate_finished(
+                    time, parameters
+                ):
+                    removed.add(task_id)
+        else:
+            ids = list((await asyncio.to_thread(self._segments.list)).keys())
+
+        for start in range(0, len(ids), CHUNK):
+            chunk = ids[start : start + CHUNK]
+            records = await asyncio.to_thread(self._segments.get_many, chunk)
+
+            for task_id, record in records.items():
+                if await strategy.evaluate(self._map_finished(record), parameters):
+                    removed.add(task_id)
+
+        await asyncio.to_thread(self._segments.remove, removed)
+
+        return removed
@@ -0,0 +1,552 @@
+import json
+import math
+import os
+import struct
+import zlib
+from collections.abc import Collection, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from threading import Lock
+from typing import BinaryIO
+from uuid import UUID
+
+from mantis.config.models import StoreArchiveConfig, StoreDurability
+from mantis.services.scheduler.archive import tiering
+from mantis.services.scheduler.backends import records as r
+
+# Identifier of the task, code of its bucket, time at which it finished
+# and size of the payload
+HEADER = struct.Struct(">16sBdI")
+
+# Identifier of the task, code of its bucket, time at which it finished,
+# offset and size of the payload
+INDEX = struct.Struct(">16sBdQI")
+
+# Number of entries and checksum of the index, written after the entries
+FOOTER = struct.Struct(">QI")
+
+# Code zero marks a removed task
+BUCKETS = ("cancelled", "failed", "completed")
+
+# Number of records copied at once when compacting
+CHUNK = 1000
+
+# Marks an unknown time at which the task finished
+UNKNOWN = math.nan
+
+
+@dataclass(frozen=True, slots=True)
+class Entry:
+    """Location of an archived task."""
+
+    segment: int
+    """Number of the segment."""
+
+    offset: int
+    """Offset of the payload in the segment."""
+
+    size: int
+    """Size of the payload."""
+
+    bucket: str
+    """Bucket of the task, shared between all entries."""
+
+    finished: float
+    """POSIX timestamp of the time at which the task finished, NaN if unknown."""
+
+
+class Segments:
+    """Append-only segment files with compressed records of archived tasks.
+
+    Each sealed segment has an index file with locations of its records.
+    The index of all segments is loaded lazily, on first access,
+    so opening the segments doesn't depend on the size of the archive.
+
+    Args:
+        config: Configuration for the archive.
+        durability: When appended records are synced to disk.
+        path: Path to the directory with the segments.
+
+    """
+
+    def __init__(
+        self, config: StoreArchiveConfig, durability: StoreDurability, path: Path
+    ) -> None:
+        self._config = config
+        self._durability = durability
+        self._path = path
+        # Tasks are keyed by raw bytes of their identifiers to save memory
+        self._index: dict[bytes, Entry] = {}
+        self._pending: dict[bytes, r.Record] = {}
+        self._live: dict[int, int] = {}
+        self._lock = Lock()
+        self._writing = Lock()
+        self._loading = Lock()
+        self._loaded = False
+        self._read_only = False
+        self._sealed: list[int] = []
+        # Index entries of the current segment, packed to save memory
+        self._frames = bytearray()
+        self._file: BinaryIO | None = None
+        self._segment = 0
+        self._size = 0
+        self._unsynced = False
+
+    def _get_path(self, segment: int) -> Path:
+        return self._path / f"{segment:08d}.segment"
+
+    def _get_index_path(self, segment: int) -> Path:
+        return self._path / f"{segment:08d}.index"
+
+    def _scan(self, segment: int, *, truncate: bool = True) -> bytearray:
+        path = self._get_path(segment)
+        total = path.stat().st_size
+        frames = bytearray()
+        valid = 0
+
+        with path.open("r+b" if truncate else "rb") as file:
+            while True:
+                header = file.read(HEADER.size)
+                if len(header) < HEADER.size:
+                    break
+
+                key, code, finished, size = HEADER.unpack(header)
+                offset = file.tell()
+
+                # Skip the payload, the header is enough to build the index
+                if file.seek(size, os.SEEK_CUR) > total:
+                    break
+
+                frames += INDEX.pack(key, code, finished, offset, size)
+                valid = file.tell()
+
+            # Drop the torn tail left by an interrupted append
+            if truncate:
+                file.truncate(valid)
+
+        return frames
+
+    def _read_index(self, segment: int) -> bytes | None:
+        try:
+            data = self._get_index_path(segment).read_bytes()
+        except FileNotFoundError:
+            return None
+
+        if len(data) < FOOTER.size:
+            return None
+
+        frames = data[: -FOOTER.size]
+        count, checksum = FOOTER.unpack_from(data, len(frames))
+
+        # Anything that doesn't match is rebuilt by scanning the segment
+        if len(frames) != count * INDEX.size or zlib.crc32(frames) != checksum:
+            return None
+
+        return frames
+
+    def _write_index(self, segment: int, frames: bytes) -> None:
+        path = self._get_index_path(segment)
+        temporary = path.with_name(f"{path.name}.tmp")
+
+        footer = FOOTER.pack(len(frames) // INDEX.size, zlib.crc32(frames))
+
+        with temporary.open("wb") as file:
+            file.write(frames + footer)
+            file.flush()
+
+            # The index must be complete on disk before it replaces the old one
+            os.fsync(file.fileno())
+
+        temporary.replace(path)
+
+    def _apply(self, segment: int, frames: bytes) -> None:
+        self._live.setdefault(segment, 0)
+
+        for key, code, finished, offset, size in INDEX.iter_unpack(frames):
+            if code == 0:
+                self._untrack(key)
+            else:
+                bucket = BUCKETS[code - 1]
+                self._track(key, Entry(segment, offset, size, bucket, finished))
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+
+        with self._loading:
+            if self._loaded:
+                return
+
+            for segment in self._sealed:
+                frames = self._read_index(segment)
+
+                # The index might be missing or invalid if writing it was interrupted
+                if frames is None:
+                    frames = self._scan(segment, truncate=not self._read_only)
+
+                    if not self._read_only:
+                        self._write_index(segment, frames)
+
+                with self._lock:
+                    self._apply(segment, frames)
+
+            with self._lock:
+                if self._file is not None:
+                    self._apply(self._segment, self._frames)
+
+                if not self._read_only:
+                    self._remove_empty()
+
+            self._loaded = True
+
+    def _track(self, key: bytes, entry: Entry) -> None:
+        self._untrack(key)
+        self._index[key] = entry
+        self._live[entry.segment] = self._live.get(entry.segment, 0) + 1
+
+    def _untrack(self, key: bytes) -> None:
+        entry = self._index.pop(key, None)
+        if entry is None:
+            return
+
+        self._live[entry.segment] = self._live[entry.segment] - 1
+
+    def _sync_directory(self) -> None:
+        descriptor = os.open(self._path, os.O_RDONLY)
+
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+    def _rotate(self) -> BinaryIO:
+        if self._file is not None:
+            if self._unsynced:
+                os.fsync(self._file.fileno())
+                self._unsynced = False
+
+            self._file.close()
+            self._write_index(self._segment, self._frames)
+
+        self._segment = self._segment + 1
+        self._file = self._get_path(self._segment).open("ab")
+        self._frames = bytearray()
+        self._size = 0
+        self._live.setdefault(self._segment, 0)
+
+        if self._durability == StoreDurability.ALWAYS:
+            self._sync_directory()
+
+        return self._file
+
+    def _get_file(self) -> BinaryIO:
+        if self._file is None or self._size >= self._config.segment:
+            return self._rotate()
+
+        return self._file
+
+    def _remove_empty(self) -> None:
+        # Removals are recorded in later segments, so only the oldest segments
+        # can be deleted without bringing back tasks removed from them
+        for segment in sorted(self._live):
+            if self._live[segment] > 0 or segment == self._segment:
+                return
+
+            self._get_path(segment).unlink(missing_ok=True)
+            self._get_index_path(segment).unlink(missing_ok=True)
+            del self._live[segment]
+
+    def _append(self, frames: Iterable[tuple[bytes, int, float, bytes]]) -> list[int]:
+        offsets: list[int] = []
+        file = self._get_file()
+
+        for key, code, finished, payload in frames:
+            file.write(HEADER.pack(key, code, finished, len(payload)) + payload)
+
+            offset = self._size + HEADER.size
+            offsets.append(offset)
+            self._frames += INDEX.pack(key, code, finished, offset, len(payload))
+            self._size = offset + len(payload)
+
+        file.flush()
+
+        if self._durability == StoreDurability.ALWAYS:
+            os.fsync(file.fileno())
+        else:
+            self._unsynced = True
+
+        return offsets
+
+    def _compress(self, record: r.Record) -> bytes:
+        data = json.dumps(record, separators=(",", ":")).encode()
+        return zlib.compress(data, self._config.compression)
+
+    def _get_finished(self, record: r.Record) -> float:
+        time = tiering.finished(record["task"], record["bucket"])
+
+        if time is None:
+            return UNKNOWN
+
+        return time.replace(tzinfo=UTC).timestamp()
+
+    def _to_datetime(self, timestamp: float) -> datetime | None:
+        if math.isnan(timestamp):
+            return None
+
+        return datetime.fromtimestamp(timestamp, UTC).replace(tzinfo=None)
+
+    def _read_payload(self, entry: Entry) -> bytes | None:
+        try:
+            with self._get_path(entry.segment).open("rb") as file:
+                file.seek(entry.offset)
+                return file.read(entry.size)
+        except FileNotFoundError:
+            # The task was removed together with its segment in the meantime
+            return None
+
+    def _read(self, entry: Entry) -> r.Record | None:
+        payload = self._read_payload(entry)
+
+        if payload is None:
+            return None
+
+        return json.loads(zlib.decompress(payload))
+
+    def open(self, *, read_only: bool = False) -> None:
+        """Open the segments.
+
+        In read-only mode nothing is written, not even to recover from a crash.
+        """
+        self._read_only = read_only
+
+        if not read_only:
+            self._path.mkdir(parents=True, exist_ok=True)
+
+        segments = sorted(int(path.stem) for path in self._path.glob("*.segment"))
+
+        if not segments:
+            self._loaded = True
+            return
+
+        # Nothing is appended, so the last segment is read like the sealed ones
+        if read_only:
+            self._sealed = segments
+            return
+
+        self._sealed = segments[:-1]
+        self._segment = segments[-1]
+
+        # Only the last segment can have a torn tail
+        self._frames = self._scan(self._segment)
+        self._file = self._get_path(self._segment).open("ab")
+        self._size = self._file.tell()
+
+    def close(self) -> None:
+        """Close the segments."""
+        self.sync()
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def add(self, records: Mapping[str, r.Record]) -> None:
+        """Add records of tasks to be archived on the next flush."""
+        if not records:
+            return
+
+        with self._lock:
+            self._pending.update(
+                (UUID(task_id).bytes, record) for task_id, record in records.items()
+            )
+
+    def flush(self) -> None:
+        """Append pending records to the segments."""
+        self._load()
+
+        with self._writing:
+            with self._lock:
+                pending = dict(self._pending)
+
+            if not pending:
+                return
+
+            frames = [
+                (
+                    key,
+                    BUCKETS.index(record["bucket"]) + 1,
+                    self._get_finished(record),
+                    self._compress(record),
+                )
+                for key, record in pending.items()
+            ]
+            offsets = self._append(frames)
+
+            with self._lock:
+                for (key, code, finished, payload), offset in zip(
+                    frames, offsets, strict=True
+                ):
+                    bucket = BUCKETS[code - 1]
+                    entry = Entry(self._segment, offset, len(payload), bucket, finished)
+                    self._track(key, entry)
+
+                    # The task might have been archived again in the meantime
+                    if self._pending.get(key) is pending[key]:
+                        del self._pending[key]
+
+    def sync(self) -> None:
+        """Sync appended records to disk."""
+        with self._writing:
+            if self._unsynced and self._file is not None:
+                os.fsync(self._file.fileno())
+                self._unsynced = False
+
+    def get(self, task_id: UUID) -> r.Record | None:
+        """Get the record of an archived task."""
+        self._load()
+
+        with self._lock:
+            record = self._pending.get(task_id.bytes)
+            entry = self._index.get(task_id.bytes)
+
+        if record is not None:
+            return record
+
+        if entry is None:
+            return None
+
+        return self._read(entry)
+
+    def get_many(self, ids: Collection[UUID]) -> dict[UUID, r.Record]:
+        """Get records of many archived tasks."""
+        self._load()
+
+        with self._lock:
+            pending = {
+                task_id: self._pending[task_id.bytes]
+                for task_id in ids
+                if task_id.bytes in self._pending
+            }
+            entries = {
+                task_id: self._index[task_id.bytes]
+                for task_id in ids
+                if task_id not in pending and task_id.bytes in self._index
+            }
+
+        records = dict(pending)
+
+        # Read in the order of segments to keep the access sequential
+        for task_id, entry in sorted(
+            entries.items(), key=lambda item: (item[1].segment, item[1].offset)
+        ):
+            record = self._read(entry)
+            if record is not None:
+                records[task_id] = record
+
+        return records
+
+    def list(self) -> dict[UUID, str]:
+        """List buckets of all archived tasks."""
+        self._load()
+
+        with self._lock:
+            buckets = {key: entry.bucket for key, entry in self._index.items()}
+            buckets.update(
+                (key, record["bucket"]) for key, record in self._pending.items()
+            )
+
+        return {UUID(bytes=key): bucket for key, bucket in buckets.items()}
+
+    def list_finished(self) -> dict[UUID, datetime | None]:
+        """List times in UTC at which all archived tasks finished, if known.
+
+        Times are kept in the index, so no records have to be read.
+        """
+        self._load()
+
+        with self._lock:
+            times = {key: entry.finished for key, entry in self._index.items()}
+            times.update(
+                (key, self._get_finished(record))
+                for key, record in self._pending.items()
+            )
+
+        return {UUID(bytes=key): self._to_datetime(time) for key, time in times.items()}
+
+    def remove(self, ids: Collection[UUID]) -> None:
+        """Remove archived tasks."""
+        self._load()
+
+        keys = [task_id.bytes for task_id in ids]
+
+        with self._writing:
+            with self._lock:
+                for key in keys:
+                    self._pending.pop(key, None)
+
+                indexed = [key for key in keys if key in self._index]
+
+            if not indexed:
+                return
+
+            self._append((key, 0, UNKNOWN, b"") for key in indexed)
+
+            with self._lock:
+                for key in indexed:
+                    self._untrack(key)
+
+            self._remove_empty()
+
+    def compact(self) -> None:
+        """Rewrite live records to new segments and remove the old ones."""
+        self._load()
+
+        with self._writing:
+            old = sorted(self._live)
+
+            with self._lock:
+                entries = sorted(
+                    self._index.items(),
+                    key=lambda item: (item[1].segment, item[1].offset),
+                )
+
+            # Start a new segment, so none of the old ones is written to anymore
+            self._rotate()
+
+            for start in range(0, len(entries), CHUNK):
+                frames = [
+                    (key, BUCKETS.index(entry.bucket) + 1, entry.finished, payload)
+                    for key, entry in entries[start : start + CHUNK]
+                    if (payload := self._read_payload(entry)) is not None
+                ]
+                offsets = self._append(frames)
+
+                with self._lock:
+                    for (key, code, finished, payload), offset in zip(
+                        frames, offsets, strict=True
+                    ):
+                        bucket = BUCKETS[code - 1]
+                        entry = Entry(
+                            self._segment, offset, len(payload), bucket, finished
+                        )
+                        self._track(key, entry)
+
+            # Copies must reach the disk before the originals are removed
+            if self._file is not None:
+                os.fsync(self._file.fileno())
+                self._unsynced = False
+
+            with self._lock:
+                for segment in old:
+                    self._get_path(segment).unlink(missing_ok=True)
+                    self._get_index_path(segment).unlink(missing_ok=True)
+                    self._live.pop(segment, None)
+
+    @property
+    def size(self) -> int:
+        """Size of all segments and their indexes in bytes."""
+        return sum(
+            path.stat().st_size
+            for pattern in ("*.segment", "*.index")
+            for path in self._path.glob(pattern)
+        )
@@ -0,0 +1,103 @@
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from typing import Any, cast
+
+from pyscheduler.models.data import storage as s
+
+from mantis.services.scheduler.backends import records as r
+from mantis.utils.time import isoparse
+
+HOT = ("queued", "waiting", "sleeping", "running")
+
+FINISHED = ("cancelled", "failed", "completed")
+
+
+def finished(task: Mapping[str, Any], bucket: str) -> datetime | None:
+    """Get the time in UTC at which a stored finished task finished, if known."""
+    try:
+        value = isoparse(task[bucket])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+
+    return value
+
+
+def split(state: s.State, cutoff: datetime) -> tuple[s.State, dict[str, r.Record]]:
+    """Split the state into the hot state and records of tasks to archive.
+
+    Finished tasks are archived only when they finished before the cutoff
+    and none of their dependents and dependencies is unfinished.
+    Recently finished tasks can still be referenced by new tasks
+    as their dependencies, so the scheduler must be able to find them.
+    """
+    data = cast("Mapping[str, Any]", state)
+    tasks = data["tasks"]
+    relationships = data["relationships"]
+
+    unfinished = {task_id for bucket in HOT for task_id in tasks[bucket]}
+
+    archived: dict[str, r.Record] = {}
+
+    for bucket in FINISHED:
+        for task_id, task in tasks[bucket].items():
+            time = finished(task, bucket)
+
+            if time is not None and time >= cutoff:
+                continue
+
+            related = [
+                related_id
+                for name in r.RELATIONSHIPS
+                for related_id in relationships[name].get(task_id, [])
+            ]
+
+            if any(related_id in unfinished for related_id in related):
+                continue
+
+            record: r.Record = {"bucket": bucket, "task": task}
+
+            if task_id in data["statuses"]:
+                record["status"] = data["statuses"][task_id]
+
+            for name in r.RELATIONSHIPS:
+                if task_id in relationships[name]:
+                    record[name] = relationships[name][task_id]
+
+            archived[task_id] = record
+
+    if not archived:
+        return state, archived
+
+    hot = {
+        "tasks": {
+            bucket: {
+                task_id: task
+                for task_id, task in bucket_tasks.items()
+                if task_id not in archived
+            }
+            if bucket in FINISHED
+            else bucket_tasks
+            for bucket, bucket_tasks in tasks.items()
+        },
+        "statuses": {
+            task_id: status
+            for task_id, status in data["statuses"].items()
+            if task_id not in archived
+        },
+        # Tasks that stay in the hot state should not refer to archived ones
+        "relationships": {
+            name: {
+                task_id: [
+                    related_id for related_id in ids if related_id not in archived
+                ]
+                for task_id, ids in relationships[name].items()
+                if task_id not in archived
+            }
+            for name in r.RELATIONSHIPS
+        },
+    }
+
+    return cast("s.State", hot), archived
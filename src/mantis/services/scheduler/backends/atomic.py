@@ -0,0 +1,77 @@
+import os
+from pathlib import Path
+
+from pyscheduler.models.data import storage as s
+
+from mantis.services.scheduler.backends.serializer import Serializer
+
+
+class AtomicFile:
+    """State file that is replaced atomically and keeps its previous generation."""
+
+    def __init__(self, path: Path, serializer: Serializer) -> None:
+        self._path = path
+        self._serializer = serializer
+        self._temporary = path.with_name(f"{path.name}.tmp")
+        self._previous = path.with_name(f"{path.name}.previous")
+
+    def _read(self, path: Path) -> s.State | None:
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        if not data:
+            return None
+
+        try:
+            return self._serializer.deserialize(data)
+        except ValueError:
+            return None
+
+    def _sync_directory(self) -> None:
+        descriptor = os.open(self._path.parent, os.O_RDONLY)
+
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+    def read(self) -> s.State | None:
+        """Read the last valid generation of the state."""
+        # The current generation might be missing or invalid after a crash
+        for path in (self._path, self._previous):
+            state = self._read(path)
+            if state is not None:
+                return state
+
+        return None
+
+    def write(self, state: s.State, *, sync: bool) -> None:
+        """Write a new generation of the state."""
+        data = self._serializer.serialize(state)
+
+        with self._temporary.open("wb") as file:
+            file.write(data)
+            file.flush()
+
+            if sync:
+                os.fsync(file.fileno())
+
+        if self._path.exists():
+            self._path.replace(self._previous)
+
+        self._temporary.replace(self._path)
+
+        if sync:
+            self._sync_directory()
+
+    def sync(self) -> None:
+        """Sync the current generation of the state to disk."""
+        if not self._path.exists():
+            return
+
+        with self._path.open("rb") as file:
+            os.fsync(file.fileno())
+
+        self._sync_directory()
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from collections.abc import Set as AbstractSet
+
+from pyscheduler.models.data import storage as s
+
+
+class Backend(ABC):
+    """Base class for store backends."""
+
+    @abstractmethod
+    def open(self, *, read_only: bool = False) -> None:
+        """Open the backend.
+
+        In read-only mode nothing is written, not even to recover from a crash.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Close the backend."""
+
+    @abstractmethod
+    def load(self) -> s.State | None:
+        """Load the persisted state if there is any."""
+
+    @abstractmethod
+    def save(self, state: s.State, changed: AbstractSet[str] | None = None) -> None:
+        """Persist the state.
+
+        If identifiers of changed tasks are known, only those tasks are written.
+        """
+
+    @abstractmethod
+    def sync(self) -> None:
+        """Sync the persisted state to disk."""
+
+    @abstractmethod
+    def compact(self) -> None:
+        """Reclaim space taken by outdated data."""
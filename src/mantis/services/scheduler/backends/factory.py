@@ -0,0 +1,34 @@
+from mantis.config.models import StoreBackend, StoreConfig
+from mantis.services.scheduler.backends.backend import Backend
+from mantis.services.scheduler.backends.file import FileBackend
+from mantis.services.scheduler.backends.journal import JournalBackend
+from mantis.services.scheduler.backends.serializer import Serializer
+from mantis.services.scheduler.backends.sqlite import SQLiteBackend
+
+
+class BackendFactory:
+    """Factory for creating store backends."""
+
+    def create(self, config: StoreConfig) -> Backend:
+        """Create a backend for the configuration."""
+        match config.backend:
+            case StoreBackend.FILE:
+                return FileBackend(
+                    path=config.path,
+                    durability=config.durability.level,
+                    serializer=Serializer(config=config.serializer),
+                )
+            case StoreBackend.JOURNAL:
+                return JournalBackend(
+                    path=config.path,
+                    config=config.journal,
+                    durability=config.durability.level,
+                    serializer=Serializer(config=config.serializer),
+                )
+            case StoreBackend.SQLITE:
+                return SQLiteBackend(
+                    path=config.sqlite.path,
+                    source=config.path,
+                    durability=config.durability.level,
+                    serializer=Serializer(config=config.serializer),
+                )
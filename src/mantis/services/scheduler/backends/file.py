@@ -0,0 +1,51 @@
+from collections.abc import Set as AbstractSet
+from pathlib import Path
+from typing import override
+
+from pyscheduler.models.data import storage as s
+
+from mantis.config.models import StoreDurability
+from mantis.services.scheduler.backends.atomic import AtomicFile
+from mantis.services.scheduler.backends.backend import Backend
+from mantis.services.scheduler.backends.serializer import Serializer
+
+
+class FileBackend(Backend):
+    """Backend that atomically replaces the whole state in a single file."""
+
+    def __init__(
+        self, path: Path, durability: StoreDurability, serializer: Serializer
+    ) -> None:
+        self._file = AtomicFile(path=path, serializer=serializer)
+        self._durability = durability
+        self._unsynced = False
+
+    @override
+    def open(self, *, read_only: bool = False) -> None:
+        return
+
+    @override
+    def close(self) -> None:
+        return
+
+    @override
+    def load(self) -> s.State | None:
+        return self._file.read()
+
+    @override
+    def save(self, state: s.State, changed: AbstractSet[str] | None = None) -> None:
+        # The whole state is written anyway, so changes don't matter
+        sync = self._durability == StoreDurability.ALWAYS
+        self._file.write(state, sync=sync)
+        self._unsynced = not sync
+
+    @override
+    def sync(self) -> None:
+        if self._unsynced:
+            self._file.sync()
+            self._unsynced = False
+
+    @override
+    def compact(self) -> None:
+        # The whole state is rewritten on every save, so there is nothing to reclaim
+        return
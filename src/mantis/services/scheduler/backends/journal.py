@@ -0,0 +1,218 @@
+import json
+import os
+from collections.abc import Mapping
+from collections.abc import Set as AbstractSet
+from pathlib import Path
+from threading import Thread
+from typing import Any, BinaryIO, override
+
+from pyscheduler.models.data import storage as s
+
+from mantis.config.models import StoreDurability, StoreJournalConfig
+from mantis.services.scheduler.backends import records as r
+from mantis.services.scheduler.backends.atomic import AtomicFile
+from mantis.services.scheduler.backends.backend import Backend
+from mantis.services.scheduler.backends.serializer import Serializer
+
+
+class JournalBackend(Backend):
+    """Backend that appends changes to a journal and compacts it into a snapshot."""
+
+    def __init__(
+        self,
+        path: Path,
+        config: StoreJournalConfig,
+        durability: StoreDurability,
+        serializer: Serializer,
+    ) -> None:
+        self._snapshot = AtomicFile(path=path, serializer=serializer)
+        self._config = config
+        self._durability = durability
+        self._journal = path.with_name(f"{path.name}.journal")
+        self._rotated = path.with_name(f"{path.name}.journal.old")
+        self._records: dict[str, r.Record] = {}
+        self._file: BinaryIO | None = None
+        self._size = 0
+        self._count = 0
+        self._unsynced = False
+        self._compaction: Thread | None = None
+
+    @property
+    def file(self) -> BinaryIO:
+        """Opened journal file."""
+        if self._file is None:
+            message = "Backend is not open."
+            raise RuntimeError(message)
+
+        return self._file
+
+    def _read_snapshot(self) -> dict[str, r.Record]:
+        state = self._snapshot.read()
+        return {} if state is None else r.split(state)
+
+    def _write_snapshot(self, records: Mapping[str, r.Record]) -> None:
+        # The journal is discarded after the snapshot, so it must reach the disk
+        self._snapshot.write(r.merge(records), sync=True)
+
+    def _apply(self, entry: Mapping[str, Any]) -> None:
+        for task_id, record in entry["put"].items():
+            self._records[task_id] = record
+
+        for task_id in entry["delete"]:
+            self._records.pop(task_id, None)
+
+    def _replay(self, path: Path, *, truncate: bool = True) -> int:
+        if not path.exists():
+            return 0
+
+        count = 0
+        valid = 0
+
+        with path.open("r+b" if truncate else "rb") as file:
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+
+                self._apply(entry)
+                count = count + 1
+                valid = valid + len(line)
+
+            # Drop the torn tail left by an interrupted append
+            if truncate:
+                file.truncate(valid)
+
+        return count
+
+    def _compact_in_background(self, records: Mapping[str, r.Record]) -> None:
+        self._write_snapshot(records)
+        self._rotated.unlink(missing_ok=True)
+
+    def _compact(self) -> None:
+        if self._compaction is not None and self._compaction.is_alive():
+            return
+
+        self.sync()
+
+        # If the previous compaction failed, its journal is still waiting to be
+        # covered by a snapshot, so don't overwrite it and just retry instead
+        if not self._rotated.exists():
+            self.file.close()
+            self._journal.replace(self._rotated)
+            self._file = self._journal.open("ab")
+            self._size = 0
+            self._count = 0
+
+        # Records keep changing while the snapshot is written, so they are copied
+        self._compaction = Thread(
+            target=self._compact_in_background,
+            args=(dict(self._records),),
+            daemon=True,
+        )
+        self._compaction.start()
+
+    @override
+    def open(self, *, read_only: bool = False) -> None:
+        self._records = self._read_snapshot()
+        self._replay(self._rotated, truncate=not read_only)
+        self._count = self._replay(self._journal, truncate=not read_only)
+
+        # Without an opened journal, nothing is written on close either
+        if read_only:
+            return
+
+        if self._rotated.exists():
+            self._write_snapshot(self._records)
+            self._rotated.unlink()
+
+        self._file = self._journal.open("ab")
+        self._size = self._file.tell()
+
+    @override
+    def close(self) -> None:
+        if self._compaction is not None:
+            self._compaction.join()
+            self._compaction = None
+
+        if self._file is None:
+            return
+
+        self._file.close()
+        self._file = None
+
+        if self._count > 0 or self._rotated.exists():
+            self._write_snapshot(self._records)
+            self._rotated.unlink(missing_ok=True)
+            self._journal.unlink(missing_ok=True)
+
+    @override
+    def load(self) -> s.State | None:
+        if not self._records:
+            return None
+
+        return r.merge(self._records)
+
+    @override
+    def save(self, state: s.State, changed: AbstractSet[str] | None = None) -> None:
+        # Only changed tasks are looked at when they are known
+        if changed is None:
+            put, removed = r.diff(self._records, r.split(state))
+        else:
+            put, removed = r.extract(state, changed)
+            removed = removed & self._records.keys()
+
+        if not put and not removed:
+            return
+
+        entry = {"put": put, "delete": sorted(removed)}
+        line = json.dumps(entry, separators=(",", ":")).encode() + b"\n"
+
+        try:
+            self.file.write(line)
+            self.file.flush()
+
+            if self._durability == StoreDurability.ALWAYS:
+                os.fsync(self.file.fileno())
+            else:
+                self._unsynced = True
+        except OSError:
+            # Don't leave a partial entry that would hide later ones on replay
+            self.file.truncate(self._size)
+            raise
+
+        self._records.update(put)
+        for task_id in removed:
+            del self._records[task_id]
+
+        self._size = self._size + len(line)
+        self._count = self._count + 1
+
+        if self._size >= self._config.size or self._count >= self._config.records:
+            self._compact()
+
+    @override
+    def sync(self) -> None:
+        if self._unsynced and self._file is not None:
+            os.fsync(self._file.fileno())
+            self._unsynced = False
+
+    @override
+    def compact(self) -> None:
+        if self._compaction is not None:
+            self._compaction.join()
+            self._compaction = None
+
+        if self._count == 0 and not self._rotated.exists():
+            return
+
+        self._write_snapshot(self._records)
+        self._rotated.unlink(missing_ok=True)
+
+        self.file.truncate(0)
+        self._size = 0
+        self._count = 0
+        self._unsynced = False
@@ -0,0 +1,142 @@
+from collections.abc import Iterable, Mapping
+from collections.abc import Set as AbstractSet
+from typing import Any, cast
+
+from pyscheduler.models.data import storage as s
+
+type Record = dict[str, Any]
+
+BUCKETS = (
+    "queued",
+    "waiting",
+    "sleeping",
+    "running",
+    "cancelled",
+    "failed",
+    "completed",
+)
+
+RELATIONSHIPS = ("dependents", "dependencies")
+
+
+def split(state: s.State) -> dict[str, Record]:
+    """Split the state into records of individual tasks."""
+    data = cast("Mapping[str, Any]", state)
+    records: dict[str, Record] = {}
+
+    for bucket, tasks in data["tasks"].items():
+        for task_id, task in tasks.items():
+            records.setdefault(task_id, {})["bucket"] = bucket
+            records[task_id]["task"] = task
+
+    for task_id, status in data["statuses"].items():
+        records.setdefault(task_id, {})["status"] = status
+
+    for name, relationships in data["relationships"].items():
+        for task_id, ids in relationships.items():
+            records.setdefault(task_id, {})[name] = ids
+
+    return records
+
+
+def merge(records: Mapping[str, Record]) -> s.State:
+    """Merge records of individual tasks into the state."""
+    tasks: dict[str, dict[str, Any]] = {bucket: {} for bucket in BUCKETS}
+    statuses: dict[str, Any] = {}
+    relationships: dict[str, dict[str, Any]] = {name: {} for name in RELATIONSHIPS}
+
+    for task_id, record in records.items():
+        if "task" in record:
+            tasks.setdefault(record["bucket"], {})[task_id] = record["task"]
+
+        if "status" in record:
+            statuses[task_id] = record["status"]
+
+        for name in RELATIONSHIPS:
+            if name in record:
+                relationships[name][task_id] = record[name]
+
+    state = {"tasks": tasks, "statuses": statuses, "relationships": relationships}
+    return cast("s.State", state)
+
+
+def diff(
+    old: Mapping[str, Record], new: Mapping[str, Record]
+) -> tuple[dict[str, Record], AbstractSet[str]]:
+    """Find records that were changed or removed between two sets of records."""
+    changed = {
+        task_id: record for task_id, record in new.items() if old.get(task_id) != record
+    }
+    removed = old.keys() - new.keys()
+
+    return changed, removed
+
+
+def _compare(old: Mapping[str, Any], new: Mapping[str, Any], changed: set[str]) -> None:
+    changed.update(old.keys() ^ new.keys())
+
+    # Unchanged values are usually shared, so they are compared by identity first
+    changed.update(
+        key
+        for key, value in new.items()
+        if key in old and old[key] is not value and old[key] != value
+    )
+
+
+def changes(old: s.State, new: s.State) -> set[str]:
+    """Find identifiers of tasks whose records differ between two states."""
+    old_data = cast("Mapping[str, Any]", old)
+    new_data = cast("Mapping[str, Any]", new)
+    changed: set[str] = set()
+
+    for bucket in old_data["tasks"].keys() | new_data["tasks"].keys():
+        _compare(
+            old_data["tasks"].get(bucket, {}),
+            new_data["tasks"].get(bucket, {}),
+            changed,
+        )
+
+    _compare(old_data["statuses"], new_data["statuses"], changed)
+
+    for name in RELATIONSHIPS:
+        _compare(
+            old_data["relationships"].get(name, {}),
+            new_data["relationships"].get(name, {}),
+            changed,
+        )
+
+    return changed
+
+
+def extract(
+    state: s.State, ids: Iterable[str]
+) -> tuple[dict[str, Record], AbstractSet[str]]:
+    """Extract records of tasks with given identifiers from the state.
+
+    Tasks that are not in the state are returned as removed.
+    """
+    data = cast("Mapping[str, Any]", state)
+    records: dict[str, Record] = {}
+    removed: set[str] = set()
+
+    for task_id in ids:
+        record: Record = {}
+
+        for bucket, tasks in data["tasks"].items():
+            if task_id in tasks:
+                record["bucket"] = bucket
+                record["task"] = tasks[task_id]
+
+        if task_id in data["statuses"]:
+            record["status"] = data["statuses"][task_id]
+
+        for name, relationships in data["relationships"].items():
+            if task_id in relationships:
+                record[name] = relationships[task_id]
+
+        if record:
+            records[task_id] = record
+        else:
+            removed.add(task_id)
+
+    return records, removed
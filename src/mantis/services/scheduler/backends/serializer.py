@@ -0,0 +1,152 @@
+import gzip
+import json
+import lzma
+import struct
+import zlib
+
+import msgspec
+from pyscheduler.models.data import storage as s
+
+from mantis.config.models import (
+    StoreSerializerCompression,
+    StoreSerializerConfig,
+    StoreSerializerFormat,
+)
+
+# Magic bytes, version, format, compression and checksum of the payload
+HEADER = struct.Struct(">4sBBBI")
+
+# Can't be confused with the beginning of a plain JSON document
+MAGIC = b"\x89MNS"
+
+VERSION = 1
+
+FORMATS = {
+    StoreSerializerFormat.JSON: 1,
+    StoreSerializerFormat.MSGPACK: 2,
+}
+
+COMPRESSIONS = {
+    StoreSerializerCompression.NONE: 0,
+    StoreSerializerCompression.GZIP: 1,
+    StoreSerializerCompression.LZMA: 2,
+}
+
+
+class Serializer:
+    """Serializer for state to bytes.
+
+    Plain JSON is written without a header, so it stays readable and compatible.
+    Other formats start with a header that is used to detect them when loading,
+    so the state can be read regardless of the current configuration.
+
+    Args:
+        config: Configuration for the serializer.
+
+    """
+
+    def __init__(self, config: StoreSerializerConfig) -> None:
+        self._config = config
+        self._encoder = msgspec.msgpack.Encoder()
+        self._decoder = msgspec.msgpack.Decoder()
+
+    def _encode(self, value: s.State, encoding: StoreSerializerFormat) -> bytes:
+        match encoding:
+            case StoreSerializerFormat.JSON:
+                return json.dumps(value, separators=(",", ":")).encode()
+            case StoreSerializerFormat.MSGPACK:
+                return self._encoder.encode(value)
+
+    def _decode(self, value: bytes, encoding: StoreSerializerFormat) -> s.State:
+        match encoding:
+            case StoreSerializerFormat.JSON:
+                return json.loads(value)
+            case StoreSerializerFormat.MSGPACK:
+                try:
+                    return self._decoder.decode(value)
+                except msgspec.DecodeError as ex:
+                    raise ValueError(str(ex)) from ex
+
+    def _compress(self, value: bytes, compression: StoreSerializerCompression) -> bytes:
+        match compression:
+            case StoreSerializerCompression.NONE:
+                return value
+            case StoreSerializerCompression.GZIP:
+                return gzip.compress(value, compresslevel=6, mtime=0)
+            case StoreSerializerCompression.LZMA:
+                return lzma.compress(value)
+
+    def _decompress(
+        self, value: bytes, compression: StoreSerializerCompression
+    ) -> bytes:
+        try:
+            match compression:
+                case StoreSerializerCompression.NONE:
+                    return value
+                case StoreSerializerCompression.GZIP:
+                    return gzip.decompress(value)
+                case StoreSerializerCompression.LZMA:
+                    return lzma.decompress(value)
+        except (OSError, EOFError, lzma.LZMAError) as ex:
+            raise ValueError(str(ex)) from ex
+
+    def _parse_header(
+        self, value: bytes
+    ) -> tuple[StoreSerializerFormat, StoreSerializerCompression, bytes]:
+        if len(value) < HEADER.size:
+            message = "Truncated header."
+            raise ValueError(message)
+
+        _, version, format_code, compression_code, checksum = HEADER.unpack_from(value)
+        payload = value[HEADER.size :]
+
+        if version != VERSION:
+            message = f"Unsupported version: {version}."
+            raise ValueError(message)
+
+        formats = {code: encoding for encoding, code in FORMATS.items()}
+        compressions = {code: method for method, code in COMPRESSIONS.items()}
+
+        if format_code not in formats or compression_code not in compressions:
+            message = "Unsupported format or compression."
+            raise ValueError(message)
+
+        if zlib.crc32(payload) != checksum:
+            message = "Checksum mismatch."
+            raise ValueError(message)
+
+        return formats[format_code], compressions[compression_code], payload
+
+    def serialize(self, value: s.State) -> bytes:
+        """Serialize the state."""
+        encoding = self._config.format
+        compression = self._config.compression
+
+        data = self._encode(value, encoding)
+
+        if (
+            encoding == StoreSerializerFormat.JSON
+            and compression == StoreSerializerCompression.NONE
+        ):
+            return data
+
+        payload = self._compress(data, compression)
+        header = HEADER.pack(
+            MAGIC,
+            VERSION,
+            FORMATS[encoding],
+            COMPRESSIONS[compression],
+            zlib.crc32(payload),
+        )
+
+        return header + payload
+
+    def deserialize(self, value: bytes) -> s.State:
+        """Deserialize the state."""
+        if not value.startswith(MAGIC):
+            return self._decode(value, StoreSerializerFormat.JSON)
+
+        encoding, compression, payload = self._parse_header(value)
+        data = self._decompress(payload, compression)
+
+        return self._decode(data, encoding)
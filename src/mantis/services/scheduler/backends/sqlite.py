@@ -0,0 +1,285 @@
+import json
+import sqlite3
+from collections.abc import Iterable, Mapping
+from collections.abc import Set as AbstractSet
+from pathlib import Path
+from typing import override
+
+from pyscheduler.models.data import storage as s
+
+from mantis.config.models import StoreDurability
+from mantis.services.scheduler.backends import records as r
+from mantis.services.scheduler.backends.backend import Backend
+from mantis.services.scheduler.backends.serializer import Serializer
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    bucket TEXT NOT NULL,
+    type TEXT,
+    data TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS tasks_bucket ON tasks (bucket);
+
+CREATE INDEX IF NOT EXISTS tasks_type ON tasks (type);
+
+CREATE TABLE IF NOT EXISTS statuses (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS statuses_status ON statuses (status);
+
+CREATE TABLE IF NOT EXISTS relationships (
+    name TEXT NOT NULL,
+    id TEXT NOT NULL,
+    ids TEXT NOT NULL,
+    PRIMARY KEY (name, id)
+);
+"""
+
+VERSION = 1
+
+
+class SQLiteBackend(Backend):
+    """Backend that keeps tasks in rows of an embedded SQLite database."""
+
+    def __init__(
+        self,
+        path: Path,
+        source: Path,
+        durability: StoreDurability,
+        serializer: Serializer,
+    ) -> None:
+        self._path = path
+        self._source = source
+        self._durability = durability
+        self._serializer = serializer
+        self._connection: sqlite3.Connection | None = None
+        self._records: dict[str, r.Record] = {}
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Opened database connection."""
+        if self._connection is None:
+            message = "Backend is not open."
+            raise RuntimeError(message)
+
+        return self._connection
+
+    def _get_type(self, record: r.Record) -> str | None:
+        try:
+            return record["task"]["task"]["operation"]["type"]
+        except (KeyError, TypeError):
+            return None
+
+    def _delete(self, ids: Iterable[str]) -> None:
+        parameters = [(task_id,) for task_id in ids]
+
+        self.connection.executemany("DELETE FROM tasks WHERE id = ?", parameters)
+        self.connection.executemany("DELETE FROM statuses WHERE id = ?", parameters)
+        self.connection.executemany(
+            "DELETE FROM relationships WHERE id = ?", parameters
+        )
+
+    def _upsert(self, records: Mapping[str, r.Record]) -> None:
+        self.connection.executemany(
+            "DELETE FROM tasks WHERE id = ?",
+            [(task_id,) for task_id, record in records.items() if "task" not in record],
+        )
+        self.connection.executemany(
+            """
+            INSERT INTO tasks (id, bucket, type, data) VALUES (?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                bucket = excluded.bucket,
+                type = excluded.type,
+                data = excluded.data
+            """,
+            [
+                (
+                    task_id,
+                    record["bucket"],
+                    self._get_type(record),
+                    json.dumps(record["task"], separators=(",", ":")),
+                )
+                for task_id, record in records.items()
+                if "task" in record
+            ],
+        )
+
+        self.connection.executemany(
+            "DELETE FROM statuses WHERE id = ?",
+            [
+                (task_id,)
+                for task_id, record in records.items()
+                if "status" not in record
+            ],
+        )
+        self.connection.executemany(
+            """
+            INSERT INTO statuses (id, status) VALUES (?, ?)
+            ON CONFLICT (id) DO UPDATE SET status = excluded.status
+            """,
+            [
+                (task_id, record["status"])
+                for task_id, record in records.items()
+                if "status" in record
+            ],
+        )
+
+        for name in r.RELATIONSHIPS:
+            self.connection.executemany(
+                "DELETE FROM relationships WHERE name = ? AND id = ?",
+                [
+                    (name, task_id)
+                    for task_id, record in records.items()
+                    if name not in record
+                ],
+            )
+            self.connection.executemany(
+                """
+                INSERT INTO relationships (name, id, ids) VALUES (?, ?, ?)
+                ON CONFLICT (name, id) DO UPDATE SET ids = excluded.ids
+                """,
+                [
+                    (name, task_id, json.dumps(record[name], separators=(",", ":")))
+                    for task_id, record in records.items()
+                    if name in record
+                ],
+            )
+
+    def _write(
+        self, changed: Mapping[str, r.Record], removed: AbstractSet[str]
+    ) -> None:
+        with self.connection:
+            self._delete(removed)
+            self._upsert(changed)
+
+    def _read(self) -> dict[str, r.Record]:
+        records: dict[str, r.Record] = {}
+
+        for task_id, bucket, data in self.connection.execute(
+            "SELECT id, bucket, data FROM tasks ORDER BY rowid"
+        ):
+            records[task_id] = {"bucket": bucket, "task": json.loads(data)}
+
+        for task_id, status in self.connection.execute(
+            "SELECT id, status FROM statuses ORDER BY rowid"
+        ):
+            records.setdefault(task_id, {})["status"] = status
+
+        for name, task_id, ids in self.connection.execute(
+            "SELECT name, id, ids FROM relationships ORDER BY rowid"
+        ):
+            records.setdefault(task_id, {})[name] = json.loads(ids)
+
+        return records
+
+    def _read_source(self) -> dict[str, r.Record]:
+        if not self._source.exists():
+            return {}
+
+        data = self._source.read_bytes()
+
+        if not data:
+            return {}
+
+        return r.split(self._serializer.deserialize(data))
+
+    def _import(self) -> None:
+        records = self._read_source()
+
+        if records:
+            self._write(records, set())
+
+    def _initialize(self) -> None:
+        (version,) = self.connection.execute("PRAGMA user_version").fetchone()
+
+        if version >= VERSION:
+            return
+
+        self.connection.executescript(SCHEMA)
+
+        # Import the state once when the database is created
+        if version == 0:
+            self._import()
+
+        self.connection.execute(f"PRAGMA user_version = {VERSION}")
+
+    def _open_read_only(self) -> None:
+        if not self._path.exists():
+            # The state would be imported from the source when creating the database
+            self._records = self._read_source()
+            return
+
+        self._connection = sqlite3.connect(
+            f"{self._path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+        )
+
+        (version,) = self.connection.execute("PRAGMA user_version").fetchone()
+        self._records = self._read() if version >= VERSION else self._read_source()
+
+    @override
+    def open(self, *, read_only: bool = False) -> None:
+        if read_only:
+            self._open_read_only()
+            return
+
+        self._connection = sqlite3.connect(
+            self._path, check_same_thread=False, isolation_level="DEFERRED"
+        )
+        self._connection.execute("PRAGMA journal_mode = WAL")
+
+        # In WAL mode, NORMAL syncs only on checkpoints, but stays consistent
+        match self._durability:
+            case StoreDurability.ALWAYS:
+                self._connection.execute("PRAGMA synchronous = FULL")
+            case StoreDurability.BATCHED | StoreDurability.ON_SHUTDOWN:
+                self._connection.execute("PRAGMA synchronous = NORMAL")
+
+        self._initialize()
+        self._records = self._read()
+
+    @override
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    @override
+    def load(self) -> s.State | None:
+        if not self._records:
+            return None
+
+        return r.merge(self._records)
+
+    @override
+    def save(self, state: s.State, changed: AbstractSet[str] | None = None) -> None:
+        # Only changed tasks are looked at when they are known
+        if changed is None:
+            put, removed = r.diff(self._records, r.split(state))
+        else:
+            put, removed = r.extract(state, changed)
+            removed = removed & self._records.keys()
+
+        if not put and not removed:
+            return
+
+        self._write(put, removed)
+
+        self._records.update(put)
+        for task_id in removed:
+            del self._records[task_id]
+
+    @override
+    def sync(self) -> None:
+        if self._connection is not None:
+            self._connection.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    @override
+    def compact(self) -> None:
+        self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self.connection.execute("VACUUM")
@@ -1,13 +1,21 @@
+from datetime import datetime
 from typing import override
 
 from pyscheduler.models import transfer as t
 from pyscheduler.models import types
-from pyscheduler.protocols import cleaning as c
 
+from mantis.services.scheduler.cleaning.strategies.timed import TimedCleaningStrategy
 
-class AllCleaningStrategy(c.CleaningStrategy):
+
+class AllCleaningStrategy(TimedCleaningStrategy):
     """Cleaning strategy that cleans all tasks."""
 
+    @override
+    async def evaluate_finished(
+        self, finished: datetime, parameters: dict[str, types.JSON]
+    ) -> bool:
+        return True
+
     @override
     async def evaluate(
         self, task: t.FinishedTask, parameters: dict[str, types.JSON]
@@ -0,0 +1,37 @@
+from abc import abstractmethod
+from datetime import datetime
+from typing import override
+
+from pyscheduler.models import transfer as t
+from pyscheduler.models import types
+from pyscheduler.protocols import cleaning as c
+
+
+class TimedCleaningStrategy(c.CleaningStrategy):
+    """Base class for cleaning strategies that look only at finishing times.
+
+    Archived tasks can be evaluated without reading their records,
+    because times at which they finished are kept in the index.
+    """
+
+    @abstractmethod
+    async def evaluate_finished(
+        self, finished: datetime, parameters: dict[str, types.JSON]
+    ) -> bool:
+        """Evaluate a task that finished at the given time in UTC."""
+
+    @override
+    async def evaluate(
+        self, task: t.FinishedTask, parameters: dict[str, types.JSON]
+    ) -> bool:
+        match task:
+            case t.CancelledTask(cancelled=cancelled):
+                finished = cancelled
+            case t.FailedTask(failed=failed):
+                finished = failed
+            case t.CompletedTask(completed=completed):
+                finished = completed
+            case _:
+                return False
+
+        return await self.evaluate_finished(finished, parameters)
@@ -1,11 +1,10 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import override
 
-from pyscheduler.models import transfer as t
 from pyscheduler.models import types
-from pyscheduler.protocols import cleaning as c
 
 from mantis.models.base import SerializableModel
+from mantis.services.scheduler.cleaning.strategies.timed import TimedCleaningStrategy
 from mantis.utils.time import naiveutcnow
 
 
@@ -16,27 +15,17 @@ class Parameters(SerializableModel):
     """Time delta after which the task should be cleaned."""
 
 
-class TimedeltaCleaningStrategy(c.CleaningStrategy):
+class TimedeltaCleaningStrategy(TimedCleaningStrategy):
     """Cleaning strategy that cleans tasks after a certain amount of time."""
 
     def _parse_parameters(self, parameters: dict[str, types.JSON]) -> Parameters:
         return Parameters.model_validate(parameters)
 
     @override
-    async def evaluate(
-        self, task: t.FinishedTask, parameters: dict[str, types.JSON]
+    async def evaluate_finished(
+        self, finished: datetime, parameters: dict[str, types.JSON]
     ) -> bool:
         params = self._parse_parameters(parameters)
 
-        match task:
-            case t.CancelledTask(cancelled=cancelled):
-                finished = cancelled
-            case t.FailedTask(failed=failed):
-                finished = failed
-            case t.CompletedTask(completed=completed):
-                finished = completed
-            case _:
-                return False
-
         now = naiveutcnow()
         return (now - finished) > params.delta
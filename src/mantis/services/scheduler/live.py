@@ -0,0 +1,148 @@
+from collections.abc import Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from typing import Any, cast
+from uuid import UUID
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pyscheduler.models.data import storage as s
+
+from mantis.services.scheduler.models import transfer as t
+
+UNFINISHED = ("queued", "waiting", "sleeping", "running")
+
+
+class LiveTasks:
+    """Read access to unfinished tasks indexed by type of operation.
+
+    The index is rebuilt lazily from unfinished tasks only,
+    at most once per change of the state.
+
+    Tasks are validated only when their status changes,
+    and parameters of their operations, which never change, only once.
+    Both are kept while the task is unfinished.
+    """
+
+    def __init__(self) -> None:
+        self._generic = TypeAdapter(t.GenericTask)
+        self._state: Mapping[str, Any] | None = None
+        self._index: dict[str, list[tuple[str, str]]] | None = None
+        self._ids: set[str] = set()
+        self._tasks: dict[str, tuple[Any, t.GenericTask]] = {}
+        self._parameters: dict[str, dict[type[BaseModel], BaseModel | None]] = {}
+
+    def _get_operation(self, task: Mapping[str, Any]) -> str | None:
+        try:
+            return task["task"]["operation"]["type"]
+        except (KeyError, TypeError):
+            return None
+
+    def _build(self) -> dict[str, list[tuple[str, str]]]:
+        index: dict[str, list[tuple[str, str]]] = {}
+        ids: set[str] = set()
+
+        if self._state is not None:
+            tasks = self._state["tasks"]
+
+            for bucket in UNFINISHED:
+                ids.update(tasks[bucket])
+
+                for task_id, task in tasks[bucket].items():
+                    operation = self._get_operation(task)
+                    if operation is not None:
+                        index.setdefault(operation, []).append((bucket, task_id))
+
+        # Only tasks that are not unfinished anymore are dropped from the caches
+        for task_id in self._ids - ids:
+            self._tasks.pop(task_id, None)
+            self._parameters.pop(task_id, None)
+
+        self._ids = ids
+
+        return index
+
+    def _validate(
+        self, task_id: str, task: Mapping[str, Any], status: Any
+    ) -> t.GenericTask:
+        cached = self._tasks.get(task_id)
+
+        # Stored task data is immutable, so only the status can change
+        if cached is not None and cached[0] == status:
+            return cached[1]
+
+        generic = self._generic.validate_python({"task": task, "status": status})
+        self._tasks[task_id] = (status, generic)
+
+        return generic
+
+    def _parse[P: BaseModel](
+        self, task_id: str, task: Mapping[str, Any], model: type[P]
+    ) -> P | None:
+        parsed = self._parameters.setdefault(task_id, {})
+
+        if model not in parsed:
+            try:
+                parameters = model.model_validate(task["operation"]["parameters"])
+            except ValidationError:
+                parameters = None
+
+            parsed[model] = parameters
+
+        return cast("P | None", parsed[model])
+
+    def _get_index(self) -> dict[str, list[tuple[str, str]]]:
+        if self._index is None:
+            self._index = self._build()
+
+        return self._index
+
+    def update(self, state: s.State) -> None:
+        """Invalidate the index after the state has changed."""
+        self._state = cast("Mapping[str, Any]", state)
+        self._index = None
+
+    async def list(self, operation_type: str) -> AbstractSet[UUID]:
+        """List unfinished tasks with the given type of operation."""
+        return {
+            UUID(task_id) for _, task_id in self._get_index().get(operation_type, [])
+        }
+
+    async def get(self, operation_type: str) -> Sequence[t.GenericTask]:
+        """Get all unfinished tasks with the given type of operation at once."""
+        entries = self._get_index().get(operation_type, [])
+
+        if self._state is None or not entries:
+            return []
+
+        tasks = self._state["tasks"]
+        statuses = self._state["statuses"]
+
+        return [
+            self._validate(task_id, tasks[bucket][task_id]["task"], statuses[task_id])
+            for bucket, task_id in entries
+        ]
+
+    async def get_with_parameters[P: BaseModel](
+        self, operation_type: str, model: type[P]
+    ) -> Sequence[tuple[t.GenericTask, P | None]]:
+        """Get all unfinished tasks with the given type of operation at once.
+
+        Each task comes with parameters of its operation parsed with the model,
+        or None if they are not valid.
+        """
+        entries = self._get_index().get(operation_type, [])
+
+        if self._state is None or not entries:
+            return []
+
+        tasks = self._state["tasks"]
+        statuses = self._state["statuses"]
+
+        return [
+            (
+                self._validate(
+                    task_id, task := tasks[bucket][task_id]["task"], statuses[task_id]
+                ),
+                self._parse(task_id, task, model),
+            )
+            for bucket, task_id in entries
+        ]
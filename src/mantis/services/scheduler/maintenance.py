@@ -0,0 +1,284 @@
+import heapq
+import itertools
+import json
+from collections import Counter
+from collections.abc import Generator, Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+from uuid import UUID
+
+from mantis.config.models import Config
+from mantis.models.base import datamodel
+from mantis.services.scheduler.archive import tiering
+from mantis.services.scheduler.archive.segments import Segments
+from mantis.services.scheduler.backends import records as r
+from mantis.services.scheduler.backends.backend import Backend
+from mantis.services.scheduler.backends.factory import BackendFactory
+from mantis.utils.time import naiveutcnow
+
+# Number of archived records read at once
+CHUNK = 1000
+
+
+@datamodel
+class TaskSize:
+    """Size of a stored task."""
+
+    id: UUID
+    """Identifier of the task."""
+
+    status: str
+    """Status of the task."""
+
+    archived: bool
+    """Whether the task is archived."""
+
+    size: int
+    """Size of the task serialized to JSON in bytes."""
+
+
+@datamodel
+class StoreStats:
+    """Statistics of the stored state."""
+
+    statuses: Mapping[str, int]
+    """Number of tasks by status."""
+
+    operations: Mapping[str, int]
+    """Number of tasks by type of operation."""
+
+    state: int
+    """Size of the hot state serialized to JSON in bytes."""
+
+    archive: int
+    """Size of the archive on disk in bytes."""
+
+    largest: Sequence[TaskSize]
+    """Largest tasks, from the largest one."""
+
+
+@datamodel
+class CompactionResult:
+    """Result of compacting the store."""
+
+    archived: int
+    """Number of tasks moved from the hot state to the archive."""
+
+    reclaimed: int
+    """Number of bytes reclaimed from the archive."""
+
+
+class StoreMaintenance:
+    """Offline maintenance of the store.
+
+    Statistics and exports only read the store. Other operations modify it,
+    so the store must not be used by a running service at the same time.
+
+    Args:
+        config: Config object.
+
+    """
+
+    def __init__(self, config: Config) -> None:
+        self._config = config
+
+    @contextmanager
+    def _open(self, *, read_only: bool = False) -> Generator[tuple[Backend, Segments]]:
+        config = self._config.store
+        backend = BackendFactory().create(config)
+        segments = Segments(
+            config=config.archive,
+            durability=config.durability.level,
+            path=config.archive_path,
+        )
+
+        segments.open(read_only=read_only)
+
+        try:
+            backend.open(read_only=read_only)
+
+            try:
+                yield backend, segments
+            finally:
+                backend.close()
+        finally:
+            segments.close()
+
+    def _iterate_archived(self, segments: Segments) -> Generator[tuple[str, r.Record]]:
+        ids = list(segments.list().keys())
+
+        for start in range(0, len(ids), CHUNK):
+            records = segments.get_many(ids[start : start + CHUNK])
+
+            for task_id, record in records.items():
+                yield str(task_id), record
+
+    def _get_operation(self, record: r.Record) -> str | None:
+        try:
+            return record["task"]["task"]["operation"]["type"]
+        except (KeyError, TypeError):
+            return None
+
+    def _get_size(self, record: r.Record) -> int:
+        return len(json.dumps(record, separators=(",", ":")))
+
+    def stats(self, limit: int = 10) -> StoreStats:
+        """Compute statistics of the stored state."""
+        statuses: Counter[str] = Counter()
+        operations: Counter[str] = Counter()
+        # Heap of the largest tasks found so far, with the smallest one on top
+        largest: list[tuple[int, str, str, bool]] = []
+
+        with self._open(read_only=True) as (backend, segments):
+            state = backend.load()
+            hot = {} if state is None else r.split(state)
+
+            def items() -> Generator[tuple[str, r.Record, bool]]:
+                for task_id, record in hot.items():
+                    yield task_id, record, False
+
+                for task_id, record in self._iterate_archived(segments):
+                    yield task_id, record, True
+
+            for task_id, record, archived in items():
+                if "task" not in record:
+                    continue
+
+                statuses[record["bucket"]] += 1
+
+                operation = self._get_operation(record)
+                if operation is not None:
+                    operations[operation] += 1
+
+                item = (self._get_size(record), task_id, record["bucket"], archived)
+
+                if len(largest) < limit:
+                    heapq.heappush(largest, item)
+                elif largest and item > largest[0]:
+                    heapq.heapreplace(largest, item)
+
+            return StoreStats(
+                statuses=dict(statuses),
+                operations=dict(operations),
+                state=0 if state is None else self._get_size(state),
+                archive=segments.size,
+                largest=[
+                    TaskSize(
+                        id=UUID(task_id), status=bucket, archived=archived, size=size
+                    )
+                    for size, task_id, bucket, archived in sorted(largest, reverse=True)
+                ],
+            )
+
+    def compact(self) -> CompactionResult:
+        """Move finished tasks to the archive and reclaim unused space."""
+        with self._open() as (backend, segments):
+            state = backend.load()
+            archived = 0
+
+            if state is not None and self._config.store.archive.enabled:
+                cutoff = naiveutcnow() - self._config.store.archive.delay
+                hot, records = tiering.split(state, cutoff)
+
+                if records:
+                    segments.add(records)
+                    segments.flush()
+                    backend.save(hot)
+                    archived = len(records)
+
+            before = segments.size
+            segments.compact()
+            backend.compact()
+
+            segments.sync()
+            backend.sync()
+
+            return CompactionResult(
+                archived=archived, reclaimed=max(before - segments.size, 0)
+            )
+
+    def purge(self, older_than: timedelta) -> AbstractSet[UUID]:
+        """Remove tasks that finished longer ago than the given time."""
+        cutoff = naiveutcnow() - older_than
+
+        with self._open() as (backend, segments):
+            # Tasks with an unknown finishing time are treated as old,
+            # the same way as when they are archived
+            removed = {
+                task_id
+                for task_id, finished in segments.list_finished().items()
+                if finished is None or finished < cutoff
+            }
+            segments.remove(removed)
+
+            state = backend.load()
+
+            if state is not None:
+                # Tasks are split off the same way as when they are archived,
+                # so ones that unfinished tasks still refer to are kept
+                hot, records = tiering.split(state, cutoff)
+
+                if records:
+                    backend.save(hot)
+                    removed.update(UUID(task_id) for task_id in records)
+
+            segments.sync()
+            backend.sync()
+
+        return removed
+
+    def export_snapshot(self, path: Path) -> int:
+        """Export all stored tasks as newline-delimited JSON."""
+        count = 0
+
+        with self._open(read_only=True) as (backend, segments), path.open("w") as file:
+            state = backend.load()
+            hot = {} if state is None else r.split(state)
+
+            for task_id, record in itertools.chain(
+                hot.items(), self._iterate_archived(segments)
+            ):
+                file.write(json.dumps({"id": task_id, **record}) + "\n")
+                count = count + 1
+
+        return count
+
+    def import_snapshot(self, path: Path) -> int:
+        """Replace all stored tasks with ones from newline-delimited JSON."""
+        records: dict[str, r.Record] = {}
+
+        with path.open() as file:
+            for line in file:
+                if not line.strip():
+                    continue
+
+                record = json.loads(line)
+                records[record.pop("id")] = record
+
+        state = r.merge(records)
+
+        with self._open() as (backend, segments):
+            old = segments.list().keys()
+            archived: dict[str, r.Record] = {}
+
+            if self._config.store.archive.enabled:
+                cutoff = naiveutcnow() - self._config.store.archive.delay
+                state, archived = tiering.split(state, cutoff)
+
+            # Nothing is dropped until all imported tasks are on disk,
+            # so an interruption can't lose both the old and the new ones
+            segments.add(archived)
+            segments.flush()
+            segments.sync()
+
+            backend.save(state)
+            backend.sync()
+
+            segments.remove(
+                [task_id for task_id in old if str(task_id) not in archived]
+            )
+            segments.sync()
+
+        return len(records)
@@ -0,0 +1,91 @@
+from datetime import timedelta
+
+from mantis.models.base import datamodel
+
+
+@datamodel
+class LatencyMetrics:
+    """Metrics of the latency of state commits."""
+
+    last: timedelta
+    """Latency of the last commit."""
+
+    mean: timedelta
+    """Mean latency of all commits."""
+
+    max: timedelta
+    """Maximum latency of all commits."""
+
+
+@datamodel
+class BatchMetrics:
+    """Metrics of the number of changes in state commits."""
+
+    last: int
+    """Number of changes in the last commit."""
+
+    mean: float
+    """Mean number of changes in all commits."""
+
+    max: int
+    """Maximum number of changes in all commits."""
+
+
+@datamodel
+class CommitMetrics:
+    """Metrics of state commits."""
+
+    commits: int
+    """Number of commits."""
+
+    changes: int
+    """Number of changes in all commits."""
+
+    latency: LatencyMetrics
+    """Metrics of the latency of commits."""
+
+    batch: BatchMetrics
+    """Metrics of the number of changes in commits."""
+
+
+class CommitMetricsCollector:
+    """Collector of metrics of state commits."""
+
+    def __init__(self) -> None:
+        self._commits = 0
+        self._changes = 0
+        self._latency_last = timedelta()
+        self._latency_total = timedelta()
+        self._latency_max = timedelta()
+        self._batch_last = 0
+        self._batch_max = 0
+
+    def record(self, latency: timedelta, changes: int) -> None:
+        """Record a commit."""
+        self._commits = self._commits + 1
+        self._changes = self._changes + changes
+        self._latency_last = latency
+        self._latency_total = self._latency_total + latency
+        self._latency_max = max(self._latency_max, latency)
+        self._batch_last = changes
+        self._batch_max = max(self._batch_max, changes)
+
+    @property
+    def metrics(self) -> CommitMetrics:
+        """Collected metrics."""
+        commits = max(self._commits, 1)
+
+        return CommitMetrics(
+            commits=self._commits,
+            changes=self._changes,
+            latency=LatencyMetrics(
+                last=self._latency_last,
+                mean=self._latency_total / commits,
+                max=self._latency_max,
+            ),
+            batch=BatchMetrics(
+                last=self._batch_last,
+                mean=self._changes / commits,
+                max=self._batch_max,
+            ),
+        )
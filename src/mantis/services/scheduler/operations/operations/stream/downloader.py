@@ -16,6 +16,7 @@ from mantis.services.octopus import models as om
 from mantis.services.scheduler.operations.operations.stream import errors as e
 from mantis.services.scheduler.operations.operations.stream import models as m
 from mantis.utils.mime import MimeType
+from mantis.utils.pagination import Page
 from mantis.utils.time import isostringify
 
 
@@ -118,14 +119,11 @@ class ReplayDownloader(EventDownloader):
     async def _list_live_schedules(
         self, show: UUID, start: datetime, end: datetime
     ) -> Sequence[bm.Schedule]:
-        schedules: list[bm.Schedule] = []
-        offset = 0
-
-        while True:
+        async def _fetch(limit: int | None, offset: int) -> Page[bm.Schedule]:
             schedule_list_request = bm.ScheduleListRequest(
                 start=start,
                 end=end,
-                limit=None,
+                limit=limit,
                 offset=offset,
                 where={"show_id": str(show), "type": bm.EventType.live},
             )
@@ -134,15 +132,10 @@ class ReplayDownloader(EventDownloader):
                 schedule_list_request
             )
 
-            new = schedule_list_response.results.schedules
-
-            schedules = schedules + list(new)
-            offset = offset + len(new)
-
-            if offset >= schedule_list_response.results.count:
-                break
+            results = schedule_list_response.results
+            return results.schedules, results.count
 
-        return schedules
+        return await self._beaver.paginator.paginate(_fetch)
 
     async def _find_past_live_schedules(
         self, show: UUID, before: datetime
@@ -1,5 +1,5 @@
 from collections.abc import Sequence
-from datetime import UTC, datetime, timedelta
+from datetime import datetime, timedelta
 from http import HTTPStatus
 from uuid import UUID
 
@@ -8,6 +8,8 @@ from mantis.services.beaver import models as bm
 from mantis.services.beaver.service import BeaverService
 from mantis.services.scheduler.operations.operations.stream import errors as e
 from mantis.services.scheduler.operations.operations.stream import models as m
+from mantis.utils.pagination import Page
+from mantis.utils.time import naiveutcify
 
 
 class Finder:
@@ -33,14 +35,11 @@ class Finder:
     async def _list_schedules(
         self, event_id: UUID, start: datetime, end: datetime
     ) -> Sequence[bm.Schedule]:
-        schedules: list[bm.Schedule] = []
-        offset = 0
-
-        while True:
+        async def _fetch(limit: int | None, offset: int) -> Page[bm.Schedule]:
             schedule_list_request = bm.ScheduleListRequest(
                 start=start,
                 end=end,
-                limit=None,
+                limit=limit,
                 offset=offset,
                 where={"id": str(event_id)},
             )
@@ -49,25 +48,16 @@ class Finder:
                 schedule_list_request
             )
 
-            new = schedule_list_response.results.schedules
-
-            schedules = schedules + list(new)
-            offset = offset + len(new)
+            results = schedule_list_response.results
+            return results.schedules, results.count
 
-            if offset >= schedule_list_response.results.count:
-                break
-
-        return schedules
+        return await self._beaver.paginator.paginate(_fetch)
 
     async def _get_schedule(self, event_id: UUID, start: datetime) -> bm.Schedule:
         event = await self._get_event(event_id)
 
-        utcstart = (
-            start.replace(
-                hour=0, minute=0, second=0, microsecond=0, tzinfo=event.timezone
-            )
-            .astimezone(UTC)
-            .replace(tzinfo=None)
+        utcstart = naiveutcify(
+            start.replace(hour=0, minute=0, second=0, microsecond=0), event.timezone
         )
         utcend = utcstart + timedelta(days=1)
 
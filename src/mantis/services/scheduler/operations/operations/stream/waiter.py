@@ -1,8 +1,8 @@
 import asyncio
-from datetime import UTC, timedelta
+from datetime import timedelta
 
 from mantis.services.beaver import models as bm
-from mantis.utils.time import naiveutcnow
+from mantis.utils.time import naiveutcify, naiveutcnow
 
 
 class Waiter:
@@ -14,12 +14,7 @@ class Waiter:
 
     async def wait(self, delta: timedelta) -> None:
         """Wait for a time before event start."""
-        start = self._instance.start
-        start = (
-            start.replace(tzinfo=self._event.timezone)
-            .astimezone(UTC)
-            .replace(tzinfo=None)
-        )
+        start = naiveutcify(self._instance.start, self._event.timezone)
 
         target = start - delta
         now = naiveutcnow()
@@ -1,3 +1,7 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from typing import override
+
 from pyscheduler import scheduler as s
 
 from mantis.config.models import Config
@@ -5,10 +9,14 @@ from mantis.services.beaver.service import BeaverService
 from mantis.services.gecko.service import GeckoService
 from mantis.services.numbat.service import NumbatService
 from mantis.services.octopus.service import OctopusService
+from mantis.services.scheduler import errors as se
+from mantis.services.scheduler.archive.archive import Archive
 from mantis.services.scheduler.cleaning.factory import CleaningStrategyFactory
 from mantis.services.scheduler.conditions.factory import ConditionFactory
 from mantis.services.scheduler.events import EventFactory
+from mantis.services.scheduler.live import LiveTasks
 from mantis.services.scheduler.lock import Lock
+from mantis.services.scheduler.models import transfer as t
 from mantis.services.scheduler.operations.factory import OperationFactory
 from mantis.services.scheduler.queue import Queue
 from mantis.services.scheduler.store import Store
@@ -26,6 +34,12 @@ class SchedulerService(s.Scheduler):
         octopus: OctopusService,
         store: Store,
     ) -> None:
+        self._archive = store.archive
+        self._live = store.live
+        self._batch = store.batch
+        self._concurrency = config.scheduler.concurrency
+        self._cleaning = CleaningStrategyFactory()
+
         super().__init__(
             store=store,
             lock=Lock(),
@@ -39,5 +53,62 @@ class SchedulerService(s.Scheduler):
                 octopus=octopus,
             ),
             conditions=ConditionFactory(),
-            cleaning=CleaningStrategyFactory(),
+            cleaning=self._cleaning,
         )
+
+    @property
+    def archive(self) -> Archive:
+        """Archive of finished tasks."""
+        return self._archive
+
+    @property
+    def live(self) -> LiveTasks:
+        """Unfinished tasks indexed by type of operation."""
+        return self._live
+
+    async def _run_bulk[R, T](
+        self, function: Callable[[R], Awaitable[T]], requests: Sequence[R]
+    ) -> Sequence[T | se.ServiceError]:
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def _run(request: R) -> T | se.ServiceError:
+            async with semaphore:
+                try:
+                    return await function(request)
+                except se.ServiceError as ex:
+                    return ex
+
+        async with self._batch():
+            return await asyncio.gather(*(_run(request) for request in requests))
+
+    async def schedule_many(
+        self, requests: Sequence[t.ScheduleRequest]
+    ) -> Sequence[t.QueuedTask | se.ServiceError]:
+        """Schedule many tasks at once and persist them together.
+
+        Results are in the same order as requests.
+        Requests that failed have the error as their result.
+        """
+        return await self._run_bulk(self.schedule, requests)
+
+    async def cancel_many(
+        self, requests: Sequence[t.CancelRequest]
+    ) -> Sequence[t.CancelledTask | se.ServiceError]:
+        """Cancel many tasks at once and persist them together.
+
+        Results are in the same order as requests.
+        Requests that failed have the error as their result.
+        """
+        return await self._run_bulk(self.cancel, requests)
+
+    @override
+    async def clean(self, request: t.CleanRequest) -> t.CleaningResult:
+        result = await super().clean(request)
+
+        # The strategy is already validated by the scheduler
+        strategy = await self._cleaning.create(request.strategy.type)
+        if strategy is None:
+            return result
+
+        removed = await self._archive.clean(strategy, request.strategy.parameters)
+        return t.CleaningResult(removed=result.removed | removed)
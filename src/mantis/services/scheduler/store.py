@@ -1,43 +1,91 @@
-import json
+import asyncio
+import time
+from collections.abc import AsyncGenerator, Mapping
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import timedelta
 from types import TracebackType
-from typing import override
+from typing import Any, cast, override
 
 from pyscheduler.models.data import runtime as r
 from pyscheduler.models.data import storage as s
 from pyscheduler.protocols import store as st
-from pystores import file as f
 
-from mantis.config.models import StoreConfig
+from mantis.config.models import StoreConfig, StoreDurability
+from mantis.services.scheduler.archive import tiering
+from mantis.services.scheduler.archive.archive import Archive
+from mantis.services.scheduler.archive.segments import Segments
+from mantis.services.scheduler.backends import records
+from mantis.services.scheduler.backends.factory import BackendFactory
+from mantis.services.scheduler.live import LiveTasks
+from mantis.services.scheduler.metrics import CommitMetrics, CommitMetricsCollector
+from mantis.utils.time import naiveutcnow
 
 
-class Serializer(f.Serializer[s.State, str]):
-    """Serializer for state to JSON string."""
+class Store(st.Store[s.State]):
+    """Store for scheduler state.
 
-    @override
-    async def serialize(self, value: s.State) -> str:
-        return json.dumps(value, separators=(",", ":"))
-
-    @override
-    async def deserialize(self, value: str) -> s.State:
-        return json.loads(value)
+    The state is kept in memory and the backend is used only to persist it.
+    Changes made within a short window are persisted together in a worker thread.
+    Depending on the durability level, they are synced to disk immediately,
+    in batches or only on shutdown. Finished tasks that are no longer needed
+    by the scheduler are moved out of the hot state to the archive.
+    Changes made in batches are held back until all of them end,
+    unless changes made outside of them have to be persisted in the meantime.
 
+    Args:
+        config: Configuration for the store.
 
-class Store(f.FileStore[s.State, str], st.Store[s.State]):
-    """Store for scheduler state."""
+    """
 
     def __init__(self, config: StoreConfig) -> None:
-        path = config.path
-
-        if not path.exists():
-            path.touch()
-
-        super().__init__(
-            file=path.open("r+"),
-            serializer=Serializer(),
-            default=self._build_default_state(),
+        self._config = config
+        self._backend = BackendFactory().create(config)
+        self._segments = Segments(
+            config=config.archive,
+            durability=config.durability.level,
+            path=config.archive_path,
+        )
+        self._archive = Archive(segments=self._segments)
+        self._live = LiveTasks()
+        self._state = self._build_default_state()
+        self._persisted: s.State | None = None
+        self._tiered: float | None = None
+        self._version = 0
+        self._metrics = CommitMetricsCollector()
+        self._commit: asyncio.Future[None] | None = None
+        self._changes = 0
+        self._changed = asyncio.Event()
+        self._batched = ContextVar[list[asyncio.Future[None]] | None](
+            "batched", default=None
         )
+        self._batches = 0
+        self._urgent = False
+        self._released = asyncio.Event()
+        self._released.set()
+        self._unsynced: float | None = None
+        self._closing = False
+        self._writer: asyncio.Task[None] | None = None
 
     async def __aenter__(self) -> "Store":
+        await asyncio.to_thread(self._segments.open)
+        await asyncio.to_thread(self._backend.open)
+
+        state = await asyncio.to_thread(self._backend.load)
+        if state is not None:
+            self._state = self._tier(state)
+
+            # Move finished tasks out of the persisted state right away
+            if state is not self._state:
+                await asyncio.to_thread(self._persist, self._state)
+                await asyncio.to_thread(self._sync_all)
+
+        self._live.update(self._state)
+        self._persisted = self._snapshot(self._state)
+
+        self._closing = False
+        self._writer = asyncio.create_task(self._write())
+
         return self
 
     async def __aexit__(
@@ -46,7 +94,15 @@ class Store(f.FileStore[s.State, str], st.Store[s.State]):
         exception: BaseException | None,
         traceback: TracebackType | None,
     ) -> None:
-        self._file.close()
+        if self._writer is not None:
+            self._closing = True
+            self._changed.set()
+            self._released.set()
+            await self._writer
+            self._writer = None
+
+        await asyncio.to_thread(self._backend.close)
+        await asyncio.to_thread(self._segments.close)
 
     def _build_default_state(self) -> s.State:
         state = r.State(
@@ -64,3 +120,208 @@ class Store(f.FileStore[s.State, str], st.Store[s.State]):
         )
 
         return state.serialize()
+
+    def _snapshot(self, state: s.State) -> s.State:
+        data = cast("Mapping[str, Any]", state)
+
+        # Tasks are replaced rather than modified, so copying containers is enough
+        snapshot = {
+            "tasks": {bucket: dict(tasks) for bucket, tasks in data["tasks"].items()},
+            "statuses": dict(data["statuses"]),
+            "relationships": {
+                name: dict(relationships)
+                for name, relationships in data["relationships"].items()
+            },
+        }
+
+        return cast("s.State", snapshot)
+
+    def _tier(self, state: s.State) -> s.State:
+        if not self._config.archive.enabled:
+            return state
+
+        # Looking for tasks to archive goes through the whole state,
+        # so it is done at most once per interval, and always on startup
+        now = time.monotonic()
+        interval = self._config.archive.interval.total_seconds()
+        if self._tiered is not None and now - self._tiered < interval:
+            return state
+
+        self._tiered = now
+
+        cutoff = naiveutcnow() - self._config.archive.delay
+        state, archived = tiering.split(state, cutoff)
+        self._segments.add(archived)
+
+        return state
+
+    def _persist(self, state: s.State, previous: s.State | None = None) -> None:
+        # Only tasks that changed since the previous commit have to be written
+        changed = None if previous is None else records.changes(previous, state)
+
+        # Archived tasks must be written before they disappear from the state
+        self._segments.flush()
+        self._backend.save(state, changed)
+
+    def _sync_all(self) -> None:
+        self._segments.sync()
+        self._backend.sync()
+
+    async def _flush(self) -> None:
+        commit = self._commit
+        changes = self._changes
+
+        if commit is None:
+            return
+
+        self._commit = None
+        self._changes = 0
+
+        # Changes made from now on are held back again while batches are active
+        self._urgent = False
+        if self._batches > 0:
+            self._released.clear()
+
+        start = time.perf_counter()
+
+        # The state can change while it is persisted in the worker thread
+        snapshot = self._snapshot(self._state)
+        previous, self._persisted = self._persisted, None
+
+        try:
+            await asyncio.to_thread(self._persist, snapshot, previous)
+        except Exception as ex:
+            commit.set_exception(ex)
+        else:
+            self._persisted = snapshot
+            commit.set_result(None)
+
+        latency = timedelta(seconds=time.perf_counter() - start)
+        self._metrics.record(latency, changes)
+
+        if (
+            self._config.durability.level != StoreDurability.ALWAYS
+            and self._unsynced is None
+        ):
+            self._unsynced = time.monotonic()
+
+    async def _sync(self) -> None:
+        if self._unsynced is None:
+            return
+
+        try:
+            await asyncio.to_thread(self._sync_all)
+        except Exception:
+            # Try again after another interval
+            self._unsynced = time.monotonic()
+        else:
+            self._unsynced = None
+
+    def _get_sync_delay(self) -> float | None:
+        if self._config.durability.level != StoreDurability.BATCHED:
+            return None
+
+        if self._unsynced is None:
+            return None
+
+        elapsed = time.monotonic() - self._unsynced
+        interval = self._config.durability.interval.total_seconds()
+
+        return max(interval - elapsed, 0)
+
+    async def _write(self) -> None:
+        while True:
+            try:
+                async with asyncio.timeout(self._get_sync_delay()):
+                    await self._changed.wait()
+            except TimeoutError:
+                await self._sync()
+                continue
+
+            if not self._closing:
+                await asyncio.sleep(self._config.window.total_seconds())
+
+                # Changes made in batches are persisted after all of them end,
+                # unless changes made outside of them are waiting as well
+                await self._released.wait()
+
+            self._changed.clear()
+            await self._flush()
+
+            if self._closing:
+                await self._sync()
+                return
+
+    @property
+    def version(self) -> int:
+        """Number of changes made to the state since the store was opened."""
+        return self._version
+
+    @property
+    def metrics(self) -> CommitMetrics:
+        """Metrics of state commits."""
+        return self._metrics.metrics
+
+    @property
+    def archive(self) -> Archive:
+        """Archive of finished tasks."""
+        return self._archive
+
+    @property
+    def live(self) -> LiveTasks:
+        """Unfinished tasks indexed by type of operation."""
+        return self._live
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncGenerator[None]:
+        """Persist changes made in the context together when it exits."""
+        commits: list[asyncio.Future[None]] = []
+        token = self._batched.set(commits)
+        self._batches = self._batches + 1
+
+        if not self._urgent:
+            self._released.clear()
+
+        try:
+            yield
+        finally:
+            self._batched.reset(token)
+            self._batches = self._batches - 1
+
+            if self._batches == 0:
+                self._released.set()
+
+        # Each batch waits only for commits of its own changes
+        await asyncio.gather(*(asyncio.shield(commit) for commit in commits))
+
+    @override
+    async def get(self) -> s.State:
+        # The writer thread persists snapshots, so the state can be shared
+        return self._state
+
+    @override
+    async def set(self, value: s.State) -> None:
+        self._state = self._tier(value)
+        self._version = self._version + 1
+        self._live.update(self._state)
+
+        if self._commit is None:
+            self._commit = asyncio.get_running_loop().create_future()
+
+        commit = self._commit
+        self._changes = self._changes + 1
+        self._changed.set()
+
+        # Changes made in a batch are awaited once, when the batch ends
+        commits = self._batched.get()
+        if commits is not None:
+            if commit not in commits:
+                commits.append(commit)
+
+            return
+
+        self._urgent = True
+        self._released.set()
+
+        # Return only after the change is persisted, together with other changes
+        await asyncio.shield(commit)
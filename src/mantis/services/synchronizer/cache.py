@@ -0,0 +1,66 @@
+import time
+from collections.abc import Collection, Iterable, Mapping
+from collections.abc import Set as AbstractSet
+from datetime import timedelta
+from uuid import UUID
+
+from mantis.services.beaver import models as bm
+
+
+class EventCache:
+    """Cache of events that expire after some time.
+
+    Args:
+        ttl: Time after which cached events expire.
+
+    """
+
+    def __init__(self, ttl: timedelta) -> None:
+        self._ttl = ttl.total_seconds()
+        self._events: dict[UUID, tuple[bm.Event, float]] = {}
+
+    def get(
+        self, ids: Collection[UUID]
+    ) -> tuple[Mapping[UUID, bm.Event], AbstractSet[UUID]]:
+        """Get cached events and identifiers of ones that are not cached."""
+        now = time.monotonic()
+        found: dict[UUID, bm.Event] = {}
+        missing: set[UUID] = set()
+
+        for event_id in ids:
+            cached = self._events.get(event_id)
+
+            if cached is None or cached[1] <= now:
+                missing.add(event_id)
+                continue
+
+            found[event_id] = cached[0]
+
+        return found, missing
+
+    def put(self, events: Iterable[bm.Event]) -> None:
+        """Cache events."""
+        now = time.monotonic()
+        expires = now + self._ttl
+
+        # Events are kept in order of expiration, so expired ones are at the front
+        expired: list[UUID] = []
+        for event_id, (_, expiration) in self._events.items():
+            if expiration > now:
+                break
+
+            expired.append(event_id)
+
+        # Expired events are dropped so that the cache doesn't grow forever
+        for event_id in expired:
+            del self._events[event_id]
+
+        for event in events:
+            # Reinserted events have to move to the end to keep the order
+            self._events.pop(event.id, None)
+            self._events[event.id] = (event, expires)
+
+    def invalidate(self, ids: Iterable[UUID]) -> None:
+        """Remove events from the cache."""
+        for event_id in ids:
+            self._events.pop(event_id, None)
@@ -0,0 +1,63 @@
+import random
+from datetime import datetime, timedelta
+
+from mantis.config.models import SynchronizerCadenceConfig
+from mantis.models.events.synchronization import SynchronizationReport
+from mantis.utils.time import naiveutcnow
+
+
+class Cadence:
+    """Adapts intervals between synchronizations to their outcomes.
+
+    Intervals grow exponentially with jitter while synchronizations fail
+    or are slow. They shrink while synchronizations find changes
+    and when an instance is about to start. They are always kept
+    between the floor and the ceiling.
+
+    Args:
+        config: Configuration for adaptive intervals.
+
+    """
+
+    def __init__(self, config: SynchronizerCadenceConfig) -> None:
+        self._config = config
+        self._failures = 0
+        self._changes = False
+
+    def _clamp(self, interval: timedelta) -> timedelta:
+        return min(max(interval, self._config.floor), self._config.ceiling)
+
+    def _backoff(self, interval: timedelta) -> timedelta:
+        # Exponent is capped so that the interval can't overflow
+        backoff = min(interval * 2 ** min(self._failures, 16), self._config.ceiling)
+
+        # Jitter spreads synchronizations of instances that fail at the same time
+        return backoff / 2 + backoff / 2 * random.random()  # noqa: S311
+
+    def update(self, report: SynchronizationReport) -> None:
+        """Take the outcome of a synchronization into account."""
+        if report.error is not None or report.duration > self._config.slow:
+            self._failures += 1
+        else:
+            self._failures = 0
+
+        self._changes = any(
+            result.counts.added + result.counts.cancelled + result.counts.invalid > 0
+            for result in report.results.values()
+        )
+
+    def adapt(self, interval: timedelta, upcoming: datetime | None) -> timedelta:
+        """Adapt an interval between synchronizations.
+
+        Upcoming is the start in UTC of the nearest instance, if it matters.
+        """
+        if self._failures > 0:
+            return self._clamp(self._backoff(interval))
+
+        if upcoming is not None and upcoming - naiveutcnow() <= self._config.imminence:
+            return self._config.floor
+
+        if self._changes:
+            interval = interval / 2
+
+        return self._clamp(interval)
@@ -0,0 +1,15 @@
+from mantis.models.base import datamodel
+
+
+@datamodel
+class SynchronizationMetrics:
+    """Metrics of synchronizations of a synchronizer."""
+
+    synchronizations: int
+    """Number of synchronizations."""
+
+    events: int
+    """Number of events checked in the last synchronization."""
+
+    skipped: int
+    """Number of unchanged events skipped in the last synchronization."""
@@ -0,0 +1,20 @@
+from collections.abc import Sequence
+from collections.abc import Set as AbstractSet
+from uuid import UUID
+
+from mantis.models.base import datamodel
+from mantis.services.scheduler.models import transfer as t
+
+
+@datamodel
+class SynchronizationPlan:
+    """Changes that a synchronization would make."""
+
+    add: Sequence[t.ScheduleRequest]
+    """Requests to schedule missing tasks."""
+
+    invalid: AbstractSet[UUID]
+    """Identifiers of invalid tasks to cancel."""
+
+    extra: AbstractSet[UUID]
+    """Identifiers of extra tasks to cancel."""
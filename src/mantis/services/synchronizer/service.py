@@ -1,41 +1,162 @@
 import asyncio
 import math
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
-from datetime import datetime
+import time
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Collection,
+    Mapping,
+    Sequence,
+)
+from contextlib import aclosing, asynccontextmanager, suppress
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from litestar.channels import ChannelsPlugin
 
 from mantis.config.models import SynchronizerConfig
+from mantis.models.events import synchronization as ev
+from mantis.models.events.types import Event
+from mantis.services.beaver import models as bm
 from mantis.services.beaver.service import BeaverService
 from mantis.services.scheduler.service import SchedulerService
+from mantis.services.synchronizer.cadence import Cadence
+from mantis.services.synchronizer.metrics import SynchronizationMetrics
+from mantis.services.synchronizer.plans import SynchronizationPlan
 from mantis.services.synchronizer.synchronizers.stream import StreamSynchronizer
+from mantis.services.synchronizer.synchronizers.synchronizer import Synchronizer
 from mantis.utils.time import naiveutcnow
 
+# Window to synchronize and interval between synchronizations
+type Horizon = tuple[timedelta | None, timedelta]
+
 
 class SynchronizerService:
-    """Service to synchronize scheduled tasks with expected ones."""
+    """Service to synchronize scheduled tasks with expected ones.
+
+    All tasks are synchronized periodically. Additionally, tasks of events
+    that changed are synchronized as soon as beaver notifies about the changes.
+    While notifications are received, the periodic synchronization of the widest
+    window is only a safety net, so it runs less often.
+
+    Time windows of different lengths can be synchronized at different intervals.
+    When more of them are due at the same time, only the widest one is
+    synchronized, as it covers the others.
+
+    Intervals can also adapt to outcomes of synchronizations. Then they are
+    measured from the last synchronization instead of fixed boundaries.
+
+    Reports of recent synchronizations are kept in memory
+    and emitted as app events.
+
+    The first synchronization runs right after startup. The service is ready
+    once a synchronization of all tasks succeeds.
+
+    Tasks of specific events can also be synchronized on demand.
+    Requests that come while waiting for another synchronization to finish
+    are coalesced, so each event is synchronized only once for all of them.
+    """
 
     def __init__(
         self,
         config: SynchronizerConfig,
         beaver: BeaverService,
         scheduler: SchedulerService,
+        channels: ChannelsPlugin,
     ) -> None:
         self._config = config
-        self._synchronizers = [
-            StreamSynchronizer(
+        self._beaver = beaver
+        self._channels = channels
+        self._synchronizers = {
+            "stream": StreamSynchronizer(
                 config=config.synchronizers.stream, beaver=beaver, scheduler=scheduler
             )
-        ]
+        }
+        self._lock = asyncio.Lock()
+        self._changes: set[UUID] = set()
+        self._changed = asyncio.Event()
+        self._requested: set[UUID] = set()
+        self._request: asyncio.Task[ev.SynchronizationReport] | None = None
+        self._subscribed = False
+        self._connected = asyncio.Event()
+        self._ready = False
+        self._horizons = self._build_horizons()
+        self._history = deque[ev.SynchronizationReport](maxlen=config.history)
+        self._cadence = Cadence(config.cadence)
+        self._synchronized: dict[timedelta | None, datetime] = {}
+
+    def _build_horizons(self) -> Sequence[Horizon]:
+        if self._config.horizons is None:
+            # Default windows of synchronizers are used
+            return [(None, self._config.interval)]
+
+        horizons = sorted(
+            self._config.horizons, key=lambda horizon: horizon.window, reverse=True
+        )
+
+        # The widest horizon comes first
+        return [(horizon.window, horizon.interval) for horizon in horizons]
+
+    def _get_window(self) -> timedelta | None:
+        window, _ = self._horizons[0]
+        return window
+
+    def _get_interval(self, index: int) -> timedelta:
+        _, interval = self._horizons[index]
+
+        # Narrower horizons keep their intervals, so they still catch up quickly
+        if self._subscribed and index == 0:
+            return max(interval, self._config.changes.interval)
+
+        return interval
 
-    def _find_next_time(self, dt: datetime) -> datetime:
+    def _find_next_time(self, dt: datetime, interval: timedelta) -> datetime:
         reference = self._config.reference
-        interval = self._config.interval
 
         return reference + math.ceil((dt - reference) / interval) * interval
 
-    async def _wait(self) -> None:
+    def _covers(self, window: timedelta | None, other: timedelta | None) -> bool:
+        # Without horizons, there is only the default window
+        return window is None or other is None or other <= window
+
+    def _get_upcoming(self) -> datetime | None:
+        upcoming = [
+            synchronizer.upcoming
+            for synchronizer in self._synchronizers.values()
+            if synchronizer.upcoming is not None
+        ]
+
+        return min(upcoming, default=None)
+
+    def _find_adapted_time(self, dt: datetime, index: int) -> datetime:
+        window, _ = self._horizons[index]
+
+        # Only the narrowest horizon is tightened before instances start
+        upcoming = self._get_upcoming() if index == len(self._horizons) - 1 else None
+        interval = self._cadence.adapt(self._get_interval(index), upcoming)
+
+        return self._synchronized.get(window, dt) + interval
+
+    def _find_targets(
+        self, dt: datetime
+    ) -> Sequence[tuple[datetime, timedelta | None]]:
+        if self._config.cadence.enabled:
+            return [
+                (self._find_adapted_time(dt, index), window)
+                for index, (window, _) in enumerate(self._horizons)
+            ]
+
+        return [
+            (self._find_next_time(dt, self._get_interval(index)), window)
+            for index, (window, _) in enumerate(self._horizons)
+        ]
+
+    async def _wait(self) -> timedelta | None:
         now = naiveutcnow()
-        target = self._find_next_time(now)
+        targets = self._find_targets(now)
+        target = min(target for target, _ in targets)
 
         delta = target - now
         delta = delta.total_seconds()
@@ -43,31 +164,232 @@ class SynchronizerService:
 
         await asyncio.sleep(delta)
 
-    async def _synchronize(self) -> None:
-        await asyncio.gather(
-            *(synchronizer.synchronize() for synchronizer in self._synchronizers)
+        # Horizons are ordered from the widest one, so it's the first due one
+        return next(window for due, window in targets if due == target)
+
+    def _emit_event(self, event: Event) -> None:
+        data = event.model_dump_json(round_trip=True)
+
+        # Channels are not available before the app has started
+        with suppress(RuntimeError):
+            self._channels.publish(data, "events")
+
+    def _emit_synchronization_event(self, report: ev.SynchronizationReport) -> None:
+        self._emit_event(ev.SynchronizationEvent(data=report))
+
+    def _record(self, report: ev.SynchronizationReport) -> None:
+        self._history.append(report)
+        self._cadence.update(report)
+        self._emit_synchronization_event(report)
+
+    async def _run_synchronizers(
+        self,
+        kind: ev.SynchronizationKind,
+        window: timedelta | None,
+        synchronize: Callable[[Synchronizer], Awaitable[ev.SynchronizationResult]],
+    ) -> ev.SynchronizationReport:
+        started = naiveutcnow()
+        start = time.perf_counter()
+
+        results: Mapping[str, ev.SynchronizationResult] = {}
+        error: str | None = None
+
+        # Failures are not raised, but recorded in the report
+        try:
+            outcomes = await asyncio.gather(
+                *(
+                    synchronize(synchronizer)
+                    for synchronizer in self._synchronizers.values()
+                )
+            )
+        except Exception as ex:
+            error = str(ex) or type(ex).__name__
+        else:
+            results = dict(zip(self._synchronizers, outcomes, strict=True))
+
+        report = ev.SynchronizationReport(
+            kind=kind,
+            started=started,
+            duration=timedelta(seconds=time.perf_counter() - start),
+            window=window,
+            results=results,
+            error=error,
         )
 
+        self._record(report)
+        return report
+
+    async def _synchronize(self, window: timedelta | None) -> None:
+        async with self._lock:
+            report = await self._run_synchronizers(
+                ev.SynchronizationKind.FULL,
+                window,
+                lambda synchronizer: synchronizer.synchronize(window),
+            )
+
+        finished = naiveutcnow()
+
+        for other, _ in self._horizons:
+            if self._covers(window, other):
+                self._synchronized[other] = finished
+
+        if report.error is None:
+            self._ready = True
+
+    async def _synchronize_requested(self) -> ev.SynchronizationReport:
+        async with self._lock:
+            # Events requested from now on wait for the next synchronization
+            ids, self._requested = self._requested, set()
+            self._request = None
+
+            window = self._get_window()
+
+            return await self._run_synchronizers(
+                ev.SynchronizationKind.EVENTS,
+                window,
+                lambda synchronizer: synchronizer.synchronize_events(ids, window),
+            )
+
     async def _run(self) -> None:
+        try:
+            # Changes made during the first synchronization shouldn't be missed
+            if self._config.changes.enabled:
+                await self._connected.wait()
+
+            # Tasks should be scheduled as soon as possible after startup
+            await self._synchronize(self._get_window())
+
+            while True:
+                window = await self._wait()
+                await self._synchronize(window)
+        except asyncio.CancelledError:
+            pass
+
+    async def _subscribe(self) -> None:
+        subscribe_request = bm.SSESubscribeRequest(
+            types={
+                bm.ChangeType.EVENT_CREATED,
+                bm.ChangeType.EVENT_UPDATED,
+                bm.ChangeType.EVENT_DELETED,
+            }
+        )
+
+        subscribe_response = await self._beaver.sse.subscribe(subscribe_request)
+
+        async with aclosing(subscribe_response.changes) as changes:
+            self._subscribed = True
+
+            # The first subscription is followed by the startup synchronization
+            resubscribed = self._connected.is_set()
+            self._connected.set()
+
+            try:
+                # Changes made while not subscribed might have been missed
+                if resubscribed:
+                    await self._synchronize(self._get_window())
+
+                async for change in changes:
+                    self._changes.add(change.data.event.id)
+                    self._changed.set()
+            finally:
+                self._subscribed = False
+
+    async def _listen(self) -> None:
         try:
             while True:
-                await self._wait()
                 try:
-                    await self._synchronize()
+                    await self._subscribe()
                 except asyncio.CancelledError:
                     raise
                 except Exception:  # noqa: S110
                     pass
+
+                # Startup synchronization doesn't wait for beaver to come up
+                self._connected.set()
+
+                await asyncio.sleep(self._config.changes.retry.total_seconds())
         except asyncio.CancelledError:
             pass
 
+    async def _apply(self) -> None:
+        try:
+            while True:
+                await self._changed.wait()
+
+                # Collect changes that come shortly after each other
+                await asyncio.sleep(self._config.changes.delay.total_seconds())
+
+                self._changed.clear()
+                ids, self._changes = self._changes, set()
+
+                await self.synchronize_events(ids)
+        except asyncio.CancelledError:
+            pass
+
+    @property
+    def metrics(self) -> Mapping[str, SynchronizationMetrics]:
+        """Metrics of synchronizations by synchronizer."""
+        return {
+            name: synchronizer.metrics
+            for name, synchronizer in self._synchronizers.items()
+        }
+
+    @property
+    def ready(self) -> bool:
+        """Whether a synchronization of all tasks succeeded since startup."""
+        return self._ready
+
+    @property
+    def history(self) -> Sequence[ev.SynchronizationReport]:
+        """Reports of recent synchronizations, from the oldest one."""
+        return list(self._history)
+
+    async def synchronize_events(
+        self, ids: Collection[UUID]
+    ) -> ev.SynchronizationReport:
+        """Synchronize tasks of events as soon as possible.
+
+        Requests that come before the synchronization starts are coalesced.
+        """
+        self._requested.update(ids)
+
+        if self._request is None:
+            self._request = asyncio.create_task(self._synchronize_requested())
+
+        # Other requests wait for the same synchronization
+        return await asyncio.shield(self._request)
+
+    async def plan(
+        self, window: timedelta | None = None
+    ) -> Mapping[str, SynchronizationPlan]:
+        """Compute changes that a synchronization would make by synchronizer.
+
+        Without a window, the widest one is used. Nothing is changed.
+        """
+        window = window or self._get_window()
+
+        plans = await asyncio.gather(
+            *(
+                synchronizer.plan(window)
+                for synchronizer in self._synchronizers.values()
+            )
+        )
+
+        return dict(zip(self._synchronizers, plans, strict=True))
+
     @asynccontextmanager
     async def run(self) -> AsyncGenerator[None]:
         """Run in the context."""
-        task = asyncio.create_task(self._run())
+        tasks = [asyncio.create_task(self._run())]
+
+        if self._config.changes.enabled:
+            tasks.append(asyncio.create_task(self._listen()))
+            tasks.append(asyncio.create_task(self._apply()))
 
         try:
             yield
         finally:
-            task.cancel()
-            await task
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks)
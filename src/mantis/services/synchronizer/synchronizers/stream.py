@@ -1,22 +1,40 @@
 import asyncio
+import bisect
+import itertools
+import time
 from collections.abc import Collection, Sequence
-from contextlib import suppress
-from datetime import UTC, datetime, timedelta
+from collections.abc import Set as AbstractSet
+from datetime import datetime, timedelta
 from typing import override
 from uuid import UUID
 
-from pydantic import ValidationError
-
 from mantis.config.models import StreamSynchronizerConfig
+from mantis.models.events.synchronization import (
+    SynchronizationCounts,
+    SynchronizationResult,
+    SynchronizationTimings,
+)
 from mantis.services.beaver import models as bm
 from mantis.services.beaver.service import BeaverService
-from mantis.services.scheduler import errors as se
 from mantis.services.scheduler.models import enums as e
 from mantis.services.scheduler.models import transfer as t
 from mantis.services.scheduler.operations.operations.stream.models import Parameters
 from mantis.services.scheduler.service import SchedulerService
+from mantis.services.synchronizer.cache import EventCache
+from mantis.services.synchronizer.metrics import SynchronizationMetrics
+from mantis.services.synchronizer.plans import SynchronizationPlan
 from mantis.services.synchronizer.synchronizers.synchronizer import Synchronizer
-from mantis.utils.time import isostringify, naiveutcnow
+from mantis.utils.pagination import Page
+from mantis.utils.time import isostringify, naiveutcify, naiveutcnow
+
+# Identifier of the event and start of its instance in event timezone
+type InstanceKey = tuple[UUID, datetime]
+
+# Timezone of the event and starts of its instances in event timezone
+type Fingerprint = tuple[str, frozenset[datetime]]
+
+# Events that were in sync, with their fingerprints and tasks at that time
+type Synced = dict[UUID, tuple[Fingerprint, frozenset[UUID]]]
 
 
 class StreamSynchronizer(Synchronizer):
@@ -31,50 +49,53 @@ class StreamSynchronizer(Synchronizer):
         self._config = config
         self._beaver = beaver
         self._scheduler = scheduler
+        self._events = EventCache(ttl=config.events.ttl)
+        # Fingerprints depend on the window, so they are remembered for each one
+        self._synced: dict[timedelta, Synced] = {}
+        self._metrics = SynchronizationMetrics(synchronizations=0, events=0, skipped=0)
+        self._starts: Sequence[datetime] = []
 
-    def _get_time_window(self) -> tuple[datetime, datetime]:
+    def _get_time_window(self, window: timedelta) -> tuple[datetime, datetime]:
         start = naiveutcnow()
-        end = start + self._config.window
+        end = start + window
 
         return start, end
 
+    def _build_where(self, ids: Collection[UUID] | None) -> bm.EventWhereInput:
+        where: bm.EventWhereInput = {
+            "OR": [
+                {
+                    "type": bm.EventType.replay,
+                },
+                {
+                    "type": bm.EventType.prerecorded,
+                },
+            ]
+        }
+
+        if ids is not None:
+            where["id"] = {"in": [str(event_id) for event_id in ids]}
+
+        return where
+
     async def _fetch_schedules(
-        self, start: datetime, end: datetime
+        self, start: datetime, end: datetime, ids: Collection[UUID] | None
     ) -> Sequence[bm.Schedule]:
-        schedules: list[bm.Schedule] = []
-        offset = 0
+        where = self._build_where(ids)
 
-        while True:
+        async def _fetch(limit: int | None, offset: int) -> Page[bm.Schedule]:
             schedule_list_request = bm.ScheduleListRequest(
-                start=start,
-                end=end,
-                limit=None,
-                offset=offset,
-                where={
-                    "OR": [
-                        {
-                            "type": bm.EventType.replay,
-                        },
-                        {
-                            "type": bm.EventType.prerecorded,
-                        },
-                    ]
-                },
+                start=start, end=end, limit=limit, offset=offset, where=where
             )
 
             schedule_list_response = await self._beaver.schedule.list(
                 schedule_list_request
             )
 
-            new = schedule_list_response.results.schedules
+            results = schedule_list_response.results
+            return results.schedules, results.count
 
-            schedules = schedules + list(new)
-            offset = offset + len(new)
-
-            if offset >= schedule_list_response.results.count:
-                break
-
-        return schedules
+        return await self._beaver.paginator.paginate(_fetch)
 
     def _filter_schedules(
         self, schedules: Sequence[bm.Schedule], start: datetime, end: datetime
@@ -82,95 +103,99 @@ class StreamSynchronizer(Synchronizer):
         out: list[bm.Schedule] = []
 
         for schedule in schedules:
-            instances: list[bm.EventInstance] = []
-
-            for instance in schedule.instances:
-                istart = (
-                    instance.start.replace(tzinfo=schedule.event.timezone)
-                    .astimezone(UTC)
-                    .replace(tzinfo=None)
+            instances = [
+                instance
+                for instance, istart in zip(
+                    schedule.instances, schedule.starts, strict=True
                 )
+                if istart >= start and istart < end
+            ]
 
-                if istart >= start and istart < end:
-                    instances = [*instances, instance]
-
-            if len(instances) > 0:
-                out = [*out, bm.Schedule(event=schedule.event, instances=instances)]
+            if len(instances) == len(schedule.instances):
+                # Schedule is kept as is, so its starts in UTC are not computed again
+                out.append(schedule)
+            elif len(instances) > 0:
+                out.append(bm.Schedule(event=schedule.event, instances=instances))
 
         return out
 
     async def _get_schedules(
-        self, start: datetime, end: datetime
+        self, start: datetime, end: datetime, ids: Collection[UUID] | None
     ) -> Sequence[bm.Schedule]:
-        schedules = await self._fetch_schedules(start, end)
+        schedules = await self._fetch_schedules(start, end, ids)
         return self._filter_schedules(schedules, start, end)
 
-    async def _fetch_tasks(self) -> Sequence[t.GenericTask]:
-        index = await self._scheduler.tasks.list()
-        ids = (
-            index.queued
-            | index.waiting
-            | index.sleeping
-            | index.running
-            | index.cancelled
-            | index.failed
-            | index.completed
-        )
-
-        tasks = await asyncio.gather(
-            *(self._scheduler.tasks.get(task_id) for task_id in ids)
-        )
-        return [task for task in tasks if task is not None]
-
-    async def _get_events(self, ids: Collection[UUID]) -> Sequence[bm.Event]:
-        if len(ids) == 0:
-            return []
+    async def _fetch_tasks(self) -> Sequence[tuple[t.GenericTask, Parameters | None]]:
+        # Finished tasks are never reconciled, so only unfinished ones are fetched
+        return await self._scheduler.live.get_with_parameters("stream", Parameters)
 
-        events: list[bm.Event] = []
-        offset = 0
+    async def _fetch_events(self, ids: Collection[UUID]) -> Sequence[bm.Event]:
+        where: bm.EventWhereInput = {"id": {"in": [str(event_id) for event_id in ids]}}
 
-        while True:
+        async def _fetch(limit: int | None, offset: int) -> Page[bm.Event]:
             events_list_request = bm.EventsListRequest(
-                limit=None,
-                offset=offset,
-                where={"id": {"in": [str(event_id) for event_id in ids]}},
+                limit=limit, offset=offset, where=where
             )
 
             events_list_response = await self._beaver.events.list(events_list_request)
 
-            new = events_list_response.results.events
+            results = events_list_response.results
+            return results.events, results.count
+
+        return await self._beaver.paginator.paginate(_fetch)
+
+    async def _get_events(self, ids: Collection[UUID]) -> Sequence[bm.Event]:
+        cached, missing = self._events.get(ids)
+
+        if len(missing) == 0:
+            return list(cached.values())
+
+        # Chunks keep the query string of each request reasonably short
+        pending = list(missing)
+        size = self._config.events.chunk
+        chunks = [pending[i : i + size] for i in range(0, len(pending), size)]
+
+        semaphore = asyncio.Semaphore(self._config.events.concurrency)
+
+        async def _fetch(chunk: Sequence[UUID]) -> Sequence[bm.Event]:
+            async with semaphore:
+                return await self._fetch_events(chunk)
 
-            events = events + list(new)
-            offset = offset + len(new)
+        results = await asyncio.gather(*(_fetch(chunk) for chunk in chunks))
+        fetched = [event for result in results for event in result]
 
-            if offset >= events_list_response.results.count:
-                break
+        self._events.put(fetched)
 
-        return events
+        return [*cached.values(), *fetched]
 
     async def _filter_tasks(
-        self, tasks: Sequence[t.GenericTask], start: datetime, end: datetime
+        self,
+        tasks: Sequence[tuple[t.GenericTask, Parameters | None]],
+        start: datetime,
+        end: datetime,
+        ids: Collection[UUID] | None,
     ) -> tuple[Sequence[tuple[t.GenericTask, Parameters]], Sequence[t.GenericTask]]:
         invalid: list[t.GenericTask] = []
         withparams: list[tuple[t.GenericTask, Parameters]] = []
 
-        for task in tasks:
+        for task, params in tasks:
             if task.task.operation.type != "stream":
                 continue
 
             if task.status in {e.Status.CANCELLED, e.Status.FAILED, e.Status.COMPLETED}:
                 continue
 
-            try:
-                params = Parameters.model_validate(task.task.operation.parameters)
-            except ValidationError:
-                invalid = [*invalid, task]
+            if params is None:
+                invalid.append(task)
+                continue
+
+            if ids is not None and params.id not in ids:
                 continue
 
-            withparams = [*withparams, (task, params)]
+            withparams.append((task, params))
 
-        ids = {params.id for _, params in withparams}
-        events = await self._get_events(ids)
+        event_ids = {params.id for _, params in withparams}
+        events = await self._get_events(event_ids)
         events = {event.id: event for event in events}
 
         valid: list[tuple[t.GenericTask, Parameters]] = []
@@ -178,73 +203,58 @@ class StreamSynchronizer(Synchronizer):
         for task, params in withparams:
             event = events.get(params.id)
             if event is None:
-                invalid = [*invalid, task]
+                invalid.append(task)
                 continue
 
-            istart = (
-                params.start.replace(tzinfo=event.timezone)
-                .astimezone(UTC)
-                .replace(tzinfo=None)
-            )
+            istart = naiveutcify(params.start, event.timezone)
 
             if istart >= start and istart < end:
-                valid = [*valid, (task, params)]
+                valid.append((task, params))
 
         return valid, invalid
 
-    async def _get_unfinished_tasks(
-        self, start: datetime, end: datetime
-    ) -> tuple[Sequence[tuple[t.GenericTask, Parameters]], Sequence[t.GenericTask]]:
-        tasks = await self._fetch_tasks()
-        return await self._filter_tasks(tasks, start, end)
-
-    async def _cancel(self, task_id: UUID) -> None:
-        cancel_request = t.CancelRequest(id=task_id)
+    async def _cancel(self, task_ids: Collection[UUID]) -> None:
+        if len(task_ids) == 0:
+            return
 
-        with suppress(se.ServiceError):
-            await self._scheduler.cancel(cancel_request)
-
-    async def _cancel_invalid_tasks(self, tasks: Sequence[t.GenericTask]) -> None:
-        await asyncio.gather(*(self._cancel(task.task.id) for task in tasks))
+        # Tasks that can't be cancelled are retried in the next synchronization
+        await self._scheduler.cancel_many(
+            [t.CancelRequest(id=task_id) for task_id in task_ids]
+        )
 
-    async def _cancel_extra_tasks(
+    def _index_instances(
+        self, schedules: Sequence[bm.Schedule]
+    ) -> dict[InstanceKey, tuple[bm.Event, bm.EventInstance]]:
+        return {
+            (schedule.event.id, instance.start): (schedule.event, instance)
+            for schedule in schedules
+            for instance in schedule.instances
+        }
+
+    def _index_tasks(
+        self, tasks: Sequence[tuple[t.GenericTask, Parameters]]
+    ) -> dict[InstanceKey, t.GenericTask]:
+        return {(params.id, params.start): task for task, params in tasks}
+
+    def _find_extra_tasks(
         self,
         schedules: Sequence[bm.Schedule],
         tasks: Sequence[tuple[t.GenericTask, Parameters]],
-    ) -> None:
-        schedulemap = {schedule.event.id: schedule for schedule in schedules}
-        cancel = set[UUID]()
+    ) -> AbstractSet[UUID]:
+        instances = self._index_instances(schedules)
 
-        for task, params in tasks:
-            schedule = schedulemap.get(params.id)
-            if schedule is None:
-                cancel = cancel | {task.task.id}
-                continue
+        return {
+            task.task.id
+            for task, params in tasks
+            if (params.id, params.start) not in instances
+        }
 
-            instance = next(
-                (
-                    instance
-                    for instance in schedule.instances
-                    if instance.start == params.start
-                ),
-                None,
-            )
+    def _build_schedule_request(
+        self, event: bm.Event, instance: bm.EventInstance
+    ) -> t.ScheduleRequest:
+        at = naiveutcify(instance.start, event.timezone) - timedelta(minutes=15)
 
-            if instance is None:
-                cancel = cancel | {task.task.id}
-                continue
-
-        await asyncio.gather(*(self._cancel(task_id) for task_id in cancel))
-
-    async def _add(self, event: bm.Event, instance: bm.EventInstance) -> None:
-        utcstart = (
-            instance.start.replace(tzinfo=event.timezone)
-            .astimezone(UTC)
-            .replace(tzinfo=None)
-        )
-        at = utcstart - timedelta(minutes=15)
-
-        schedule_request = t.ScheduleRequest(
+        return t.ScheduleRequest(
             operation=t.Specification(
                 type="stream",
                 parameters={"id": str(event.id), "start": isostringify(instance.start)},
@@ -255,38 +265,233 @@ class StreamSynchronizer(Synchronizer):
             dependencies={},
         )
 
-        with suppress(se.ServiceError):
-            await self._scheduler.schedule(schedule_request)
+    async def _add(
+        self, instances: Sequence[tuple[bm.Event, bm.EventInstance]]
+    ) -> None:
+        if len(instances) == 0:
+            return
+
+        # Tasks that can't be scheduled are retried in the next synchronization
+        await self._scheduler.schedule_many(
+            [
+                self._build_schedule_request(event, instance)
+                for event, instance in instances
+            ]
+        )
 
-    async def _add_new_tasks(
+    def _find_new_tasks(
         self,
         schedules: Sequence[bm.Schedule],
         tasks: Sequence[tuple[t.GenericTask, Parameters]],
+    ) -> Sequence[tuple[bm.Event, bm.EventInstance]]:
+        existing = self._index_tasks(tasks)
+
+        return [
+            (event, instance)
+            for key, (event, instance) in self._index_instances(schedules).items()
+            if key not in existing
+        ]
+
+    def _find_starts(self, schedules: Sequence[bm.Schedule]) -> Sequence[datetime]:
+        return sorted(start for schedule in schedules for start in schedule.starts)
+
+    def _fingerprint(self, schedule: bm.Schedule) -> Fingerprint:
+        return (
+            str(schedule.event.timezone),
+            frozenset(instance.start for instance in schedule.instances),
+        )
+
+    def _group_tasks(
+        self, tasks: Sequence[tuple[t.GenericTask, Parameters]]
+    ) -> dict[UUID, frozenset[UUID]]:
+        groups: dict[UUID, set[UUID]] = {}
+
+        for task, params in tasks:
+            groups.setdefault(params.id, set()).add(task.task.id)
+
+        return {event_id: frozenset(ids) for event_id, ids in groups.items()}
+
+    def _skip_unchanged(
+        self,
+        synced: Synced,
+        schedules: Sequence[bm.Schedule],
+        tasks: Sequence[tuple[t.GenericTask, Parameters]],
+    ) -> tuple[Sequence[bm.Schedule], Sequence[tuple[t.GenericTask, Parameters]]]:
+        groups = self._group_tasks(tasks)
+
+        unchanged = {
+            schedule.event.id
+            for schedule in schedules
+            if synced.get(schedule.event.id)
+            == (
+                self._fingerprint(schedule),
+                groups.get(schedule.event.id, frozenset()),
+            )
+        }
+
+        return (
+            [schedule for schedule in schedules if schedule.event.id not in unchanged],
+            [(task, params) for task, params in tasks if params.id not in unchanged],
+        )
+
+    def _forget(
+        self,
+        synced: Synced,
+        schedules: Sequence[bm.Schedule],
+        ids: Collection[UUID] | None,
     ) -> None:
-        add: list[tuple[bm.Event, bm.EventInstance]] = []
+        current = {schedule.event.id for schedule in schedules}
+
+        # Events without instances in the window are not remembered anymore
+        forgotten = [
+            event_id
+            for event_id in synced
+            if event_id not in current and (ids is None or event_id in ids)
+        ]
+
+        for event_id in forgotten:
+            del synced[event_id]
+
+    def _remember(
+        self,
+        synced: Synced,
+        schedules: Sequence[bm.Schedule],
+        tasks: Sequence[tuple[t.GenericTask, Parameters]],
+    ) -> None:
+        instances = self._index_instances(schedules)
+        existing = self._index_tasks(tasks)
+        groups = self._group_tasks(tasks)
+
+        # Events that need changes are remembered only once they are in sync
+        changed = {event_id for event_id, _ in instances.keys() ^ existing.keys()}
 
         for schedule in schedules:
-            filtered = [
-                (task, params)
-                for task, params in tasks
-                if params.id == schedule.event.id
-            ]
+            if schedule.event.id in changed:
+                synced.pop(schedule.event.id, None)
+                continue
+
+            synced[schedule.event.id] = (
+                self._fingerprint(schedule),
+                groups.get(schedule.event.id, frozenset()),
+            )
+
+    async def _synchronize(
+        self, window: timedelta, ids: Collection[UUID] | None
+    ) -> SynchronizationResult:
+        start, end = self._get_time_window(window)
+        clock = [time.perf_counter()]
+
+        schedules = await self._get_schedules(start, end, ids)
+
+        # Events in schedules are fresh, so they don't have to be looked up again
+        self._events.put(schedule.event for schedule in schedules)
+
+        # Only schedules of all events show which instance is the nearest one
+        if ids is None:
+            self._starts = self._find_starts(schedules)
+
+        clock.append(time.perf_counter())
+
+        unfinished = await self._fetch_tasks()
 
-            for instance in schedule.instances:
-                exists = any(params.start == instance.start for _, params in filtered)
+        clock.append(time.perf_counter())
 
-                if not exists:
-                    add = [*add, (schedule.event, instance)]
+        valid, invalid = await self._filter_tasks(unfinished, start, end, ids)
 
-        await asyncio.gather(*(self._add(event, instance) for event, instance in add))
+        clock.append(time.perf_counter())
 
+        synced = self._synced.setdefault(window, {})
+
+        changed, tasks = self._skip_unchanged(synced, schedules, valid)
+        self._forget(synced, schedules, ids)
+        self._remember(synced, changed, tasks)
+
+        extra = self._find_extra_tasks(changed, tasks)
+        new = self._find_new_tasks(changed, tasks)
+
+        clock.append(time.perf_counter())
+
+        await self._cancel([task.task.id for task in invalid])
+        await self._cancel(extra)
+        await self._add(new)
+
+        clock.append(time.perf_counter())
+
+        self._metrics = SynchronizationMetrics(
+            synchronizations=self._metrics.synchronizations + 1,
+            events=len(schedules),
+            skipped=len(schedules) - len(changed),
+        )
+
+        durations = [
+            timedelta(seconds=after - before)
+            for before, after in itertools.pairwise(clock)
+        ]
+
+        return SynchronizationResult(
+            timings=SynchronizationTimings(
+                schedules=durations[0],
+                tasks=durations[1],
+                filtering=durations[2],
+                diffing=durations[3],
+                applying=durations[4],
+            ),
+            counts=SynchronizationCounts(
+                added=len(new), cancelled=len(extra), invalid=len(invalid)
+            ),
+        )
+
+    async def _plan(self, window: timedelta) -> SynchronizationPlan:
+        start, end = self._get_time_window(window)
+
+        schedules = await self._get_schedules(start, end, None)
+        self._events.put(schedule.event for schedule in schedules)
+
+        unfinished = await self._fetch_tasks()
+        valid, invalid = await self._filter_tasks(unfinished, start, end, None)
+
+        # Events remembered as in sync are skipped, but nothing is remembered
+        changed, tasks = self._skip_unchanged(
+            self._synced.get(window, {}), schedules, valid
+        )
+
+        return SynchronizationPlan(
+            add=[
+                self._build_schedule_request(event, instance)
+                for event, instance in self._find_new_tasks(changed, tasks)
+            ],
+            invalid={task.task.id for task in invalid},
+            extra=self._find_extra_tasks(changed, tasks),
+        )
+
+    @property
+    @override
+    def metrics(self) -> SynchronizationMetrics:
+        return self._metrics
+
+    @property
     @override
-    async def synchronize(self) -> None:
-        start, end = self._get_time_window()
+    def upcoming(self) -> datetime | None:
+        index = bisect.bisect_right(self._starts, naiveutcnow())
 
-        schedules = await self._get_schedules(start, end)
-        valid, invalid = await self._get_unfinished_tasks(start, end)
+        if index == len(self._starts):
+            return None
 
-        await self._cancel_invalid_tasks(invalid)
-        await self._cancel_extra_tasks(schedules, valid)
-        await self._add_new_tasks(schedules, valid)
+        return self._starts[index]
+
+    @override
+    async def synchronize(
+        self, window: timedelta | None = None
+    ) -> SynchronizationResult:
+        return await self._synchronize(window or self._config.window, None)
+
+    @override
+    async def synchronize_events(
+        self, ids: Collection[UUID], window: timedelta | None = None
+    ) -> SynchronizationResult:
+        self._events.invalidate(ids)
+        return await self._synchronize(window or self._config.window, ids)
+
+    @override
+    async def plan(self, window: timedelta | None = None) -> SynchronizationPlan:
+        return await self._plan(window or self._config.window)
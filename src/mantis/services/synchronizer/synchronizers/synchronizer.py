@@ -1,9 +1,47 @@
 from abc import ABC, abstractmethod
+from collections.abc import Collection
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from mantis.models.events.synchronization import SynchronizationResult
+from mantis.services.synchronizer.metrics import SynchronizationMetrics
+from mantis.services.synchronizer.plans import SynchronizationPlan
 
 
 class Synchronizer(ABC):
     """Base class for synchronizers."""
 
+    @property
+    @abstractmethod
+    def metrics(self) -> SynchronizationMetrics:
+        """Metrics of synchronizations."""
+
+    @property
+    @abstractmethod
+    def upcoming(self) -> datetime | None:
+        """Start in UTC of the nearest instance that hasn't started yet, if any."""
+
+    @abstractmethod
+    async def synchronize(
+        self, window: timedelta | None = None
+    ) -> SynchronizationResult:
+        """Synchronize tasks.
+
+        Without a window, the default window of the synchronizer is used.
+        """
+
+    @abstractmethod
+    async def synchronize_events(
+        self, ids: Collection[UUID], window: timedelta | None = None
+    ) -> SynchronizationResult:
+        """Synchronize tasks of the given events only.
+
+        Without a window, the default window of the synchronizer is used.
+        """
+
     @abstractmethod
-    async def synchronize(self) -> None:
-        """Synchronize tasks."""
+    async def plan(self, window: timedelta | None = None) -> SynchronizationPlan:
+        """Compute changes that a synchronization would make without making them.
+
+        Without a window, the default window of the synchronizer is used.
+        """
@@ -0,0 +1,52 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+
+# Items on a page and the total number of items
+type Page[T] = tuple[Sequence[T], int]
+
+# Function that fetches a page given a limit and an offset
+type PageFetcher[T] = Callable[[int | None, int], Awaitable[Page[T]]]
+
+
+class Paginator:
+    """Utility to fetch all items of a paginated list.
+
+    The first page reveals the total number of items and the size of a page.
+    The remaining pages are then fetched concurrently.
+
+    Args:
+        size: Number of items to request per page, or None to let the server decide.
+        concurrency: Maximum number of pages fetched concurrently.
+
+    """
+
+    def __init__(self, size: int | None, concurrency: int) -> None:
+        self._size = size
+        self._concurrency = concurrency
+
+    async def paginate[T](self, fetch: PageFetcher[T]) -> Sequence[T]:
+        """Fetch all items."""
+        first, count = await fetch(self._size, 0)
+
+        items = list(first)
+        # The server might return fewer items than requested
+        step = len(first)
+
+        if step == 0 or step >= count:
+            return items
+
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def _fetch(offset: int) -> Sequence[T]:
+            async with semaphore:
+                page, _ = await fetch(step, offset)
+                return page
+
+        pages = await asyncio.gather(
+            *(_fetch(offset) for offset in range(step, count, step))
+        )
+
+        for page in pages:
+            items.extend(page)
+
+        return items
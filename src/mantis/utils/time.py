@@ -1,4 +1,6 @@
-from datetime import UTC, datetime
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime, timedelta, tzinfo
 from email.utils import format_datetime, parsedate_to_datetime
 from typing import Annotated, Any
 from zoneinfo import ZoneInfo
@@ -36,6 +38,9 @@ type Timezone = Annotated[
     Field(examples=["Europe/Warsaw"]),
 ]
 
+# Offsets in tzdata never change and change back within six days since 1970
+_RUN = timedelta(days=6)
+
 
 def awareutcnow() -> AwareDatetime:
     """Return the current datetime in UTC with timezone information."""
@@ -47,6 +52,61 @@ def naiveutcnow() -> NaiveDatetime:
     return awareutcnow().replace(tzinfo=None)
 
 
+def _offset(dt: datetime, tz: tzinfo) -> timedelta:
+    return dt.replace(tzinfo=tz).utcoffset() or timedelta()
+
+
+def naiveutcify(dt: datetime, tz: tzinfo) -> NaiveDatetime:
+    """Convert a naive datetime in a timezone to a naive datetime in UTC."""
+    return dt.replace(tzinfo=tz).astimezone(UTC).replace(tzinfo=None)
+
+
+def naiveutcifyall(dts: Iterable[datetime], tz: tzinfo) -> Sequence[NaiveDatetime]:
+    """Convert naive datetimes in the same timezone to naive datetimes in UTC.
+
+    Datetimes are converted in sorted runs that share the same offset,
+    so the offset is looked up once per run instead of once per datetime.
+    Offsets are assumed not to change and change back within six days.
+    """
+    dts = list(dts)
+    converted = list(dts)
+
+    # Offsets in overlaps depend on fold, so runs are split by fold too
+    items = sorted((dt.fold, dt, index) for index, dt in enumerate(dts))
+
+    start = 0
+    while start < len(items):
+        fold, first, index = items[start]
+        offset = _offset(first, tz)
+        converted[index] = first - offset
+        start += 1
+
+        bound = (fold, first + _RUN)
+
+        # Sparse datetimes make runs of one, so the next one is checked first
+        if start == len(items) or items[start] >= bound:
+            continue
+
+        end = bisect_left(items, bound, lo=start)
+
+        # There is at most one transition in the run, so offsets change only once
+        if _offset(items[end - 1][1], tz) != offset:
+            end = bisect_left(
+                items,
+                1,
+                lo=start,
+                hi=end - 1,
+                key=lambda item: int(_offset(item[1], tz) != offset),
+            )
+
+        for _, dt, index in items[start:end]:
+            converted[index] = dt - offset
+
+        start = end
+
+    return converted
+
+
 def isostringify(dt: datetime) -> str:
     """Convert a datetime to a string in ISO 8601 format."""
     return dt.isoformat().replace("+00:00", "Z")
@@ -32,6 +32,7 @@ def env(path: Path) -> Generator[Mapping[str, str]]:
     old = os.environ.copy()
 
     try:
+        os.environ["MANTIS__STORE__ARCHIVE__PATH"] = str(path.parent / "archive")
         os.environ["MANTIS__STORE__PATH"] = str(path)
 
         yield os.environ
@@ -0,0 +1,92 @@
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from litestar.status_codes import HTTP_204_NO_CONTENT, HTTP_503_SERVICE_UNAVAILABLE
+from litestar.testing import AsyncTestClient
+
+from mantis.api.app import AppBuilder
+from mantis.config.models import Config
+from tests.utils.containers import AsyncDockerContainer
+from tests.utils.proxy import AsyncTCPProxy
+from tests.utils.ready import wait_for_ready
+
+
+def _build_config(config: Config, path: Path, port: int) -> Config:
+    """Build configuration for a separate app that reaches beaver through a port."""
+    archive = config.store.archive.model_copy(update={"path": path / "archive"})
+    store = config.store.model_copy(
+        update={"archive": archive, "path": path / "state.json"}
+    )
+
+    http = config.beaver.http.model_copy(update={"port": port})
+    beaver = config.beaver.model_copy(update={"http": http})
+
+    # Failed synchronizations are retried quickly
+    synchronizer = config.synchronizer.model_copy(
+        update={"interval": timedelta(seconds=1)}
+    )
+
+    return config.model_copy(
+        update={"beaver": beaver, "store": store, "synchronizer": synchronizer}
+    )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_before_synchronization(
+    config: Config, beaver: AsyncDockerContainer, tmp_path: Path
+) -> None:
+    """Test if GET /ready returns 503 until the first synchronization succeeds."""
+    async with AsyncTCPProxy(config.beaver.http.port or 80) as proxy:
+        app = AppBuilder(_build_config(config, tmp_path, proxy.port)).build()
+
+        async with AsyncTestClient(app=app) as client:
+            # Beaver can't be reached yet, so synchronizations fail
+            response = await client.get("/ready")
+
+            status = response.status_code
+            assert status == HTTP_503_SERVICE_UNAVAILABLE
+
+            await proxy.start()
+            await wait_for_ready(client)
+
+            response = await client.get("/ready")
+
+            status = response.status_code
+            assert status == HTTP_204_NO_CONTENT
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_after_synchronization(client: AsyncTestClient) -> None:
+    """Test if GET /ready returns correct response after the first synchronization."""
+    await wait_for_ready(client)
+
+    response = await client.get("/ready")
+
+    status = response.status_code
+    assert status == HTTP_204_NO_CONTENT
+
+    headers = response.headers
+    assert "Cache-Control" in headers
+    assert headers["Cache-Control"] == "no-store"
+
+    content = response.content
+    assert len(content) == 0
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_head_after_synchronization(client: AsyncTestClient) -> None:
+    """Test if HEAD /ready returns correct response after the first synchronization."""
+    await wait_for_ready(client)
+
+    response = await client.head("/ready")
+
+    status = response.status_code
+    assert status == HTTP_204_NO_CONTENT
+
+    headers = response.headers
+    assert "Cache-Control" in headers
+    assert headers["Cache-Control"] == "no-store"
+
+    content = response.content
+    assert len(content) == 0
@@ -0,0 +1,35 @@
+import pytest
+from litestar.status_codes import HTTP_200_OK
+from litestar.testing import AsyncTestClient
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_metrics(client: AsyncTestClient) -> None:
+    """Test if GET /store/metrics returns correct response."""
+    response = await client.get("/store/metrics")
+
+    status = response.status_code
+    assert status == HTTP_200_OK
+
+    data = response.json()
+    assert isinstance(data, dict)
+    assert "commits" in data
+    assert "changes" in data
+    assert "latency" in data
+    assert "batch" in data
+
+    commits = data["commits"]
+    assert isinstance(commits, int)
+    assert commits >= 0
+
+    changes = data["changes"]
+    assert isinstance(changes, int)
+    assert changes >= 0
+
+    latency = data["latency"]
+    assert isinstance(latency, dict)
+    assert set(latency) == {"last", "mean", "max"}
+
+    batch = data["batch"]
+    assert isinstance(batch, dict)
+    assert set(batch) == {"last", "mean", "max"}
@@ -0,0 +1,135 @@
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from litestar.status_codes import HTTP_200_OK
+from litestar.testing import AsyncTestClient
+
+from tests.utils.ready import wait_for_ready
+
+
+def _check_report(report: Any) -> None:
+    """Check if a synchronization report has correct structure."""
+    assert isinstance(report, dict)
+    assert "kind" in report
+    assert "started" in report
+    assert "duration" in report
+    assert "window" in report
+    assert "results" in report
+    assert "error" in report
+
+    results = report["results"]
+    assert isinstance(results, dict)
+
+    for result in results.values():
+        assert isinstance(result, dict)
+        assert "timings" in result
+        assert "counts" in result
+
+        counts = result["counts"]
+        assert isinstance(counts, dict)
+        assert set(counts) == {"added", "cancelled", "invalid"}
+
+
+def _check_plans(plans: Any) -> None:
+    """Check if synchronization plans have correct structure."""
+    assert isinstance(plans, dict)
+    assert "stream" in plans
+
+    for plan in plans.values():
+        assert isinstance(plan, dict)
+        assert "add" in plan
+        assert "invalid" in plan
+        assert "extra" in plan
+
+        assert isinstance(plan["add"], list)
+        assert isinstance(plan["invalid"], list)
+        assert isinstance(plan["extra"], list)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_metrics(client: AsyncTestClient) -> None:
+    """Test if GET /synchronizer/metrics returns correct response."""
+    await wait_for_ready(client)
+
+    response = await client.get("/synchronizer/metrics")
+
+    status = response.status_code
+    assert status == HTTP_200_OK
+
+    data = response.json()
+    assert isinstance(data, dict)
+    assert "stream" in data
+
+    metrics = data["stream"]
+    assert isinstance(metrics, dict)
+    assert "synchronizations" in metrics
+    assert "events" in metrics
+    assert "skipped" in metrics
+
+    synchronizations = metrics["synchronizations"]
+    assert isinstance(synchronizations, int)
+    assert synchronizations >= 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_history(client: AsyncTestClient) -> None:
+    """Test if GET /synchronizer/history returns correct response."""
+    await wait_for_ready(client)
+
+    response = await client.get("/synchronizer/history")
+
+    status = response.status_code
+    assert status == HTTP_200_OK
+
+    data = response.json()
+    assert isinstance(data, list)
+    assert len(data) >= 1
+
+    for report in data:
+        _check_report(report)
+
+    assert any(report["error"] is None for report in data)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_plan(client: AsyncTestClient) -> None:
+    """Test if GET /synchronizer/plan returns correct response."""
+    response = await client.get("/synchronizer/plan")
+
+    status = response.status_code
+    assert status == HTTP_200_OK
+
+    _check_plans(response.json())
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_plan_with_window(client: AsyncTestClient) -> None:
+    """Test if GET /synchronizer/plan with window returns correct response."""
+    response = await client.get("/synchronizer/plan", params={"window": "PT2H"})
+
+    status = response.status_code
+    assert status == HTTP_200_OK
+
+    _check_plans(response.json())
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_post_events(client: AsyncTestClient) -> None:
+    """Test if POST /synchronizer/events returns correct response."""
+    response = await client.post(
+        "/synchronizer/events",
+        json={"ids": [str(uuid4())]},
+    )
+
+    status = response.status_code
+    assert status == HTTP_200_OK
+
+    data = response.json()
+    _check_report(data)
+
+    kind = data["kind"]
+    assert kind == "events"
+
+    error = data["error"]
+    assert error is None
@@ -1,11 +1,37 @@
+import asyncio
 from datetime import datetime
 from uuid import UUID
 
 import pytest
-from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED
+from litestar.status_codes import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_409_CONFLICT,
+)
 from litestar.testing import AsyncTestClient
 
 
+async def _complete(client: AsyncTestClient) -> str:
+    """Schedule a task and wait until it completes."""
+    response = await client.post(
+        "/tasks",
+        json={
+            "operation": {"type": "test", "parameters": {}},
+            "condition": {"type": "now", "parameters": {}},
+            "dependencies": {},
+        },
+    )
+    task_id = response.json()["task"]["id"]
+
+    async with asyncio.timeout(30):
+        while True:
+            response = await client.get(f"/tasks/{task_id}")
+            if response.json()["status"] == "completed":
+                return task_id
+
+            await asyncio.sleep(0.1)
+
+
 @pytest.mark.asyncio(loop_scope="session")
 async def test_post(client: AsyncTestClient) -> None:
     """Test if POST /tasks returns correct response."""
@@ -170,3 +196,50 @@ async def test_get_by_id(client: AsyncTestClient) -> None:
         "failed",
         "completed",
     }
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_post_with_completed_dependency(client: AsyncTestClient) -> None:
+    """Test if POST /tasks accepts a recently completed task as a dependency."""
+    dependency_id = await _complete(client)
+    dependencies = {"previous": dependency_id}
+
+    response = await client.post(
+        "/tasks",
+        json={
+            "operation": {"type": "test", "parameters": {}},
+            "condition": {"type": "now", "parameters": {}},
+            "dependencies": dependencies,
+        },
+    )
+
+    status = response.status_code
+    assert status == HTTP_201_CREATED
+
+    data = response.json()
+    assert "task" in data
+
+    task = data["task"]
+    assert isinstance(task, dict)
+    assert "dependencies" in task
+
+    tdependencies = task["dependencies"]
+    assert isinstance(tdependencies, dict)
+    assert tdependencies == dependencies
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_delete_completed(client: AsyncTestClient) -> None:
+    """Test if DELETE /tasks/{id} rejects a recently completed task."""
+    task_id = await _complete(client)
+
+    response = await client.delete(f"/tasks/{task_id}")
+
+    # Finished tasks can't be cancelled, but they must still be found
+    status = response.status_code
+    assert status == HTTP_409_CONFLICT
+
+    response = await client.get(f"/tasks/completed/{task_id}")
+
+    status = response.status_code
+    assert status == HTTP_200_OK
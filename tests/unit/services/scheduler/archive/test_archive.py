@@ -0,0 +1,42 @@
+from collections.abc import Callable
+from datetime import timedelta
+from uuid import UUID
+
+import pytest
+
+from mantis.services.scheduler.archive.archive import Archive
+from mantis.services.scheduler.archive.segments import Segments
+from mantis.services.scheduler.cleaning.strategies.timedelta import (
+    TimedeltaCleaningStrategy,
+)
+from mantis.utils.time import naiveutcnow
+
+
+@pytest.mark.asyncio
+async def test_clean_by_index(
+    monkeypatch: pytest.MonkeyPatch, open_segments: Callable[..., Segments]
+) -> None:
+    """Test if tasks are cleaned by finishing times without reading records."""
+    segments = open_segments()
+
+    for task_id, age in ((UUID(int=1), 2), (UUID(int=2), 0)):
+        completed = naiveutcnow() - timedelta(days=age)
+        task = {"completed": completed.isoformat()}
+        segments.add({str(task_id): {"bucket": "completed", "task": task}})
+
+    segments.flush()
+
+    def _get_many(*args: object) -> None:
+        message = "Records should not be read."
+        raise AssertionError(message)
+
+    monkeypatch.setattr(segments, "get_many", _get_many)
+
+    archive = Archive(segments=segments)
+    strategy = TimedeltaCleaningStrategy()
+
+    removed = await archive.clean(strategy, {"delta": "P1D"})
+
+    assert removed == {UUID(int=1)}
+    assert set(segments.list()) == {UUID(int=2)}
+    segments.close()
@@ -0,0 +1,170 @@
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import UUID
+
+from mantis.services.scheduler.archive.segments import Segments
+from mantis.services.scheduler.backends import records as r
+
+FIRST = UUID(int=1)
+
+SECOND = UUID(int=2)
+
+THIRD = UUID(int=3)
+
+FINISHED = datetime(2000, 1, 1)
+
+
+def _build_record(value: int) -> r.Record:
+    """Build a record of a completed task."""
+    completed = FINISHED + timedelta(days=value)
+    return {"bucket": "completed", "task": {"completed": completed.isoformat()}}
+
+
+def _build_segments(open_segments: Callable[..., Segments]) -> None:
+    """Archive each task in a separate segment."""
+    segments = open_segments()
+
+    for value, task_id in enumerate((FIRST, SECOND, THIRD)):
+        segments.add({str(task_id): _build_record(value)})
+        segments.flush()
+
+    segments.close()
+
+
+def test_reopen(open_segments: Callable[..., Segments]) -> None:
+    """Test if archived tasks are read after a restart."""
+    _build_segments(open_segments)
+
+    segments = open_segments()
+    assert segments.get(FIRST) == _build_record(0)
+    assert segments.get_many([SECOND, THIRD]) == {
+        SECOND: _build_record(1),
+        THIRD: _build_record(2),
+    }
+    segments.close()
+
+
+def test_list_finished(open_segments: Callable[..., Segments]) -> None:
+    """Test if times at which tasks finished are kept in the index."""
+    _build_segments(open_segments)
+
+    segments = open_segments()
+    segments.add({str(UUID(int=4)): {"bucket": "cancelled", "task": {}}})
+
+    assert segments.list_finished() == {
+        FIRST: FINISHED,
+        SECOND: FINISHED + timedelta(days=1),
+        THIRD: FINISHED + timedelta(days=2),
+        UUID(int=4): None,
+    }
+
+    segments.flush()
+    segments.close()
+
+    segments = open_segments()
+    assert segments.list_finished()[UUID(int=4)] is None
+    segments.close()
+
+
+def test_torn_tail(tmp_path: Path, open_segments: Callable[..., Segments]) -> None:
+    """Test if a torn record at the end of the last segment is dropped."""
+    _build_segments(open_segments)
+
+    last = max((tmp_path / "archive").glob("*.segment"))
+    size = last.stat().st_size
+
+    with last.open("ab") as file:
+        file.write(UUID(int=4).bytes + b"\x03\x00")
+
+    segments = open_segments()
+    assert last.stat().st_size == size
+    assert segments.list() == dict.fromkeys((FIRST, SECOND, THIRD), "completed")
+    segments.close()
+
+
+def test_invalid_index(tmp_path: Path, open_segments: Callable[..., Segments]) -> None:
+    """Test if an invalid index is rebuilt from its segment."""
+    _build_segments(open_segments)
+
+    index = min((tmp_path / "archive").glob("*.index"))
+    data = index.read_bytes()
+    index.write_bytes(data[:-1] + bytes([data[-1] ^ 0xFF]))
+
+    segments = open_segments()
+    assert segments.get(FIRST) == _build_record(0)
+    assert segments.list_finished()[FIRST] == FINISHED
+    segments.close()
+
+    assert index.read_bytes() == data
+
+
+def test_missing_index(tmp_path: Path, open_segments: Callable[..., Segments]) -> None:
+    """Test if a missing index is rebuilt from its segment."""
+    _build_segments(open_segments)
+
+    index = min((tmp_path / "archive").glob("*.index"))
+    data = index.read_bytes()
+    index.unlink()
+
+    segments = open_segments()
+    assert segments.get(FIRST) == _build_record(0)
+    assert segments.list_finished()[FIRST] == FINISHED
+    segments.close()
+
+    assert index.read_bytes() == data
+
+
+def test_remove(open_segments: Callable[..., Segments]) -> None:
+    """Test if removed tasks stay removed after a restart."""
+    _build_segments(open_segments)
+
+    segments = open_segments()
+    segments.remove([SECOND])
+    segments.close()
+
+    segments = open_segments()
+    assert segments.get(SECOND) is None
+    assert set(segments.list()) == {FIRST, THIRD}
+    segments.close()
+
+
+def test_compact(tmp_path: Path, open_segments: Callable[..., Segments]) -> None:
+    """Test if compaction keeps only live tasks in new segments."""
+    _build_segments(open_segments)
+
+    segments = open_segments()
+    segments.remove([FIRST, SECOND])
+    old = set((tmp_path / "archive").glob("*.segment"))
+    segments.compact()
+    segments.close()
+
+    segments = open_segments()
+    assert not old & set((tmp_path / "archive").glob("*.segment"))
+    assert segments.list() == {THIRD: "completed"}
+    assert segments.list_finished() == {THIRD: FINISHED + timedelta(days=2)}
+    assert segments.get(THIRD) == _build_record(2)
+    segments.close()
+
+
+def test_read_only(tmp_path: Path, open_segments: Callable[..., Segments]) -> None:
+    """Test if segments are read without writing anything in read-only mode."""
+    _build_segments(open_segments)
+
+    path = tmp_path / "archive"
+    last = max(path.glob("*.segment"))
+
+    with last.open("ab") as file:
+        file.write(UUID(int=4).bytes + b"\x03\x00")
+
+    index = min(path.glob("*.index"))
+    index.unlink()
+
+    files = {file: file.read_bytes() for file in path.iterdir()}
+
+    segments = open_segments(read_only=True)
+    assert segments.list() == dict.fromkeys((FIRST, SECOND, THIRD), "completed")
+    assert segments.get(FIRST) == _build_record(0)
+    segments.close()
+
+    assert {file: file.read_bytes() for file in path.iterdir()} == files
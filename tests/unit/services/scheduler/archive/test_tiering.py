@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+from pyscheduler.models.data import storage as s
+
+from mantis.services.scheduler.archive import tiering
+
+NOW = datetime(2000, 1, 2)
+
+CUTOFF = NOW - timedelta(days=1)
+
+
+def _build_state(
+    completed: dict[str, datetime], waiting: dict[str, list[str]]
+) -> s.State:
+    """Build a state with completed tasks and waiting tasks depending on them."""
+    state: dict[str, Any] = {
+        "tasks": {
+            "queued": {},
+            "waiting": {task_id: {"task": {}} for task_id in waiting},
+            "sleeping": {},
+            "running": {},
+            "cancelled": {},
+            "failed": {},
+            "completed": {
+                task_id: {"task": {}, "completed": time.isoformat()}
+                for task_id, time in completed.items()
+            },
+        },
+        "statuses": {},
+        "relationships": {"dependents": {}, "dependencies": {}},
+    }
+
+    for task_id, dependencies in waiting.items():
+        state["relationships"]["dependencies"][task_id] = dependencies
+
+        for dependency_id in dependencies:
+            dependents = state["relationships"]["dependents"]
+            dependents.setdefault(dependency_id, []).append(task_id)
+
+    return state
+
+
+def test_split_archives_old() -> None:
+    """Test if tasks that finished before the cutoff are archived."""
+    state = _build_state({"old": NOW - timedelta(days=2)}, {})
+
+    hot, archived = tiering.split(state, CUTOFF)
+
+    assert set(archived) == {"old"}
+    assert hot["tasks"]["completed"] == {}
+
+
+def test_split_keeps_recent() -> None:
+    """Test if tasks that finished after the cutoff stay in the hot state."""
+    state = _build_state({"recent": NOW}, {})
+
+    hot, archived = tiering.split(state, CUTOFF)
+
+    assert archived == {}
+    assert "recent" in hot["tasks"]["completed"]
+
+
+def test_split_keeps_dependencies() -> None:
+    """Test if old tasks with unfinished dependents stay in the hot state."""
+    state = _build_state({"old": NOW - timedelta(days=2)}, {"waiting": ["old"]})
+
+    hot, archived = tiering.split(state, CUTOFF)
+
+    assert archived == {}
+    assert "old" in hot["tasks"]["completed"]
+    assert hot["relationships"]["dependents"]["old"] == ["waiting"]
+
+
+def test_finished_aware() -> None:
+    """Test if finish times with timezone are converted to naive UTC."""
+    task = {"completed": "2000-01-01T01:00:00+01:00"}
+
+    assert tiering.finished(task, "completed") == datetime(2000, 1, 1)
+
+
+def test_finished_missing() -> None:
+    """Test if unknown finish times are reported as missing."""
+    assert tiering.finished({}, "completed") is None
+    assert tiering.finished({"completed": "invalid"}, "completed") is None
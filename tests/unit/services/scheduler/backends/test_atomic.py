@@ -0,0 +1,83 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from pyscheduler.models.data import storage as s
+
+from mantis.services.scheduler.backends.atomic import AtomicFile
+
+
+@pytest.fixture
+def path(
+    open_file: Callable[[], AtomicFile],
+    build_state: Callable[..., s.State],
+    tmp_path: Path,
+) -> Path:
+    """Write two generations of the state."""
+    file = open_file()
+    file.write(build_state("old"), sync=True)
+    file.write(build_state("new"), sync=True)
+
+    return tmp_path / "state.json"
+
+
+def test_read_current(
+    path: Path,
+    open_file: Callable[[], AtomicFile],
+    build_state: Callable[..., s.State],
+) -> None:
+    """Test if the current generation is read when it is valid."""
+    assert open_file().read() == build_state("new")
+
+
+def test_read_torn_current(
+    path: Path,
+    open_file: Callable[[], AtomicFile],
+    build_state: Callable[..., s.State],
+) -> None:
+    """Test if the previous generation is read when the current one is torn."""
+    path.write_bytes(path.read_bytes()[:-1])
+
+    assert open_file().read() == build_state("old")
+
+
+def test_read_empty_current(
+    path: Path,
+    open_file: Callable[[], AtomicFile],
+    build_state: Callable[..., s.State],
+) -> None:
+    """Test if the previous generation is read when the current one is empty."""
+    path.write_bytes(b"")
+
+    assert open_file().read() == build_state("old")
+
+
+def test_read_missing_current(
+    path: Path,
+    open_file: Callable[[], AtomicFile],
+    build_state: Callable[..., s.State],
+) -> None:
+    """Test if the previous generation is read when the current one is missing."""
+    # Crash after the current generation was moved, but before it was replaced
+    path.unlink()
+
+    assert open_file().read() == build_state("old")
+
+
+def test_read_ignores_temporary(
+    path: Path,
+    open_file: Callable[[], AtomicFile],
+    build_state: Callable[..., s.State],
+) -> None:
+    """Test if an interrupted write doesn't affect the current generation."""
+    path.with_name(f"{path.name}.tmp").write_bytes(b'{"tasks":')
+
+    assert open_file().read() == build_state("new")
+
+
+def test_read_nothing(path: Path, open_file: Callable[[], AtomicFile]) -> None:
+    """Test if nothing is read when no generation is valid."""
+    path.write_bytes(b"{")
+    path.with_name(f"{path.name}.previous").write_bytes(b"{")
+
+    assert open_file().read() is None
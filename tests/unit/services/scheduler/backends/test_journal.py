@@ -0,0 +1,158 @@
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+from pyscheduler.models.data import storage as s
+
+from mantis.services.scheduler.backends.journal import JournalBackend
+
+
+def test_replay(
+    tmp_path: Path,
+    open_journal: Callable[..., JournalBackend],
+    build_state: Callable[..., s.State],
+) -> None:
+    """Test if changes are replayed from the journal after a crash."""
+    backend = open_journal()
+    backend.save(build_state("a", "b"))
+    backend.save(build_state("b", "c"))
+
+    # The backend is not closed, like after a crash
+    assert not (tmp_path / "state.json").exists()
+
+    backend = open_journal()
+    assert backend.load() == build_state("b", "c")
+    backend.close()
+
+
+def test_replay_torn_tail(
+    tmp_path: Path,
+    open_journal: Callable[..., JournalBackend],
+    build_state: Callable[..., s.State],
+) -> None:
+    """Test if a torn entry at the end of the journal is dropped on replay."""
+    journal = tmp_path / "state.json.journal"
+
+    backend = open_journal()
+    backend.save(build_state("a"))
+
+    size = journal.stat().st_size
+    with journal.open("ab") as file:
+        file.write(b'{"put":{"b":')
+
+    backend = open_journal()
+    assert backend.load() == build_state("a")
+    assert journal.stat().st_size == size
+
+    # Entries appended after the dropped tail are replayed as well
+    backend.save(build_state("a", "c"))
+
+    backend = open_journal()
+    assert backend.load() == build_state("a", "c")
+    backend.close()
+
+
+def test_replay_rotated(
+    tmp_path: Path,
+    open_journal: Callable[..., JournalBackend],
+    build_state: Callable[..., s.State],
+) -> None:
+    """Test if a journal rotated by an interrupted compaction is replayed."""
+    journal = tmp_path / "state.json.journal"
+    rotated = tmp_path / "state.json.journal.old"
+
+    backend = open_journal()
+    backend.save(build_state("a"))
+
+    # Crash after the journal was rotated, but before the snapshot was written
+    journal.replace(rotated)
+
+    backend = open_journal()
+    assert backend.load() == build_state("a")
+    assert (tmp_path / "state.json").exists()
+    assert not rotated.exists()
+    backend.close()
+
+
+def test_compaction(
+    tmp_path: Path,
+    open_journal: Callable[..., JournalBackend],
+    build_state: Callable[..., s.State],
+) -> None:
+    """Test if the journal is compacted into the snapshot when it grows."""
+    journal = tmp_path / "state.json.journal"
+    rotated = tmp_path / "state.json.journal.old"
+
+    backend = open_journal(records=2)
+    backend.save(build_state("a"))
+    backend.save(build_state("a", "b"))
+    backend.save(build_state("b"))
+
+    # Waits for the compaction started in the background, then compacts the rest
+    backend.compact()
+
+    assert not rotated.exists()
+    assert journal.stat().st_size == 0
+
+    backend = open_journal()
+    assert backend.load() == build_state("b")
+    backend.close()
+
+
+def test_close(
+    tmp_path: Path,
+    open_journal: Callable[..., JournalBackend],
+    build_state: Callable[..., s.State],
+) -> None:
+    """Test if the journal is compacted into the snapshot on close."""
+    backend = open_journal()
+    backend.save(build_state("a"))
+    backend.close()
+
+    assert not (tmp_path / "state.json.journal").exists()
+
+    backend = open_journal()
+    assert backend.load() == build_state("a")
+    backend.close()
+
+
+def test_save_changed(
+    tmp_path: Path,
+    open_journal: Callable[..., JournalBackend],
+    build_state: Callable[..., s.State],
+) -> None:
+    """Test if only changed tasks are written when they are known."""
+    backend = open_journal()
+    backend.save(build_state("a"))
+    backend.save(build_state("a", "b"), {"b"})
+
+    lines = (tmp_path / "state.json.journal").read_bytes().splitlines()
+    assert json.loads(lines[-1])["put"].keys() == {"b"}
+
+    backend = open_journal()
+    assert backend.load() == build_state("a", "b")
+    backend.close()
+
+
+def test_read_only(
+    tmp_path: Path,
+    open_journal: Callable[..., JournalBackend],
+    build_state: Callable[..., s.State],
+) -> None:
+    """Test if the journal is replayed without writing anything in read-only mode."""
+    journal = tmp_path / "state.json.journal"
+
+    backend = open_journal()
+    backend.save(build_state("a"))
+
+    with journal.open("ab") as file:
+        file.write(b'{"put":{"b":')
+
+    data = journal.read_bytes()
+
+    backend = open_journal(read_only=True)
+    assert backend.load() == build_state("a")
+    backend.close()
+
+    assert journal.read_bytes() == data
+    assert not (tmp_path / "state.json").exists()
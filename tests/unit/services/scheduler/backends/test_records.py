@@ -0,0 +1,40 @@
+from collections.abc import Callable
+
+from pyscheduler.models.data import storage as s
+
+from mantis.services.scheduler.backends import records as r
+
+
+def test_split_merge(build_state: Callable[..., s.State]) -> None:
+    """Test if the state is the same after splitting and merging it."""
+    state = build_state("a", "b")
+
+    assert r.merge(r.split(state)) == state
+
+
+def test_changes(build_state: Callable[..., s.State]) -> None:
+    """Test if added, removed and modified tasks are found as changed."""
+    old = build_state("a", "b", "c")
+    new = build_state("b", "c", "d")
+    new["tasks"]["cancelled"]["c"] = {"changed": True}
+
+    assert r.changes(old, new) == {"a", "c", "d"}
+
+
+def test_changes_moved(build_state: Callable[..., s.State]) -> None:
+    """Test if tasks that moved between buckets are found as changed."""
+    old = build_state("a")
+    new = build_state()
+    new["tasks"]["completed"]["a"] = old["tasks"]["cancelled"]["a"]
+
+    assert r.changes(old, new) == {"a"}
+
+
+def test_extract(build_state: Callable[..., s.State]) -> None:
+    """Test if records are extracted only for the given tasks."""
+    state = build_state("a", "b")
+
+    records, removed = r.extract(state, ["a", "c"])
+
+    assert records == {"a": r.split(state)["a"]}
+    assert removed == {"c"}
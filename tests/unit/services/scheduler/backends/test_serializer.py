@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+from mantis.config.models import (
+    StoreSerializerCompression,
+    StoreSerializerConfig,
+    StoreSerializerFormat,
+)
+from mantis.services.scheduler.backends import records as r
+from mantis.services.scheduler.backends.serializer import HEADER, MAGIC, Serializer
+
+STATE = r.merge({"task": {"bucket": "cancelled", "task": {"value": "é"}}})
+
+CONFIG = StoreSerializerConfig(
+    format=StoreSerializerFormat.MSGPACK,
+    compression=StoreSerializerCompression.GZIP,
+)
+
+
+@pytest.mark.parametrize("encoding", list(StoreSerializerFormat))
+@pytest.mark.parametrize("compression", list(StoreSerializerCompression))
+def test_roundtrip(
+    encoding: StoreSerializerFormat, compression: StoreSerializerCompression
+) -> None:
+    """Test if the state is the same after serialization and deserialization."""
+    config = StoreSerializerConfig(format=encoding, compression=compression)
+    serializer = Serializer(config)
+
+    assert serializer.deserialize(serializer.serialize(STATE)) == STATE
+
+
+def test_plain_json() -> None:
+    """Test if plain JSON is written without a header."""
+    data = Serializer(StoreSerializerConfig()).serialize(STATE)
+
+    assert not data.startswith(MAGIC)
+    assert json.loads(data) == STATE
+
+
+def test_other_configuration() -> None:
+    """Test if the state is read regardless of the current configuration."""
+    data = Serializer(CONFIG).serialize(STATE)
+
+    assert Serializer(StoreSerializerConfig()).deserialize(data) == STATE
+
+
+def test_checksum_mismatch() -> None:
+    """Test if a corrupted payload is rejected."""
+    data = bytearray(Serializer(CONFIG).serialize(STATE))
+    data[-1] = data[-1] ^ 0xFF
+
+    with pytest.raises(ValueError, match="Checksum mismatch"):
+        Serializer(CONFIG).deserialize(bytes(data))
+
+
+def test_truncated_header() -> None:
+    """Test if a header cut short is rejected."""
+    data = Serializer(CONFIG).serialize(STATE)[: HEADER.size - 1]
+
+    with pytest.raises(ValueError, match="Truncated header"):
+        Serializer(CONFIG).deserialize(data)
+
+
+def test_unsupported_version() -> None:
+    """Test if a header with an unknown version is rejected."""
+    data = bytearray(Serializer(CONFIG).serialize(STATE))
+    data[len(MAGIC)] = 0xFF
+
+    with pytest.raises(ValueError, match="Unsupported version"):
+        Serializer(CONFIG).deserialize(bytes(data))
+
+
+def test_unsupported_format() -> None:
+    """Test if a header with an unknown format is rejected."""
+    data = bytearray(Serializer(CONFIG).serialize(STATE))
+    data[len(MAGIC) + 1] = 0xFF
+
+    with pytest.raises(ValueError, match="Unsupported format or compression"):
+        Serializer(CONFIG).deserialize(bytes(data))
@@ -0,0 +1,124 @@
+import json
+import sqlite3
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from pyscheduler.models.data import storage as s
+
+from mantis.services.scheduler.backends.sqlite import SQLiteBackend
+
+
+def test_persist(
+    open_sqlite: Callable[..., SQLiteBackend],
+    build_state: Callable[..., s.State],
+) -> None:
+    """Test if changes and removals are persisted in the database."""
+    backend = open_sqlite()
+    backend.save(build_state("a", "b"))
+    backend.save(build_state("b", "c"))
+    backend.close()
+
+    backend = open_sqlite()
+    assert backend.load() == build_state("b", "c")
+    backend.close()
+
+
+def test_import(
+    tmp_path: Path,
+    open_sqlite: Callable[..., SQLiteBackend],
+    build_state: Callable[..., s.State],
+) -> None:
+    """Test if the state file is imported only when the database is created."""
+    source = tmp_path / "state.json"
+    source.write_text(json.dumps(build_state("a")))
+
+    backend = open_sqlite()
+    assert backend.load() == build_state("a")
+    backend.close()
+
+    source.write_text(json.dumps(build_state("b")))
+
+    backend = open_sqlite()
+    assert backend.load() == build_state("a")
+    backend.close()
+
+
+def test_interrupted_write(
+    monkeypatch: pytest.MonkeyPatch,
+    open_sqlite: Callable[..., SQLiteBackend],
+    build_state: Callable[..., s.State],
+) -> None:
+    """Test if a write interrupted in the middle leaves no partial changes."""
+    backend = open_sqlite()
+    backend.save(build_state("a"))
+
+    def _upsert(*args: object) -> None:
+        message = "Interrupted."
+        raise OSError(message)
+
+    # Removals are already written when upserting fails
+    monkeypatch.setattr(backend, "_upsert", _upsert)
+
+    with pytest.raises(OSError, match="Interrupted"):
+        backend.save(build_state("b"))
+
+    backend.close()
+
+    backend = open_sqlite()
+    assert backend.load() == build_state("a")
+    backend.close()
+
+
+def test_save_changed(
+    open_sqlite: Callable[..., SQLiteBackend],
+    build_state: Callable[..., s.State],
+) -> None:
+    """Test if only changed tasks are written when they are known."""
+    backend = open_sqlite()
+    backend.save(build_state("a", "b"))
+
+    statements: list[str] = []
+    backend.connection.set_trace_callback(statements.append)
+
+    backend.save(build_state("a", "b", "c"), {"c"})
+    backend.save(build_state("b", "c"), {"a"})
+    backend.close()
+
+    # Statements are traced with bound values, so unchanged tasks don't show up
+    assert any("'c'" in statement for statement in statements)
+    assert any("'a'" in statement for statement in statements)
+    assert not any("'b'" in statement for statement in statements)
+
+    backend = open_sqlite()
+    assert backend.load() == build_state("b", "c")
+    backend.close()
+
+
+def test_read_only(
+    tmp_path: Path,
+    open_sqlite: Callable[..., SQLiteBackend],
+    build_state: Callable[..., s.State],
+) -> None:
+    """Test if the state is read without writing anything in read-only mode."""
+    source = tmp_path / "state.json"
+    source.write_text(json.dumps(build_state("a")))
+
+    # The database is not created, so the state is read from the source
+    backend = open_sqlite(read_only=True)
+    assert backend.load() == build_state("a")
+    backend.close()
+
+    assert not (tmp_path / "state.db").exists()
+
+    backend = open_sqlite()
+    backend.save(build_state("b"))
+    backend.close()
+
+    backend = open_sqlite(read_only=True)
+    assert backend.load() == build_state("b")
+
+    with pytest.raises(sqlite3.OperationalError, match="readonly"):
+        backend.save(build_state("c"))
+
+    backend.close()
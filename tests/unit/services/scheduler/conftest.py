@@ -0,0 +1,96 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from pyscheduler.models.data import storage as s
+
+from mantis.config.models import (
+    StoreArchiveConfig,
+    StoreDurability,
+    StoreJournalConfig,
+    StoreSerializerConfig,
+)
+from mantis.services.scheduler.archive.segments import Segments
+from mantis.services.scheduler.backends import records as r
+from mantis.services.scheduler.backends.atomic import AtomicFile
+from mantis.services.scheduler.backends.journal import JournalBackend
+from mantis.services.scheduler.backends.serializer import Serializer
+from mantis.services.scheduler.backends.sqlite import SQLiteBackend
+
+
+@pytest.fixture
+def build_state() -> Callable[..., s.State]:
+    """Build states with cancelled tasks with the given identifiers."""
+
+    def _build(*ids: str) -> s.State:
+        records = {task_id: {"bucket": "cancelled", "task": {}} for task_id in ids}
+        return r.merge(records)
+
+    return _build
+
+
+@pytest.fixture
+def open_file(tmp_path: Path) -> Callable[[], AtomicFile]:
+    """Open the state file like after a restart."""
+
+    def _open() -> AtomicFile:
+        return AtomicFile(
+            path=tmp_path / "state.json",
+            serializer=Serializer(StoreSerializerConfig()),
+        )
+
+    return _open
+
+
+@pytest.fixture
+def open_journal(tmp_path: Path) -> Callable[..., JournalBackend]:
+    """Open the journal backend like after a restart."""
+
+    def _open(records: int = 100, *, read_only: bool = False) -> JournalBackend:
+        backend = JournalBackend(
+            path=tmp_path / "state.json",
+            config=StoreJournalConfig(records=records),
+            durability=StoreDurability.ALWAYS,
+            serializer=Serializer(StoreSerializerConfig()),
+        )
+        backend.open(read_only=read_only)
+
+        return backend
+
+    return _open
+
+
+@pytest.fixture
+def open_sqlite(tmp_path: Path) -> Callable[..., SQLiteBackend]:
+    """Open the SQLite backend like after a restart."""
+
+    def _open(*, read_only: bool = False) -> SQLiteBackend:
+        backend = SQLiteBackend(
+            path=tmp_path / "state.db",
+            source=tmp_path / "state.json",
+            durability=StoreDurability.ALWAYS,
+            serializer=Serializer(StoreSerializerConfig()),
+        )
+        backend.open(read_only=read_only)
+
+        return backend
+
+    return _open
+
+
+@pytest.fixture
+def open_segments(tmp_path: Path) -> Callable[..., Segments]:
+    """Open archive segments like after a restart."""
+
+    def _open(*, read_only: bool = False) -> Segments:
+        # Each flush starts a new segment
+        segments = Segments(
+            config=StoreArchiveConfig(segment=1),
+            durability=StoreDurability.ALWAYS,
+            path=tmp_path / "archive",
+        )
+        segments.open(read_only=read_only)
+
+        return segments
+
+    return _open
@@ -0,0 +1,159 @@
+from uuid import UUID
+
+import pytest
+from pydantic import BaseModel
+from pyscheduler.models.data import storage as s
+
+from mantis.services.scheduler.backends import records as r
+from mantis.services.scheduler.live import LiveTasks
+
+FIRST = UUID(int=1)
+
+SECOND = UUID(int=2)
+
+THIRD = UUID(int=3)
+
+STATUSES = {"running": "running", "completed": "completed"}
+
+
+class Defaults(BaseModel):
+    """Parameters that are valid when empty."""
+
+    value: int = 0
+
+
+class Required(BaseModel):
+    """Parameters that are not valid when empty."""
+
+    value: int
+
+
+def _build_record(task_id: UUID, bucket: str, operation: str) -> r.Record:
+    """Build a record of a task with the given type of operation."""
+    return {
+        "bucket": bucket,
+        "task": {
+            "task": {
+                "id": str(task_id),
+                "operation": {"type": operation, "parameters": {}},
+                "condition": {"type": "now", "parameters": {}},
+                "dependencies": {},
+            }
+        },
+        "status": STATUSES.get(bucket, "pending"),
+    }
+
+
+def _build_state(*records: tuple[UUID, str, str]) -> s.State:
+    """Build a state with tasks in the given buckets and with given operations."""
+    return r.merge(
+        {
+            str(task_id): _build_record(task_id, bucket, operation)
+            for task_id, bucket, operation in records
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_list() -> None:
+    """Test if only unfinished tasks are listed by type of operation."""
+    live = LiveTasks()
+    live.update(
+        _build_state(
+            (FIRST, "queued", "stream"),
+            (SECOND, "running", "test"),
+            (THIRD, "completed", "stream"),
+        )
+    )
+
+    assert await live.list("stream") == {FIRST}
+    assert await live.list("test") == {SECOND}
+    assert await live.list("other") == set()
+
+
+@pytest.mark.asyncio
+async def test_update() -> None:
+    """Test if the index follows changes of the state."""
+    live = LiveTasks()
+    live.update(_build_state((FIRST, "queued", "stream")))
+
+    assert await live.list("stream") == {FIRST}
+
+    live.update(
+        _build_state((FIRST, "completed", "stream"), (SECOND, "waiting", "stream"))
+    )
+
+    assert await live.list("stream") == {SECOND}
+
+
+@pytest.mark.asyncio
+async def test_get() -> None:
+    """Test if unfinished tasks are returned with their data."""
+    live = LiveTasks()
+    live.update(
+        _build_state((FIRST, "queued", "stream"), (SECOND, "running", "stream"))
+    )
+
+    tasks = await live.get("stream")
+
+    assert {task.task.id for task in tasks} == {FIRST, SECOND}
+
+
+@pytest.mark.asyncio
+async def test_validate_cached() -> None:
+    """Test if tasks are validated again only after their status changes."""
+    live = LiveTasks()
+    live.update(_build_state((FIRST, "queued", "stream")))
+
+    [first] = await live.get("stream")
+
+    live.update(_build_state((FIRST, "queued", "stream")))
+
+    [second] = await live.get("stream")
+
+    assert second is first
+
+    live.update(_build_state((FIRST, "running", "stream")))
+
+    [third] = await live.get("stream")
+
+    assert third is not first
+    assert third.status == "running"
+
+
+@pytest.mark.asyncio
+async def test_get_with_parameters() -> None:
+    """Test if parameters are parsed once per model or None if not valid."""
+    live = LiveTasks()
+    live.update(_build_state((FIRST, "queued", "stream")))
+
+    [(task, first)] = await live.get_with_parameters("stream", Defaults)
+    [(_, second)] = await live.get_with_parameters("stream", Defaults)
+    [(_, invalid)] = await live.get_with_parameters("stream", Required)
+
+    assert task.task.id == FIRST
+    assert isinstance(first, Defaults)
+    assert second is first
+    assert invalid is None
+
+
+@pytest.mark.asyncio
+async def test_forget_finished() -> None:
+    """Test if cached tasks and parameters are dropped once tasks finish."""
+    live = LiveTasks()
+    live.update(
+        _build_state((FIRST, "queued", "stream"), (SECOND, "running", "stream"))
+    )
+
+    await live.get_with_parameters("stream", Defaults)
+
+    assert live._tasks.keys() == {str(FIRST), str(SECOND)}
+    assert live._parameters.keys() == {str(FIRST), str(SECOND)}
+
+    live.update(
+        _build_state((FIRST, "completed", "stream"), (SECOND, "running", "stream"))
+    )
+
+    assert await live.list("stream") == {SECOND}
+    assert live._tasks.keys() == {str(SECOND)}
+    assert live._parameters.keys() == {str(SECOND)}
@@ -0,0 +1,52 @@
+from datetime import timedelta
+from pathlib import Path
+from uuid import UUID
+
+from mantis.config.models import Config, StoreConfig
+from mantis.services.scheduler.archive.segments import Segments
+from mantis.services.scheduler.backends import records as r
+from mantis.services.scheduler.backends.factory import BackendFactory
+from mantis.services.scheduler.maintenance import StoreMaintenance
+from mantis.utils.time import naiveutcnow
+
+
+def _build_record(age: timedelta) -> r.Record:
+    """Build a record of a task that completed some time ago."""
+    completed = naiveutcnow() - age
+    return {"bucket": "completed", "task": {"completed": completed.isoformat()}}
+
+
+def test_purge(tmp_path: Path) -> None:
+    """Test if old tasks are purged from both the hot state and the archive."""
+    config = Config(store=StoreConfig(path=tmp_path / "state.json"))
+    old, new = timedelta(days=3), timedelta(hours=1)
+
+    segments = Segments(
+        config=config.store.archive,
+        durability=config.store.durability.level,
+        path=config.store.archive_path,
+    )
+    segments.open()
+    segments.add(
+        {str(UUID(int=1)): _build_record(old), str(UUID(int=2)): _build_record(new)}
+    )
+    segments.flush()
+    segments.close()
+
+    backend = BackendFactory().create(config.store)
+    backend.open()
+    backend.save(
+        r.merge(
+            {
+                str(UUID(int=3)): _build_record(old),
+                str(UUID(int=4)): _build_record(new),
+            }
+        )
+    )
+    backend.close()
+
+    removed = StoreMaintenance(config).purge(timedelta(days=1))
+    assert removed == {UUID(int=1), UUID(int=3)}
+
+    stats = StoreMaintenance(config).stats()
+    assert stats.statuses == {"completed": 2}
@@ -0,0 +1,117 @@
+import asyncio
+from collections.abc import AsyncGenerator, Callable
+from datetime import timedelta
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+import pytest_asyncio
+from pyscheduler.models.data import storage as s
+
+from mantis.config.models import StoreArchiveConfig, StoreConfig
+from mantis.services.scheduler.backends import records as r
+from mantis.services.scheduler.store import Store
+
+
+def _build_finished_state(*ids: UUID) -> s.State:
+    """Build a state with tasks that finished long ago."""
+    task = {"completed": "2000-01-01T00:00:00"}
+    return r.merge(
+        {str(task_id): {"bucket": "completed", "task": task} for task_id in ids}
+    )
+
+
+def _build_config(path: Path) -> StoreConfig:
+    """Build configuration for a store without the archive in a directory."""
+    return StoreConfig(
+        archive=StoreArchiveConfig(enabled=False), path=path / "state.json"
+    )
+
+
+@pytest_asyncio.fixture
+async def store(tmp_path: Path) -> AsyncGenerator[Store]:
+    """Open a store without the archive."""
+    async with Store(_build_config(tmp_path)) as store:
+        yield store
+
+
+@pytest.mark.asyncio
+async def test_tier_interval(tmp_path: Path) -> None:
+    """Test if finished tasks are moved to the archive at most once per interval."""
+    config = StoreConfig(
+        archive=StoreArchiveConfig(interval=timedelta(hours=1)),
+        path=tmp_path / "state.json",
+    )
+
+    async with Store(config) as store:
+        await store.set(_build_finished_state(UUID(int=1)))
+        assert (await store.get())["tasks"]["completed"] == {}
+
+        await store.set(_build_finished_state(UUID(int=2)))
+        assert set((await store.get())["tasks"]["completed"]) == {str(UUID(int=2))}
+
+
+@pytest.mark.asyncio
+async def test_batch(store: Store, build_state: Callable[..., s.State]) -> None:
+    """Test if changes made in a batch are persisted in a single commit."""
+    states = [build_state("a"), build_state("a", "b")]
+
+    async with store.batch():
+        for state in states:
+            await store.set(state)
+
+    metrics = store.metrics
+    assert metrics.commits == 1
+    assert metrics.changes == len(states)
+
+
+@pytest.mark.asyncio
+async def test_batch_held_back(
+    store: Store, build_state: Callable[..., s.State]
+) -> None:
+    """Test if changes made in a batch are held back until the batch ends."""
+    async with store.batch():
+        await store.set(build_state("a"))
+        await asyncio.sleep(0.1)
+
+        assert store.metrics.commits == 0
+
+    assert store.metrics.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_unbatched_not_held_back(
+    store: Store, build_state: Callable[..., s.State]
+) -> None:
+    """Test if changes made outside of batches are not held back by them."""
+    started = asyncio.Event()
+    finished = asyncio.Event()
+
+    async def _batch() -> None:
+        async with store.batch():
+            await store.set(build_state("a"))
+            started.set()
+            await finished.wait()
+
+    task = asyncio.create_task(_batch())
+    await started.wait()
+
+    async with asyncio.timeout(1):
+        await store.set(build_state("a", "b"))
+
+    assert not task.done()
+
+    finished.set()
+    await task
+
+
+@pytest.mark.asyncio
+async def test_reopen(tmp_path: Path, build_state: Callable[..., s.State]) -> None:
+    """Test if the state is loaded after a restart."""
+    config = _build_config(tmp_path)
+
+    async with Store(config) as store, store.batch():
+        await store.set(build_state("a"))
+
+    async with Store(config) as store:
+        assert await store.get() == build_state("a")
@@ -0,0 +1,100 @@
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import pytest
+
+from mantis.config.models import Config, StoreConfig
+from mantis.services.beaver import models as bm
+from mantis.services.beaver.service import BeaverService
+from mantis.services.gecko.service import GeckoService
+from mantis.services.numbat.service import NumbatService
+from mantis.services.octopus.service import OctopusService
+from mantis.services.scheduler.models import enums as e
+from mantis.services.scheduler.models import transfer as t
+from mantis.services.scheduler.operations.operations.stream.models import Parameters
+from mantis.services.scheduler.service import SchedulerService
+from mantis.services.scheduler.store import Store
+from mantis.services.synchronizer.synchronizers.stream import StreamSynchronizer
+
+
+@pytest.fixture
+def config() -> Config:
+    """Build default configuration."""
+    return Config()
+
+
+@pytest.fixture
+def scheduler(tmp_path: Path, config: Config) -> SchedulerService:
+    """Build a scheduler on top of a store that is never opened."""
+    return SchedulerService(
+        config=config,
+        beaver=BeaverService(config=config.beaver),
+        gecko=GeckoService(config=config.gecko),
+        numbat=NumbatService(config=config.numbat),
+        octopus=OctopusService(config=config.octopus),
+        store=Store(StoreConfig(path=tmp_path / "state.json")),
+    )
+
+
+@pytest.fixture
+def build_synchronizer(
+    config: Config, scheduler: SchedulerService
+) -> Callable[..., StreamSynchronizer]:
+    """Build stream synchronizers of the given class."""
+
+    def _build(
+        cls: type[StreamSynchronizer] = StreamSynchronizer,
+    ) -> StreamSynchronizer:
+        return cls(
+            config=config.synchronizer.synchronizers.stream,
+            beaver=BeaverService(config=config.beaver),
+            scheduler=scheduler,
+        )
+
+    return _build
+
+
+@pytest.fixture
+def build_schedule() -> Callable[..., bm.Schedule]:
+    """Build schedules of events with instances starting at the given times."""
+
+    def _build(*starts: datetime, timezone: str = "UTC") -> bm.Schedule:
+        return bm.Schedule(
+            event=bm.Event(
+                id=uuid4(),
+                type=bm.EventType.replay,
+                show_id=uuid4(),
+                timezone=timezone,
+            ),
+            instances=[
+                bm.EventInstance(start=start, end=start + timedelta(hours=1))
+                for start in starts
+            ],
+        )
+
+    return _build
+
+
+@pytest.fixture
+def build_task() -> Callable[[UUID, datetime], tuple[t.GenericTask, Parameters]]:
+    """Build stream tasks for instances of events."""
+
+    def _build(event_id: UUID, start: datetime) -> tuple[t.GenericTask, Parameters]:
+        params = Parameters(id=event_id, start=start)
+        task = t.GenericTask(
+            task=t.Task(
+                id=uuid4(),
+                operation=t.Specification(
+                    type="stream", parameters=params.model_dump(mode="json")
+                ),
+                condition=t.Specification(type="now", parameters={}),
+                dependencies={},
+            ),
+            status=e.Status.PENDING,
+        )
+
+        return task, params
+
+    return _build
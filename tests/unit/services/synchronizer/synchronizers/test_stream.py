@@ -0,0 +1,200 @@
+from collections.abc import Callable, Collection, Sequence
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+
+from benchmarks.synchronization import ScanningStreamSynchronizer
+from mantis.config.models import Config, StreamSynchronizerEventsConfig
+from mantis.services.beaver import models as bm
+from mantis.services.scheduler.models import transfer as t
+from mantis.services.scheduler.operations.operations.stream.models import Parameters
+from mantis.services.synchronizer.synchronizers.stream import StreamSynchronizer
+
+START = datetime(2000, 1, 1, 12)
+
+
+def test_filter_schedules(
+    build_synchronizer: Callable[..., StreamSynchronizer],
+    build_schedule: Callable[..., bm.Schedule],
+) -> None:
+    """Test if instances are filtered by their starts in UTC like by scanning."""
+    schedules = [
+        build_schedule(START, START + timedelta(hours=1)),
+        build_schedule(START - timedelta(hours=1), START + timedelta(hours=3)),
+        build_schedule(START + timedelta(hours=1), timezone="Europe/Warsaw"),
+        build_schedule(START + timedelta(days=1)),
+    ]
+    start, end = START, START + timedelta(hours=2)
+
+    filtered = build_synchronizer()._filter_schedules(schedules, start, end)
+    expected = build_synchronizer(ScanningStreamSynchronizer)._filter_schedules(
+        schedules, start, end
+    )
+
+    assert filtered == expected
+    assert [schedule.event.id for schedule in filtered] == [
+        schedules[0].event.id,
+        schedules[2].event.id,
+    ]
+
+    # Schedules with all instances in the window are kept as they are
+    assert filtered[0] is schedules[0]
+
+
+def test_reconcile(
+    build_synchronizer: Callable[..., StreamSynchronizer],
+    build_schedule: Callable[..., bm.Schedule],
+    build_task: Callable[[UUID, datetime], tuple[t.GenericTask, Parameters]],
+) -> None:
+    """Test if extra and new tasks are found by indexes like by scanning."""
+    first = build_schedule(START, START + timedelta(hours=1))
+    second = build_schedule(START, START + timedelta(hours=2))
+
+    tasks = [
+        # Matches an instance
+        build_task(first.event.id, START),
+        # Doesn't match any instance of the event
+        build_task(first.event.id, START + timedelta(minutes=1)),
+        # Matches an instance of another event
+        build_task(uuid4(), START),
+        # Matches an instance of the other event
+        build_task(second.event.id, START + timedelta(hours=2)),
+    ]
+    schedules = [first, second]
+
+    synchronizer = build_synchronizer()
+    scanning = build_synchronizer(ScanningStreamSynchronizer)
+
+    extra = synchronizer._find_extra_tasks(schedules, tasks)
+    new = synchronizer._find_new_tasks(schedules, tasks)
+
+    assert extra == scanning._find_extra_tasks(schedules, tasks)
+    assert extra == {tasks[1][0].task.id, tasks[2][0].task.id}
+
+    assert new == scanning._find_new_tasks(schedules, tasks)
+    assert new == [
+        (first.event, first.instances[1]),
+        (second.event, second.instances[0]),
+    ]
+
+
+def test_skip_unchanged(
+    build_synchronizer: Callable[..., StreamSynchronizer],
+    build_schedule: Callable[..., bm.Schedule],
+    build_task: Callable[[UUID, datetime], tuple[t.GenericTask, Parameters]],
+) -> None:
+    """Test if only events that changed since they were in sync are reconciled."""
+    synced = build_schedule(START)
+    unsynced = build_schedule(START)
+    changed = build_schedule(START)
+
+    tasks = [build_task(synced.event.id, START), build_task(changed.event.id, START)]
+
+    synchronizer = build_synchronizer()
+    memory = {}
+
+    synchronizer._remember(memory, [synced, unsynced, changed], tasks)
+
+    # Events that needed changes are not remembered until they are in sync
+    assert memory.keys() == {synced.event.id, changed.event.id}
+
+    # A new instance of the event was added in the meantime
+    instance = bm.EventInstance(start=START + timedelta(hours=1), end=START)
+    changed = bm.Schedule(event=changed.event, instances=[*changed.instances, instance])
+    schedules = [synced, unsynced, changed]
+
+    kept, remaining = synchronizer._skip_unchanged(memory, schedules, tasks)
+
+    assert kept == [unsynced, changed]
+    assert remaining == [tasks[1]]
+
+    # Skipped events need no changes, so the result is the same as with scanning
+    scanning = build_synchronizer(ScanningStreamSynchronizer)
+
+    extra = synchronizer._find_extra_tasks(kept, remaining)
+    assert extra == scanning._find_extra_tasks(schedules, tasks)
+
+    new = synchronizer._find_new_tasks(kept, remaining)
+    assert new == scanning._find_new_tasks(schedules, tasks)
+
+
+def test_skip_changed_tasks(
+    build_synchronizer: Callable[..., StreamSynchronizer],
+    build_schedule: Callable[..., bm.Schedule],
+    build_task: Callable[[UUID, datetime], tuple[t.GenericTask, Parameters]],
+) -> None:
+    """Test if events are reconciled again when their tasks change."""
+    schedule = build_schedule(START)
+    tasks = [build_task(schedule.event.id, START)]
+
+    synchronizer = build_synchronizer()
+    memory = {}
+
+    synchronizer._remember(memory, [schedule], tasks)
+
+    # The task was replaced, for example cancelled and scheduled again
+    replaced = [build_task(schedule.event.id, START)]
+
+    kept, remaining = synchronizer._skip_unchanged(memory, [schedule], replaced)
+
+    assert kept == [schedule]
+    assert remaining == replaced
+
+
+def test_forget(
+    build_synchronizer: Callable[..., StreamSynchronizer],
+    build_schedule: Callable[..., bm.Schedule],
+    build_task: Callable[[UUID, datetime], tuple[t.GenericTask, Parameters]],
+) -> None:
+    """Test if events without instances in the window are forgotten."""
+    first = build_schedule(START)
+    second = build_schedule(START)
+    tasks = [build_task(first.event.id, START), build_task(second.event.id, START)]
+
+    synchronizer = build_synchronizer()
+    memory = {}
+
+    synchronizer._remember(memory, [first, second], tasks)
+
+    # Only chosen events are looked at, so others are not forgotten
+    synchronizer._forget(memory, [], {first.event.id})
+    assert memory.keys() == {second.event.id}
+
+    synchronizer._forget(memory, [], None)
+    assert memory == {}
+
+
+@pytest.mark.asyncio
+async def test_get_events(
+    monkeypatch: pytest.MonkeyPatch,
+    config: Config,
+    build_synchronizer: Callable[..., StreamSynchronizer],
+    build_schedule: Callable[..., bm.Schedule],
+) -> None:
+    """Test if only events that are not cached are looked up, in chunks."""
+    config.synchronizer.synchronizers.stream.events = StreamSynchronizerEventsConfig(
+        chunk=2
+    )
+    synchronizer = build_synchronizer()
+
+    events = [build_schedule(START).event for _ in range(5)]
+    chunks: list[set[UUID]] = []
+
+    async def _fetch_events(ids: Collection[UUID]) -> Sequence[bm.Event]:
+        chunks.append(set(ids))
+        return [event for event in events if event.id in ids]
+
+    monkeypatch.setattr(synchronizer, "_fetch_events", _fetch_events)
+
+    synchronizer._events.put(events[:1])
+    found = await synchronizer._get_events([event.id for event in events])
+
+    assert {event.id for event in found} == {event.id for event in events}
+    assert sorted(len(chunk) for chunk in chunks) == [2, 2]
+    assert set().union(*chunks) == {event.id for event in events[1:]}
+
+    # Looked up events are cached
+    chunks.clear()
+    await synchronizer._get_events([event.id for event in events])
+    assert chunks == []
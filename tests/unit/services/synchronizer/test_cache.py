@@ -0,0 +1,89 @@
+from collections.abc import Callable
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+
+from mantis.services.beaver import models as bm
+from mantis.services.synchronizer import cache
+from mantis.services.synchronizer.cache import EventCache
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Callable[[float], None]:
+    """Control the monotonic clock seen by the cache."""
+    now = 0.0
+
+    def _advance(seconds: float) -> None:
+        nonlocal now
+        now = now + seconds
+
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now)
+
+    return _advance
+
+
+def _build_event() -> bm.Event:
+    """Build an event."""
+    return bm.Event(
+        id=uuid4(), type=bm.EventType.replay, show_id=uuid4(), timezone="UTC"
+    )
+
+
+def test_get(clock: Callable[[float], None]) -> None:
+    """Test if cached events are found and others are reported as missing."""
+    events = EventCache(ttl=timedelta(minutes=1))
+    event = _build_event()
+    other = uuid4()
+
+    events.put([event])
+
+    assert events.get([event.id, other]) == ({event.id: event}, {other})
+
+
+def test_expire(clock: Callable[[float], None]) -> None:
+    """Test if events are looked up again after they expire."""
+    events = EventCache(ttl=timedelta(minutes=1))
+    event = _build_event()
+
+    events.put([event])
+    clock(59)
+    assert events.get([event.id]) == ({event.id: event}, set())
+
+    clock(1)
+    assert events.get([event.id]) == ({}, {event.id})
+
+
+def test_put_refresh(clock: Callable[[float], None]) -> None:
+    """Test if putting an event again extends its time in the cache."""
+    events = EventCache(ttl=timedelta(minutes=1))
+    first, second = _build_event(), _build_event()
+
+    events.put([first, second])
+    clock(30)
+    events.put([first])
+    clock(40)
+
+    assert events.get([first.id, second.id]) == ({first.id: first}, {second.id})
+
+
+def test_put_drop_expired(clock: Callable[[float], None]) -> None:
+    """Test if expired events are dropped from the cache when putting new ones."""
+    events = EventCache(ttl=timedelta(minutes=1))
+
+    events.put([_build_event() for _ in range(10)])
+    clock(60)
+    events.put([_build_event()])
+
+    assert len(events._events) == 1
+
+
+def test_invalidate(clock: Callable[[float], None]) -> None:
+    """Test if invalidated events are looked up again."""
+    events = EventCache(ttl=timedelta(minutes=1))
+    event = _build_event()
+
+    events.put([event])
+    events.invalidate([event.id])
+
+    assert events.get([event.id]) == ({}, {event.id})
@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta
+
+import pytest
+from pydantic import ValidationError
+
+from mantis.config.models import SynchronizerCadenceConfig
+from mantis.models.events import synchronization as ev
+from mantis.services.synchronizer import cadence
+from mantis.services.synchronizer.cadence import Cadence
+
+NOW = datetime(2000, 1, 1)
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Freeze the current time seen by the cadence."""
+    monkeypatch.setattr(cadence, "naiveutcnow", lambda: NOW)
+
+
+def _build_config() -> SynchronizerCadenceConfig:
+    """Build configuration with a narrow range of intervals."""
+    return SynchronizerCadenceConfig(
+        ceiling=timedelta(minutes=10),
+        enabled=True,
+        floor=timedelta(seconds=15),
+        imminence=timedelta(hours=1),
+        slow=timedelta(seconds=30),
+    )
+
+
+def _build_report(
+    *,
+    added: int = 0,
+    duration: timedelta = timedelta(seconds=1),
+    error: str | None = None,
+) -> ev.SynchronizationReport:
+    """Build a report of a synchronization."""
+    return ev.SynchronizationReport(
+        kind=ev.SynchronizationKind.FULL,
+        started=NOW,
+        duration=duration,
+        window=None,
+        results={
+            "stream": ev.SynchronizationResult(
+                timings=ev.SynchronizationTimings(
+                    schedules=timedelta(),
+                    tasks=timedelta(),
+                    filtering=timedelta(),
+                    diffing=timedelta(),
+                    applying=timedelta(),
+                ),
+                counts=ev.SynchronizationCounts(added=added, cancelled=0, invalid=0),
+            )
+        },
+        error=error,
+    )
+
+
+def test_config_bounds() -> None:
+    """Test if the floor can't be above the ceiling or non-positive."""
+    with pytest.raises(ValidationError):
+        SynchronizerCadenceConfig(
+            floor=timedelta(minutes=2), ceiling=timedelta(minutes=1)
+        )
+
+    with pytest.raises(ValidationError):
+        SynchronizerCadenceConfig(floor=timedelta())
+
+    config = SynchronizerCadenceConfig(
+        floor=timedelta(minutes=1), ceiling=timedelta(minutes=1)
+    )
+
+    assert config.floor == config.ceiling
+
+
+def test_backoff_jitter(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test if backed off intervals are jittered between half and full."""
+    intervals = Cadence(_build_config())
+    intervals.update(_build_report(error="error"))
+
+    monkeypatch.setattr(cadence.random, "random", lambda: 0.0)
+    assert intervals._backoff(timedelta(minutes=1)) == timedelta(minutes=1)
+
+    monkeypatch.setattr(cadence.random, "random", lambda: 1.0)
+    assert intervals._backoff(timedelta(minutes=1)) == timedelta(minutes=2)
+
+
+def test_backoff_ceiling(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test if backed off intervals never exceed the ceiling."""
+    config = _build_config()
+    intervals = Cadence(config)
+    monkeypatch.setattr(cadence.random, "random", lambda: 1.0)
+
+    for _ in range(100):
+        intervals.update(_build_report(error="error"))
+
+    assert intervals._backoff(timedelta(minutes=1)) == config.ceiling
+    assert intervals.adapt(timedelta(minutes=1), None) == config.ceiling
+
+
+def test_adapt_slow(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test if slow synchronizations are backed off until one is fast again."""
+    intervals = Cadence(_build_config())
+    monkeypatch.setattr(cadence.random, "random", lambda: 1.0)
+
+    intervals.update(_build_report(duration=timedelta(minutes=1)))
+    assert intervals.adapt(timedelta(minutes=1), None) == timedelta(minutes=2)
+
+    intervals.update(_build_report())
+    assert intervals.adapt(timedelta(minutes=1), None) == timedelta(minutes=1)
+
+
+def test_adapt_imminent() -> None:
+    """Test if the floor is used when an instance is about to start."""
+    config = _build_config()
+    intervals = Cadence(config)
+
+    upcoming = NOW + config.imminence
+    assert intervals.adapt(timedelta(minutes=5), upcoming) == config.floor
+
+    upcoming = NOW + config.imminence + timedelta(seconds=1)
+    assert intervals.adapt(timedelta(minutes=5), upcoming) == timedelta(minutes=5)
+
+
+def test_adapt_changes() -> None:
+    """Test if intervals are halved while synchronizations find changes."""
+    intervals = Cadence(_build_config())
+
+    intervals.update(_build_report(added=1))
+    assert intervals.adapt(timedelta(minutes=4), None) == timedelta(minutes=2)
+
+    intervals.update(_build_report())
+    assert intervals.adapt(timedelta(minutes=4), None) == timedelta(minutes=4)
+
+
+def test_adapt_clamp() -> None:
+    """Test if adapted intervals are kept between the floor and the ceiling."""
+    config = _build_config()
+    intervals = Cadence(config)
+
+    assert intervals.adapt(timedelta(seconds=1), None) == config.floor
+    assert intervals.adapt(timedelta(hours=1), None) == config.ceiling
+
+    intervals.update(_build_report(added=1))
+    assert intervals.adapt(timedelta(seconds=20), None) == config.floor
@@ -0,0 +1,168 @@
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+import pytest
+from litestar.channels import ChannelsPlugin
+from litestar.channels.backends.memory import MemoryChannelsBackend
+
+from mantis.config.models import (
+    Config,
+    SynchronizerCadenceConfig,
+    SynchronizerConfig,
+    SynchronizerHorizonConfig,
+)
+from mantis.services.beaver.service import BeaverService
+from mantis.services.scheduler.service import SchedulerService
+from mantis.services.synchronizer import service
+from mantis.services.synchronizer.service import SynchronizerService
+
+REFERENCE = datetime(2000, 1, 1)
+NARROW = timedelta(hours=1)
+WIDE = timedelta(days=1)
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record delays the service sleeps for instead of sleeping."""
+    delays = []
+
+    async def _sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(service.asyncio, "sleep", _sleep)
+
+    return delays
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Callable[[datetime], None]:
+    """Control the current time seen by the service."""
+    now = REFERENCE
+
+    def _set(dt: datetime) -> None:
+        nonlocal now
+        now = dt
+
+    monkeypatch.setattr(service, "naiveutcnow", lambda: now)
+
+    return _set
+
+
+@pytest.fixture
+def build_service(
+    config: Config, scheduler: SchedulerService
+) -> Callable[..., SynchronizerService]:
+    """Build synchronizer services with narrow and wide horizons."""
+
+    def _build(*, cadence: bool = False) -> SynchronizerService:
+        return SynchronizerService(
+            config=SynchronizerConfig(
+                cadence=SynchronizerCadenceConfig(enabled=cadence),
+                horizons=[
+                    SynchronizerHorizonConfig(
+                        window=NARROW, interval=timedelta(minutes=1)
+                    ),
+                    SynchronizerHorizonConfig(
+                        window=WIDE, interval=timedelta(minutes=10)
+                    ),
+                ],
+                reference=REFERENCE,
+            ),
+            beaver=BeaverService(config=config.beaver),
+            scheduler=scheduler,
+            channels=ChannelsPlugin(
+                backend=MemoryChannelsBackend(), channels=["events"]
+            ),
+        )
+
+    return _build
+
+
+@pytest.mark.asyncio
+async def test_wait_narrow(
+    build_service: Callable[..., SynchronizerService],
+    clock: Callable[[datetime], None],
+    sleeps: list[float],
+) -> None:
+    """Test if the narrow horizon is synchronized when only it is due."""
+    synchronizer = build_service()
+    clock(REFERENCE + timedelta(minutes=5, seconds=30))
+
+    window = await synchronizer._wait()
+
+    assert window == NARROW
+    assert sleeps == [30]
+
+
+@pytest.mark.asyncio
+async def test_wait_widest(
+    build_service: Callable[..., SynchronizerService],
+    clock: Callable[[datetime], None],
+    sleeps: list[float],
+) -> None:
+    """Test if only the widest horizon is synchronized when more are due."""
+    synchronizer = build_service()
+    clock(REFERENCE + timedelta(minutes=9, seconds=30))
+
+    window = await synchronizer._wait()
+
+    assert window == WIDE
+    assert sleeps == [30]
+
+
+@pytest.mark.asyncio
+async def test_wait_overdue(
+    build_service: Callable[..., SynchronizerService],
+    clock: Callable[[datetime], None],
+    sleeps: list[float],
+) -> None:
+    """Test if the widest horizon is synchronized right away on a boundary."""
+    synchronizer = build_service()
+    clock(REFERENCE + timedelta(minutes=10))
+
+    window = await synchronizer._wait()
+
+    assert window == WIDE
+    assert sleeps == [0]
+
+
+@pytest.mark.asyncio
+async def test_wait_adapted(
+    build_service: Callable[..., SynchronizerService],
+    clock: Callable[[datetime], None],
+    sleeps: list[float],
+) -> None:
+    """Test if adapted targets are measured from the last synchronizations."""
+    synchronizer = build_service(cadence=True)
+    now = REFERENCE + timedelta(hours=5)
+    clock(now)
+
+    synchronizer._synchronized[WIDE] = now - timedelta(minutes=9, seconds=50)
+    synchronizer._synchronized[NARROW] = now - timedelta(seconds=40)
+
+    assert synchronizer._find_targets(now) == [
+        (now + timedelta(seconds=10), WIDE),
+        (now + timedelta(seconds=20), NARROW),
+    ]
+
+    window = await synchronizer._wait()
+
+    assert window == WIDE
+    assert sleeps == [10]
+
+
+@pytest.mark.asyncio
+async def test_wait_adapted_unsynchronized(
+    build_service: Callable[..., SynchronizerService],
+    clock: Callable[[datetime], None],
+    sleeps: list[float],
+) -> None:
+    """Test if adapted targets are measured from now before synchronizations."""
+    synchronizer = build_service(cadence=True)
+    now = REFERENCE + timedelta(hours=5)
+    clock(now)
+
+    window = await synchronizer._wait()
+
+    assert window == NARROW
+    assert sleeps == [60]
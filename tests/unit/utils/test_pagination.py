@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from mantis.utils.pagination import Page, PageFetcher, Paginator
+
+ITEMS = list(range(25))
+
+
+def _build_fetcher(limit: int, calls: list[tuple[int | None, int]]) -> PageFetcher[int]:
+    """Build a fetcher that returns at most the given number of items per page."""
+
+    async def _fetch(size: int | None, offset: int) -> Page[int]:
+        calls.append((size, offset))
+        size = limit if size is None else min(size, limit)
+        return ITEMS[offset : offset + size], len(ITEMS)
+
+    return _fetch
+
+
+@pytest.mark.asyncio
+async def test_paginate() -> None:
+    """Test if all items are fetched in order with pages of the requested size."""
+    calls: list[tuple[int | None, int]] = []
+
+    items = await Paginator(size=10, concurrency=2).paginate(_build_fetcher(100, calls))
+
+    assert items == ITEMS
+    assert calls == [(10, 0), (10, 10), (10, 20)]
+
+
+@pytest.mark.asyncio
+async def test_paginate_server_size() -> None:
+    """Test if pages follow the size chosen by the server."""
+    calls: list[tuple[int | None, int]] = []
+
+    items = await Paginator(size=None, concurrency=2).paginate(_build_fetcher(7, calls))
+
+    assert items == ITEMS
+    assert calls == [(None, 0), (7, 7), (7, 14), (7, 21)]
+
+
+@pytest.mark.asyncio
+async def test_paginate_single_page() -> None:
+    """Test if no more pages are fetched when the first one has all items."""
+    calls: list[tuple[int | None, int]] = []
+
+    items = await Paginator(size=None, concurrency=2).paginate(
+        _build_fetcher(100, calls)
+    )
+
+    assert items == ITEMS
+    assert calls == [(None, 0)]
+
+
+@pytest.mark.asyncio
+async def test_paginate_concurrency() -> None:
+    """Test if no more pages than allowed are fetched at the same time."""
+    active = 0
+    peak = 0
+
+    async def _fetch(size: int | None, offset: int) -> Page[int]:
+        nonlocal active, peak
+
+        active = active + 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active = active - 1
+
+        return ITEMS[offset : offset + 1], len(ITEMS)
+
+    concurrency = 3
+    items = await Paginator(size=1, concurrency=concurrency).paginate(_fetch)
+
+    assert items == ITEMS
+    assert peak == concurrency
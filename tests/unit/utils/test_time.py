@@ -0,0 +1,66 @@
+import random
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from mantis.utils.time import naiveutcify, naiveutcifyall
+
+
+def _build_series(start: datetime, step: timedelta, count: int) -> list[datetime]:
+    """Build naive datetimes with both folds, in shuffled order."""
+    dts = [start + step * index for index in range(count)]
+    dts = dts + [dt.replace(fold=1) for dt in dts]
+
+    random.Random(0).shuffle(dts)
+
+    return dts
+
+
+@pytest.mark.parametrize(
+    ("timezone", "start"),
+    [
+        # Skipped the whole day of 30 December 2011
+        ("Pacific/Apia", datetime(2011, 12, 26)),
+        # Shifts by half an hour on transitions
+        ("Australia/Lord_Howe", datetime(2021, 4, 1)),
+        ("Australia/Lord_Howe", datetime(2021, 10, 1)),
+        # Gap at 02:00 in spring and overlap at 02:00 in autumn
+        ("Europe/Warsaw", datetime(2021, 3, 25)),
+        ("Europe/Warsaw", datetime(2021, 10, 28)),
+        ("UTC", datetime(2021, 1, 1)),
+    ],
+)
+@pytest.mark.parametrize(
+    "step",
+    [timedelta(minutes=30), timedelta(hours=7), timedelta(days=1)],
+)
+def test_naiveutcifyall(timezone: str, start: datetime, step: timedelta) -> None:
+    """Test if datetimes are converted the same as one by one."""
+    tz = ZoneInfo(timezone)
+    dts = _build_series(start, step, 500)
+
+    assert naiveutcifyall(dts, tz) == [naiveutcify(dt, tz) for dt in dts]
+
+
+@pytest.mark.parametrize(
+    "dt",
+    [
+        # Doesn't exist, as clocks jump from 02:00 to 03:00
+        datetime(2021, 3, 28, 2, 30),
+        # Happens twice, as clocks go back from 03:00 to 02:00
+        datetime(2021, 10, 31, 2, 30),
+        datetime(2021, 10, 31, 2, 30, fold=1),
+    ],
+)
+def test_naiveutcifyall_edges(dt: datetime) -> None:
+    """Test if datetimes at DST transitions are converted like one by one."""
+    tz = ZoneInfo("Europe/Warsaw")
+    dts = [dt - timedelta(hours=1), dt, dt + timedelta(hours=1)]
+
+    assert naiveutcifyall(dts, tz) == [naiveutcify(dt, tz) for dt in dts]
+
+
+def test_naiveutcifyall_empty() -> None:
+    """Test if no datetimes are converted to none."""
+    assert naiveutcifyall([], ZoneInfo("Europe/Warsaw")) == []
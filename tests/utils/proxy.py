@@ -0,0 +1,67 @@
+import asyncio
+import socket
+from types import TracebackType
+from typing import Self
+
+
+class AsyncTCPProxy:
+    """Proxy that forwards TCP connections to a target port on localhost.
+
+    Nothing listens on the port until the proxy is started,
+    so connections to it are refused until then.
+    """
+
+    def __init__(self, target: int) -> None:
+        self._target = target
+        self._port = self._find_port()
+        self._server: asyncio.Server | None = None
+
+    def _find_port(self) -> int:
+        with socket.socket() as sock:
+            sock.bind(("localhost", 0))
+            return sock.getsockname()[1]
+
+    async def _pipe(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while data := await reader.read(2**16):
+                writer.write(data)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        target_reader, target_writer = await asyncio.open_connection(
+            "localhost", self._target
+        )
+
+        await asyncio.gather(
+            self._pipe(reader, target_writer), self._pipe(target_reader, writer)
+        )
+
+    @property
+    def port(self) -> int:
+        """Port the proxy listens on once started."""
+        return self._port
+
+    async def start(self) -> None:
+        """Start forwarding connections."""
+        self._server = await asyncio.start_server(self._handle, "localhost", self._port)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._server is not None:
+            self._server.close()
+            self._server = None
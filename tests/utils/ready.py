@@ -0,0 +1,20 @@
+from litestar.testing import AsyncTestClient
+
+from tests.utils.waiting.conditions import CallableCondition
+from tests.utils.waiting.strategies import TimeoutStrategy
+from tests.utils.waiting.waiter import Waiter
+
+
+async def wait_for_ready(client: AsyncTestClient) -> None:
+    """Wait until the service is ready."""
+
+    async def _check() -> None:
+        response = await client.get("/ready")
+        response.raise_for_status()
+
+    waiter = Waiter(
+        condition=CallableCondition(_check),
+        strategy=TimeoutStrategy(30, interval=0.1),
+    )
+
+    await waiter.wait()